@@ -0,0 +1,362 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Asynchronous access to the SDK for :mod:`asyncio` applications.
+
+The SDK's calls are made on a pool of threads, and their results are
+returned to the event loop as awaitables, so an application doesn't need
+to wrap each call in ``run_in_executor`` itself. Each call raises exactly
+the exceptions the synchronous call would, as it's the synchronous call
+which is run.
+
+This is not asynchronous I/O. Requests are still made by the session,
+with its authentication, retries and caching, and each one occupies a
+thread while it's in flight. The event loop is never blocked, but the
+number of calls in flight is bounded by the size of the pool of threads
+rather than by the loop.
+
+Usage
+-----
+
+Wrap an existing :class:`~openstack.connection.Connection`. The proxies of
+the resulting connection return awaitables, and those returning generators
+can be iterated with ``async for``::
+
+    from openstack import asynchronous
+
+    aconn = asynchronous.AsyncConnection(conn, max_workers=100)
+
+    server = await aconn.compute.get_server(server_id)
+    async for port in aconn.network.ports():
+        print(port.id)
+
+The number of calls in flight at once is limited by ``max_workers``.
+Unless a ``loop`` is given, results are returned to the loop that's
+running when they're awaited, so the connection can be made before the
+loop, e.g., outside of ``asyncio.run``.
+
+This module requires Python 3.4 or later. Since the SDK still supports
+Python versions without ``async`` syntax, nothing here uses it; the
+returned objects implement the awaitable and asynchronous iterator
+protocols directly.
+"""
+
+import asyncio
+import collections
+from concurrent import futures
+import functools
+import itertools
+
+from openstack import proxy
+from openstack import proxy2
+
+try:
+    _StopAsyncIteration = StopAsyncIteration
+except NameError:
+    # Python 3.4 has no asynchronous iteration, so only awaiting is used.
+    _StopAsyncIteration = StopIteration
+
+try:
+    _get_running_loop = asyncio.get_running_loop
+except AttributeError:
+    # Before Python 3.7, get_event_loop returns the running loop when
+    # called from it.
+    _get_running_loop = asyncio.get_event_loop
+
+DEFAULT_MAX_WORKERS = 32
+
+#: The number of items a generator is advanced by in each call made on
+#: the pool of threads while iterating over it asynchronously.
+DEFAULT_BATCH_SIZE = 100
+
+
+def _chunks(iterable, size):
+    """Return an iterator of lists of up to size items from iterable"""
+    iterator = iter(iterable)
+    return iter(lambda: list(itertools.islice(iterator, size)), [])
+
+
+class AsyncResult(object):
+    """The result of a call made on the pool of threads
+
+    It can be awaited for the call's result. When the call returns an
+    iterable, such as the generators returned by the proxies' list methods,
+    it can instead be iterated over with ``async for``.
+
+    As with coroutines, the call isn't made until the result is awaited
+    or iterated over.
+    """
+
+    def __init__(self, session, func, args=(), kwargs=None):
+        self._session = session
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs or {}
+        self._future = None
+
+    def _call(self):
+        return self._func(*self._args, **self._kwargs)
+
+    def _get_future(self):
+        if self._future is None:
+            self._future = self._session._submit(self._call)
+        return self._future
+
+    def __await__(self):
+        return self._get_future().__await__()
+
+    # Python 3.4 awaits with ``yield from``, which uses __iter__.
+    __iter__ = __await__
+
+    def __aiter__(self):
+        def batches():
+            result = self._call()
+            if isinstance(result, (list, tuple)):
+                return iter([list(result)])
+            return _chunks(result, self._session.batch_size)
+
+        return _AsyncIterator(self._session, batches)
+
+
+class _AsyncIterator(object):
+    """Iterate over batches produced on the pool of threads
+
+    ``batches`` is called on the pool of threads to return an iterator of
+    lists of items, each of which is then advanced there in turn.
+    """
+
+    def __init__(self, session, batches):
+        self._session = session
+        self._batches = batches
+        self._iterator = None
+        self._buffer = collections.deque()
+        self._done = False
+
+    def _next_batch(self):
+        if self._iterator is None:
+            self._iterator = self._batches()
+        return next(self._iterator, None)
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        result = asyncio.Future(loop=self._session.loop)
+        if self._buffer:
+            result.set_result(self._buffer.popleft())
+            return result
+        if self._done:
+            result.set_exception(_StopAsyncIteration())
+            return result
+
+        def fill(batch_future):
+            if batch_future.cancelled():
+                result.cancel()
+                return
+            error = batch_future.exception()
+            if error is not None:
+                self._done = True
+                if not result.cancelled():
+                    result.set_exception(error)
+                return
+
+            batch = batch_future.result()
+            if batch is None:
+                self._done = True
+            else:
+                self._buffer.extend(batch)
+
+            if result.cancelled():
+                return
+            if self._buffer:
+                result.set_result(self._buffer.popleft())
+            elif self._done:
+                result.set_exception(_StopAsyncIteration())
+            else:
+                # An empty page; move onto the next one.
+                self._session._submit(self._next_batch).add_done_callback(
+                    fill)
+
+        self._session._submit(self._next_batch).add_done_callback(fill)
+        return result
+
+
+class AsyncSession(object):
+
+    def __init__(self, session, max_workers=DEFAULT_MAX_WORKERS,
+                 executor=None, loop=None, batch_size=DEFAULT_BATCH_SIZE):
+        """Make the requests of a session asynchronously.
+
+        :param session: The session to make requests with.
+        :type session: :class:`~openstack.session.Session`
+        :param int max_workers: The maximum number of requests in flight,
+                                when no ``executor`` is given.
+        :param executor: The executor to make requests on. The default is
+                         a new thread pool of ``max_workers`` threads.
+        :type executor: :class:`concurrent.futures.Executor`
+        :param loop: The event loop that results are returned to. The
+                     default is the loop running when each result is
+                     awaited.
+        :param int batch_size: The number of items of a generator advanced
+                               at once while iterating over it.
+        """
+        self.session = session
+        self._loop = loop
+        self._owns_executor = executor is None
+        self.executor = (executor if executor is not None
+                         else futures.ThreadPoolExecutor(max_workers))
+        self.batch_size = batch_size
+
+    @property
+    def loop(self):
+        """The event loop that results are returned to"""
+        if self._loop is not None:
+            return self._loop
+        return _get_running_loop()
+
+    def _submit(self, func):
+        return self.loop.run_in_executor(self.executor, func)
+
+    def run(self, func, *args, **kwargs):
+        """Make any blocking call on the pool of threads
+
+        :returns: An :class:`AsyncResult` for the call.
+        """
+        return AsyncResult(self, func, args, kwargs)
+
+    def close(self):
+        """Shut down the pool of threads, if this session created it"""
+        if self._owns_executor:
+            self.executor.shutdown(wait=False)
+
+    def request(self, url, method, **kwargs):
+        """Make a request, as :meth:`~openstack.session.Session.request`"""
+        return self.run(self.session.request, url, method, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request(url, "GET", **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request(url, "HEAD", **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request(url, "POST", **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request(url, "PUT", **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self.request(url, "PATCH", **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request(url, "DELETE", **kwargs)
+
+    def create_resource(self, resource, prepend_key=True):
+        """Create a resource, as :meth:`~openstack.resource2.Resource.create`
+        """
+        return self.run(resource.create, self.session,
+                        prepend_key=prepend_key)
+
+    def get_resource(self, resource, requires_id=True):
+        """Get a resource, as :meth:`~openstack.resource2.Resource.get`"""
+        return self.run(resource.get, self.session, requires_id=requires_id)
+
+    def update_resource(self, resource, prepend_key=True, has_body=True):
+        """Update a resource, as :meth:`~openstack.resource2.Resource.update`
+        """
+        return self.run(resource.update, self.session,
+                        prepend_key=prepend_key, has_body=has_body)
+
+    def delete_resource(self, resource):
+        """Delete a resource, as :meth:`~openstack.resource2.Resource.delete`
+        """
+        return self.run(resource.delete, self.session)
+
+    def list_resources(self, resource_type, paginated=False, **params):
+        """List resources, as :meth:`~openstack.resource2.Resource.list`
+
+        Each page is requested on the pool of threads as the previous one
+        is used up.
+
+        :returns: An asynchronous iterator of ``resource_type`` instances.
+        """
+        if not resource_type.allow_list:
+            # Raise the same exception list would, once iterated.
+            return AsyncResult(self, resource_type.list,
+                               (self.session,), params).__aiter__()
+        return _AsyncIterator(self, functools.partial(
+            resource_type._list_pages, self.session, paginated, params))
+
+
+class AsyncProxy(object):
+
+    def __init__(self, proxy, session):
+        """Make the calls of a service proxy asynchronously.
+
+        Every method of the proxy returns an :class:`AsyncResult` instead
+        of its result.
+
+        :param proxy: The proxy to make calls with.
+        :type proxy: :class:`~openstack.proxy2.BaseProxy`
+        :param session: The session which makes the calls.
+        :type session: :class:`AsyncSession`
+        """
+        self._proxy = proxy
+        self._session = session
+
+    def __getattr__(self, name):
+        attr = getattr(self._proxy, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def call(*args, **kwargs):
+            return AsyncResult(self._session, attr, args, kwargs)
+
+        return call
+
+
+class AsyncConnection(object):
+
+    def __init__(self, connection, max_workers=DEFAULT_MAX_WORKERS,
+                 executor=None, loop=None):
+        """Use a connection from asyncio.
+
+        Its proxies, e.g., ``compute``, are :class:`AsyncProxy` objects.
+
+        :param connection: The connection to use.
+        :type connection: :class:`~openstack.connection.Connection`
+        :param int max_workers: The maximum number of calls in flight,
+                                when no ``executor`` is given.
+        :param executor: The executor to make calls on.
+        :type executor: :class:`concurrent.futures.Executor`
+        :param loop: The event loop that results are returned to. The
+                     default is the loop running when each result is
+                     awaited.
+        """
+        self.connection = connection
+        self.session = AsyncSession(connection.session,
+                                    max_workers=max_workers,
+                                    executor=executor, loop=loop)
+
+    def __getattr__(self, name):
+        # Only reached for attributes we haven't wrapped yet.
+        value = getattr(self.connection, name)
+        if isinstance(value, (proxy.BaseProxy, proxy2.BaseProxy)):
+            value = AsyncProxy(value, self.session)
+            setattr(self, name, value)
+        return value
+
+    def close(self):
+        """Shut down the pool of threads, if this connection created it"""
+        self.session.close()
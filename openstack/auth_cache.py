@@ -0,0 +1,175 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+The :class:`~openstack.auth_cache.AuthCache` shares the authentication state
+of keystoneauth identity plugins, i.e., their token and service catalog,
+between processes, so that each new process doesn't have to request its own
+token.
+
+States are stored in files named after a hash of the plugin's credentials,
+readable only by their owner, and are reused until they're about to expire.
+While a process is authenticating it holds a lock on that file, so any
+other processes with the same credentials wait for its token rather than
+requesting their own.
+
+Usage
+-----
+
+Pass a cache to the :class:`~openstack.connection.Connection`::
+
+    from openstack import auth_cache
+    from openstack import connection
+
+    conn = connection.Connection(auth_cache=auth_cache.AuthCache(),
+                                 **auth_args)
+"""
+
+import contextlib
+import hashlib
+import logging
+import os
+import tempfile
+
+try:
+    import fcntl
+except ImportError:
+    # File locking isn't available on Windows, where processes may each
+    # authenticate when they find the cache empty at the same time.
+    fcntl = None
+
+_logger = logging.getLogger(__name__)
+
+#: The number of seconds a cached token must still be valid for to be used.
+DEFAULT_MIN_LIFE = 300
+
+
+def _default_directory():
+    cache_home = os.environ.get("XDG_CACHE_HOME",
+                                os.path.join("~", ".cache"))
+    return os.path.expanduser(os.path.join(cache_home, "openstack", "auth"))
+
+
+class AuthCache(object):
+
+    def __init__(self, directory=None, min_life=DEFAULT_MIN_LIFE):
+        """Create a cache of authentication states backed by files.
+
+        :param str directory: The directory to store states in. The default
+                              is ``openstack/auth`` within
+                              ``$XDG_CACHE_HOME``, or ``~/.cache``.
+        :param int min_life: The number of seconds a cached token must still
+                             be valid for to be used.
+        """
+        self.directory = (directory if directory is not None
+                          else _default_directory())
+        self.min_life = min_life
+
+    def _get_path(self, plugin):
+        get_cache_id = getattr(plugin, "get_cache_id", None)
+        cache_id = get_cache_id() if get_cache_id is not None else None
+        if cache_id is None:
+            return None
+        # The cache id is already a hash of the credentials, but it may
+        # contain characters that can't be used in file names.
+        name = hashlib.sha256(cache_id.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, name)
+
+    def authenticate(self, plugin, session):
+        """Authenticate a plugin, reusing a cached state if possible
+
+        Plugins which don't support caching, i.e., don't have a cache id,
+        are left to authenticate on their own when they're first used.
+
+        :param plugin: The plugin to authenticate.
+        :type plugin: :class:`~keystoneauth1.identity.base.BaseIdentityPlugin`
+        :param session: The session to authenticate with.
+        :type session: :class:`~openstack.session.Session`
+
+        :returns: ``True`` if the state was loaded from the cache.
+        """
+        path = self._get_path(plugin)
+        if path is None:
+            return False
+
+        if self._load(plugin, path):
+            return True
+
+        self._makedirs()
+        with self._locked(path):
+            # Another process may have authenticated while we waited.
+            if self._load(plugin, path):
+                return True
+            plugin.get_access(session)
+            self._store(plugin, path)
+        return False
+
+    def _load(self, plugin, path):
+        try:
+            with open(path) as state_file:
+                state = state_file.read()
+        except (IOError, OSError):
+            return False
+
+        try:
+            plugin.set_auth_state(state)
+        except Exception as e:
+            _logger.debug("Ignoring unreadable auth state %s: %s", path, e)
+            plugin.auth_ref = None
+            return False
+
+        auth_ref = plugin.auth_ref
+        if auth_ref is None or auth_ref.will_expire_soon(self.min_life):
+            plugin.auth_ref = None
+            return False
+        return True
+
+    def _store(self, plugin, path):
+        state = plugin.get_auth_state()
+        if not state:
+            return
+
+        temp_path = None
+        try:
+            # mkstemp creates files that only their owner can read.
+            fd, temp_path = tempfile.mkstemp(dir=self.directory,
+                                             prefix=".auth-")
+            with os.fdopen(fd, "w") as temp_file:
+                temp_file.write(state)
+            getattr(os, "replace", os.rename)(temp_path, path)
+        except (IOError, OSError) as e:
+            _logger.debug("Unable to write auth state %s: %s", path, e)
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _makedirs(self):
+        if not os.path.isdir(self.directory):
+            try:
+                os.makedirs(self.directory, 0o700)
+            except OSError:
+                # Created by another process in the meantime.
+                if not os.path.isdir(self.directory):
+                    raise
+
+    @contextlib.contextmanager
+    def _locked(self, path):
+        if fcntl is None:
+            yield
+            return
+
+        fd = os.open(path + ".lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
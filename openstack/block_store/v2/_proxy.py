@@ -82,6 +82,33 @@ class Proxy(proxy2.BaseProxy):
         self._delete(_snapshot.Snapshot, snapshot,
                      ignore_missing=ignore_missing)
 
+    def delete_snapshots(self, snapshots, concurrency=4, ignore_missing=True,
+                         wait_for_delete=False, interval=2, wait=120):
+        """Delete several snapshots concurrently
+
+        :param snapshots: The values can be the IDs of snapshots or
+                    :class:`~openstack.block_store.v2.snapshot.Snapshot`
+                    instances.
+        :param int concurrency: The maximum number of deletes in flight.
+        :param bool ignore_missing: When set to ``False``
+                    :class:`~openstack.exceptions.ResourceNotFound` will be
+                    reported for each snapshot that does not exist.
+                    When set to ``True``, nonexistent snapshots are
+                    reported as deleted.
+        :param bool wait_for_delete: When set to ``True``, wait for each of
+                    the snapshots to be gone after they've been deleted.
+        :param interval: Number of seconds to wait between checks.
+        :param wait: Maximum number of seconds to wait for each delete.
+
+        :returns: A list of :class:`~openstack.utils.DeleteResult`, one for
+                  each of ``snapshots`` in the same order.
+        """
+        return self._delete_many(_snapshot.Snapshot, snapshots,
+                                 concurrency=concurrency,
+                                 ignore_missing=ignore_missing,
+                                 wait_for_delete=wait_for_delete,
+                                 interval=interval, wait=wait)
+
     def get_type(self, type):
         """Get a single type
 
@@ -187,3 +214,57 @@ class Proxy(proxy2.BaseProxy):
         :returns: ``None``
         """
         self._delete(_volume.Volume, volume, ignore_missing=ignore_missing)
+
+    def delete_volumes(self, volumes, concurrency=4, ignore_missing=True,
+                       wait_for_delete=False, interval=2, wait=120):
+        """Delete several volumes concurrently
+
+        :param volumes: The values can be the IDs of volumes or
+                    :class:`~openstack.block_store.v2.volume.Volume` instances.
+        :param int concurrency: The maximum number of deletes in flight.
+        :param bool ignore_missing: When set to ``False``
+                    :class:`~openstack.exceptions.ResourceNotFound` will be
+                    reported for each volume that does not exist.
+                    When set to ``True``, nonexistent volumes are
+                    reported as deleted.
+        :param bool wait_for_delete: When set to ``True``, wait for each of
+                    the volumes to be gone after they've been deleted.
+        :param interval: Number of seconds to wait between checks.
+        :param wait: Maximum number of seconds to wait for each delete.
+
+        :returns: A list of :class:`~openstack.utils.DeleteResult`, one for
+                  each of ``volumes`` in the same order.
+        """
+        return self._delete_many(_volume.Volume, volumes,
+                                 concurrency=concurrency,
+                                 ignore_missing=ignore_missing,
+                                 wait_for_delete=wait_for_delete,
+                                 interval=interval, wait=wait)
+
+    def wait_for_volumes(self, volumes, status='available',
+                         failures=['error'], interval=2, wait=120, **query):
+        """Wait for several volumes to be in a particular status.
+
+        The volumes are polled together with a single detailed volume
+        list per cycle, rather than a GET for each of them.
+
+        :param volumes: A list of
+                        :class:`~openstack.block_store.v2.volume.Volume`
+                        instances to wait on.
+        :param status: Desired status of the volumes.
+        :param list failures: Statuses that would indicate the transition
+                              failed such as 'error'.
+        :param interval: Number of seconds to wait between checks.
+        :param wait: Maximum number of seconds to wait for each volume,
+                     or a dict of them keyed by volume id.
+        :param kwargs \*\*query: Optional query parameters to narrow the
+                                 list down to the volumes being waited on,
+                                 such as ``name``.
+
+        :returns: A generator of ``(volume, exception)`` pairs, yielded as
+                  each volume reaches the status, fails or times out.
+        """
+        return self.wait_for_statuses(volumes, status, failures=failures,
+                                      interval=interval, wait=wait,
+                                      list_type=_volume.VolumeDetail,
+                                      **query)
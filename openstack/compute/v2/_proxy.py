@@ -344,6 +344,32 @@ class Proxy(proxy2.BaseProxy):
         else:
             self._delete(_server.Server, server, ignore_missing=ignore_missing)
 
+    def delete_servers(self, servers, concurrency=4, ignore_missing=True,
+                       wait_for_delete=False, interval=2, wait=120):
+        """Delete several servers concurrently
+
+        :param servers: The values can be the IDs of servers or
+                    :class:`~openstack.compute.v2.server.Server` instances.
+        :param int concurrency: The maximum number of deletes in flight.
+        :param bool ignore_missing: When set to ``False``
+                    :class:`~openstack.exceptions.ResourceNotFound` will be
+                    reported for each server that does not exist.
+                    When set to ``True``, nonexistent servers are
+                    reported as deleted.
+        :param bool wait_for_delete: When set to ``True``, wait for each of
+                    the servers to be gone after they've been deleted.
+        :param interval: Number of seconds to wait between checks.
+        :param wait: Maximum number of seconds to wait for each delete.
+
+        :returns: A list of :class:`~openstack.utils.DeleteResult`, one for
+                  each of ``servers`` in the same order.
+        """
+        return self._delete_many(_server.Server, servers,
+                                 concurrency=concurrency,
+                                 ignore_missing=ignore_missing,
+                                 wait_for_delete=wait_for_delete,
+                                 interval=interval, wait=wait)
+
     def find_server(self, name_or_id, ignore_missing=True):
         """Find a single server
 
@@ -560,6 +586,34 @@ class Proxy(proxy2.BaseProxy):
         return resource2.wait_for_status(self.session, server, status,
                                          failures, interval, wait)
 
+    def wait_for_servers(self, servers, status='ACTIVE', failures=['ERROR'],
+                         interval=2, wait=120, **query):
+        """Wait for several servers to be in a particular status.
+
+        The servers are polled together with a single detailed server
+        list per cycle, rather than a GET for each of them.
+
+        :param servers: A list of
+                        :class:`~openstack.compute.v2.server.Server`
+                        instances to wait on.
+        :param status: Desired status of the servers.
+        :param list failures: Statuses that would indicate the transition
+                              failed such as 'ERROR'.
+        :param interval: Number of seconds to wait between checks.
+        :param wait: Maximum number of seconds to wait for each server,
+                     or a dict of them keyed by server id.
+        :param kwargs \*\*query: Optional query parameters to narrow the
+                                 list down to the servers being waited on,
+                                 such as ``name``. See :meth:`servers`.
+
+        :returns: A generator of ``(server, exception)`` pairs, yielded as
+                  each server reaches the status, fails or times out.
+        """
+        return self.wait_for_statuses(servers, status, failures=failures,
+                                      interval=interval, wait=wait,
+                                      list_type=_server.ServerDetail,
+                                      **query)
+
     def create_server_interface(self, server, **attrs):
         """Create a new server interface from attributes
 
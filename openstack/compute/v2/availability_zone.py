@@ -22,6 +22,7 @@ class AvailabilityZone(resource2.Resource):
 
     # capabilities
     allow_list = True
+    cache_responses = True
 
     # Properties
     #: name of availability zone
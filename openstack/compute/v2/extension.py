@@ -24,6 +24,7 @@ class Extension(resource2.Resource):
     # capabilities
     allow_get = True
     allow_list = True
+    cache_responses = True
 
     # Properties
     #: A short name by which this extension is also known.
@@ -11,6 +11,7 @@
 # under the License.
 
 from openstack.compute import compute_service
+from openstack import pagination
 from openstack import resource2
 
 
@@ -25,6 +26,8 @@ class Flavor(resource2.Resource):
     allow_get = True
     allow_delete = True
     allow_list = True
+    cache_responses = True
+    pagination = pagination.NextLink("flavors_links")
 
     _query_mapping = resource2.QueryParameters("sort_key", "sort_dir",
                                                min_disk="minDisk",
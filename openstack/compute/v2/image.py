@@ -12,6 +12,7 @@
 
 from openstack.compute import compute_service
 from openstack.compute.v2 import metadata
+from openstack import pagination
 from openstack import resource2
 
 
@@ -25,6 +26,7 @@ class Image(resource2.Resource, metadata.MetadataMixin):
     allow_get = True
     allow_delete = True
     allow_list = True
+    pagination = pagination.NextLink("images_links")
 
     _query_mapping = resource2.QueryParameters("server", "name",
                                                "status", "type",
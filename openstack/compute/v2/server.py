@@ -12,6 +12,7 @@
 
 from openstack.compute import compute_service
 from openstack.compute.v2 import metadata
+from openstack import pagination
 from openstack import resource2
 from openstack import utils
 
@@ -28,6 +29,7 @@ class Server(resource2.Resource, metadata.MetadataMixin):
     allow_update = True
     allow_delete = True
     allow_list = True
+    pagination = pagination.NextLink("servers_links")
 
     _query_mapping = resource2.QueryParameters("image", "flavor", "name",
                                                "status", "host", "all_tenants",
@@ -57,23 +57,28 @@ try to find it and if that fails, you would create it::
         network = conn.network.create_network({"name": "jenkins"})
 
 """
+from concurrent import futures
 import logging
 import sys
+import threading
 
 from keystoneauth1.loading import base as ksa_loader
 import os_client_config
 
 from openstack import exceptions
+from openstack import format
 from openstack import profile as _profile
 from openstack import proxy
 from openstack import proxy2
+from openstack import service_filter
 from openstack import session as _session
 from openstack import utils
 
 _logger = logging.getLogger(__name__)
 
 
-def from_config(cloud_name=None, cloud_config=None, options=None):
+def from_config(cloud_name=None, cloud_config=None, options=None,
+                auth_cache=None, http_session=None):
     """Create a Connection using os-client-config
 
     :param str cloud_name: Use the `cloud_name` configuration details when
@@ -92,14 +97,21 @@ def from_config(cloud_name=None, cloud_config=None, options=None):
                     instance of argparse.Namespace, despite the naming of the
                     the `os_client_config.config.OpenStackConfig.get_one_cloud`
                     argument to which it is passed.
+    :param auth_cache: A cache to share the authentication state with other
+                       processes using the same credentials.
+    :type auth_cache: :class:`~openstack.auth_cache.AuthCache`
+    :param http_session: A :class:`requests.Session` to make requests with,
+                         such as one shared with other connections. If not
+                         provided, the ``pool_maxsize``, ``pool_block`` and
+                         ``max_retries`` cloud config values, if any, are
+                         used to configure one.
 
     :rtype: :class:`~openstack.connection.Connection`
     """
     # TODO(thowe): I proposed that service name defaults to None in OCC
     defaults = {}
     prof = _profile.Profile()
-    services = [service.service_type for service in prof.get_services()]
-    for service in services:
+    for service in prof.service_keys:
         defaults[service + '_service_name'] = None
     # TODO(thowe): default is 2 which turns into v2 which doesn't work
     # this stuff needs to be fixed where we keep version and path separated.
@@ -113,9 +125,8 @@ def from_config(cloud_name=None, cloud_config=None, options=None):
 
     # TODO(mordred) we need to add service_type setting to openstacksdk.
     # Some clouds have type overridden as well as name.
-    services = [service.service_type for service in prof.get_services()]
     for service in cloud_config.get_services():
-        if service in services:
+        if service in prof.service_keys:
             version = cloud_config.get_api_version(service)
             if version:
                 version = str(version)
@@ -131,7 +142,7 @@ def from_config(cloud_name=None, cloud_config=None, options=None):
 
     region = cloud_config.get_region_name(service)
     if region:
-        for service in services:
+        for service in prof.service_keys:
             prof.set_region(service, region)
 
     # Auth
@@ -151,15 +162,28 @@ def from_config(cloud_name=None, cloud_config=None, options=None):
         key = cloud_config.config.get('key')
         auth['cert'] = (cert, key) if key else cert
 
-    return Connection(profile=prof, **auth)
+    # os-client-config hands back values from clouds.yaml as strings.
+    if 'pool_maxsize' in cloud_config.config:
+        auth['pool_maxsize'] = int(cloud_config.config['pool_maxsize'])
+    if 'pool_block' in cloud_config.config:
+        auth['pool_block'] = format.BoolStr.deserialize(
+            cloud_config.config['pool_block'])
+    if 'max_retries' in cloud_config.config:
+        auth['max_retries'] = int(cloud_config.config['max_retries'])
+
+    return Connection(profile=prof, auth_cache=auth_cache,
+                      http_session=http_session, **auth)
 
 
 class Connection(object):
 
     def __init__(self, session=None, authenticator=None, profile=None,
                  verify=True, cert=None, user_agent=None,
-                 auth_plugin="password",
-                 **auth_args):
+                 auth_plugin="password", discovery_cache=None,
+                 auth_cache=None, warm_up=False, http_session=None,
+                 pool_maxsize=None, pool_block=False, max_retries=0,
+                 coalesce_gets=False, response_cache=None, retry_policy=None,
+                 metrics=None, json_codec=None, **auth_args):
         """Create a context for a connection to a cloud provider.
 
         A connection needs a transport and an authenticator.  The user may pass
@@ -202,6 +226,55 @@ class Connection(object):
             HTTP header.
         :param str auth_plugin: The name of authentication plugin to use.
             The default value is ``password``.
+        :param discovery_cache: If a transport is not provided to the
+            connection, this cache will be used by the session it creates
+            to share discovered endpoints across connections and processes.
+        :type discovery_cache:
+            :class:`~openstack.discovery_cache.DiscoveryCache`
+        :param auth_cache: A cache to share the authentication state with
+            other processes using the same credentials. When given, the
+            connection authenticates when it's created, reusing a cached
+            token if there is one which isn't about to expire.
+        :type auth_cache: :class:`~openstack.auth_cache.AuthCache`
+        :param bool warm_up: When set to ``True``, authenticate and resolve
+            the endpoints of all services in the profile up front. See
+            :meth:`warm_up`.
+        :param http_session: If a transport is not provided to the
+            connection, the :class:`requests.Session` its session makes
+            requests with. Passing the same one to several connections lets
+            them share a connection pool. See
+            :func:`~openstack.session.create_http_session`.
+        :param int pool_maxsize: If neither a transport nor an
+            ``http_session`` is provided, the number of connections to keep
+            open to each host. Size this to the number of threads making
+            requests at once to avoid discarding connections.
+        :param bool pool_block: When set to ``True`` along with
+            ``pool_maxsize``, requests wait for a pooled connection rather
+            than opening extra ones.
+        :param int max_retries: The number of times a failed connection is
+            retried by the pool, when configured with ``pool_maxsize``.
+        :param bool coalesce_gets: If a transport is not provided to the
+            connection, whether identical GET requests made concurrently
+            from several threads share one request. See
+            :class:`~openstack.session.Session`.
+        :param response_cache: If a transport is not provided to the
+            connection, a cache of the responses of GET requests for
+            resources which rarely change, used by the session it creates.
+        :type response_cache:
+            :class:`~openstack.response_cache.ResponseCache`
+        :param retry_policy: If a transport is not provided to the
+            connection, the policy by which the session it creates retries
+            requests which failed for transient reasons.
+        :type retry_policy: :class:`~openstack.retry.RetryPolicy`
+        :param metrics: If a transport is not provided to the connection,
+            where the session it creates records the performance of
+            requests. See :meth:`stats`.
+        :type metrics: :class:`~openstack.metrics.Metrics`
+        :param json_codec: If a transport is not provided to the
+            connection, the codec, or the name of one, with which the
+            session it creates encodes and decodes JSON bodies, e.g.,
+            ``"auto"`` for the fastest installed. See
+            :mod:`~openstack.json_codec`.
         :param auth_args: The rest of the parameters provided are assumed to be
             authentication arguments that are used by the authentication
             plugin.
@@ -227,12 +300,26 @@ class Connection(object):
             self.authenticator = self._create_authenticator(authenticator,
                                                             auth_plugin,
                                                             **auth_args)
+            if http_session is None and pool_maxsize is not None:
+                http_session = _session.create_http_session(
+                    pool_maxsize=pool_maxsize, pool_block=pool_block,
+                    max_retries=max_retries)
             self.session = _session.Session(
                 self.profile, auth=self.authenticator, verify=verify,
-                cert=cert, user_agent=user_agent)
+                cert=cert, user_agent=user_agent,
+                discovery_cache=discovery_cache, session=http_session,
+                coalesce_gets=coalesce_gets, response_cache=response_cache,
+                retry_policy=retry_policy, metrics=metrics,
+                json_codec=json_codec)
+
+        if auth_cache is not None:
+            auth_cache.authenticate(self.session.auth, self.session)
 
         self._open()
 
+        if warm_up:
+            self.warm_up()
+
     def _create_authenticator(self, authenticator, auth_plugin, **args):
         if authenticator:
             return authenticator
@@ -248,15 +335,37 @@ class Connection(object):
     def _open(self):
         """Open the connection.
 
-        NOTE(thowe): Have this set up some lazy loader instead.
+        Neither services nor proxies are imported here. Each proxy is
+        loaded the first time its attribute, e.g. ``compute``, is accessed.
         """
-        for service in self.profile.get_services():
-            self._load(service)
+        self._load_lock = threading.Lock()
+        self._unloaded = dict(
+            (self.profile._get_service_module(service_type), service_type)
+            for service_type in self.profile.service_keys)
+
+    def __getattr__(self, name):
+        # This is only reached when normal lookup fails, which is the case
+        # for proxies until they're loaded by _load.
+        unloaded = self.__dict__.get("_unloaded", {})
+        if name in unloaded:
+            with self._load_lock:
+                # Another thread may have loaded it while this one waited.
+                if name in unloaded:
+                    self._load(unloaded[name])
+                    # Only forget it once it's set, so that other threads
+                    # either find the proxy or wait for it.
+                    del unloaded[name]
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            raise AttributeError(name)
 
-    def _load(self, service):
-        attr_name = service.get_service_module()
-        module = service.get_module() + "._proxy"
+    def _load(self, service_type):
+        module = service_type
         try:
+            service = self.profile._get_filter(service_type)
+            attr_name = service.get_service_module()
+            module = service.get_module() + "._proxy"
             __import__(module)
             proxy_class = getattr(sys.modules[module], "Proxy")
             if not (issubclass(proxy_class, proxy.BaseProxy) or
@@ -284,3 +393,71 @@ class Connection(object):
         headers = self.session.get_auth_headers()
 
         return headers.get('X-Auth-Token') if headers else None
+
+    def warm_up(self, services=None, concurrency=8):
+        """Resolve service endpoints ahead of their first use
+
+        Endpoint discovery normally happens the first time each service is
+        called, adding its requests to that call. This authenticates once
+        and then discovers the endpoints of the given services concurrently,
+        so that later calls find them in the session's endpoint cache.
+
+        Services which can't be resolved, such as those missing from the
+        service catalog, are logged and skipped.
+
+        :param services: The service types to resolve, such as
+                         ``["compute", "network"]``. The default is all
+                         of the services in the profile.
+        :param int concurrency: The maximum number of services resolved
+                                at once.
+
+        :returns: A dict of the resolved endpoints keyed by service type.
+        :raises:`~openstack.exceptions.HttpException` if the authorization
+                fails.
+        """
+        self.authorize()
+
+        if services is None:
+            services = [service.service_type
+                        for service in self.profile.get_services()]
+        services = list(services)
+        if not services:
+            return {}
+
+        def resolve(service_type):
+            # Resources make their requests with a public interface
+            # filter, so resolve the same session.endpoint_cache keys.
+            return self.session.get_endpoint(
+                interface=service_filter.ServiceFilter.PUBLIC,
+                service_type=service_type)
+
+        endpoints = {}
+        executor = futures.ThreadPoolExecutor(
+            max_workers=max(1, min(concurrency, len(services))))
+        try:
+            pending = dict((executor.submit(resolve, service_type),
+                            service_type) for service_type in services)
+            for future in futures.as_completed(pending):
+                service_type = pending[future]
+                try:
+                    endpoints[service_type] = future.result()
+                except Exception as e:
+                    _logger.debug("Unable to resolve %s endpoint: %s",
+                                  service_type, e)
+        finally:
+            executor.shutdown(wait=True)
+
+        return endpoints
+
+    def stats(self):
+        """Return the performance recorded for the requests made so far
+
+        :returns: A list of dicts, one per service type, HTTP method,
+                  resource and proxy method, as returned by
+                  :meth:`~openstack.metrics.Metrics.snapshot`, or ``None``
+                  if the session doesn't record metrics.
+        """
+        metrics = getattr(self.session, "metrics", None)
+        if metrics is None:
+            return None
+        return metrics.snapshot()
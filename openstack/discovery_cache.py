@@ -0,0 +1,132 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+The :class:`~openstack.discovery_cache.DiscoveryCache` keeps the results of
+endpoint discovery in a file, so that they can be reused by later processes
+rather than being discovered again by each new
+:class:`~openstack.session.Session`.
+
+Each entry expires after a time to live. The file is only ever replaced
+atomically, so several processes may share the same cache; when two of them
+write at once, one of their new entries may be lost and is simply
+discovered again.
+
+Usage
+-----
+
+Pass a cache to the :class:`~openstack.connection.Connection`::
+
+    from openstack import connection
+    from openstack import discovery_cache
+
+    cache = discovery_cache.DiscoveryCache(ttl=3600)
+    conn = connection.Connection(discovery_cache=cache, **auth_args)
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 3600
+
+
+def _default_path():
+    cache_home = os.environ.get("XDG_CACHE_HOME",
+                                os.path.join("~", ".cache"))
+    return os.path.expanduser(
+        os.path.join(cache_home, "openstack", "discovery.json"))
+
+
+class DiscoveryCache(object):
+
+    def __init__(self, path=None, ttl=DEFAULT_TTL):
+        """Create a cache of discovered endpoints backed by a file.
+
+        :param str path: The file to store the cache in. The default is
+                         ``openstack/discovery.json`` within
+                         ``$XDG_CACHE_HOME``, or ``~/.cache``.
+        :param int ttl: The number of seconds each entry is kept for.
+        """
+        self.path = path if path is not None else _default_path()
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(key):
+        # JSON objects only have string keys.
+        return json.dumps(list(key))
+
+    def get(self, key):
+        """Return the value stored for a key
+
+        :param tuple key: The values identifying the entry.
+
+        :return: The value, or ``None`` if there is no entry for the key
+                 or it has expired.
+        """
+        entry = self._read().get(self._key(key))
+        if entry is None or entry["expires"] <= time.time():
+            return None
+        return entry["value"]
+
+    def set(self, key, value):
+        """Store a value for a key
+
+        Failing to write the file is logged and otherwise ignored, since
+        the value can always be discovered again.
+
+        :param tuple key: The values identifying the entry.
+        :param value: A value which can be serialized as JSON.
+        """
+        with self._lock:
+            now = time.time()
+            # Re-read the file so that entries written by other processes
+            # since we last looked at it are kept, and drop expired ones
+            # while it's being rewritten anyway.
+            entries = dict((k, entry) for k, entry in self._read().items()
+                           if entry["expires"] > now)
+            entries[self._key(key)] = {"expires": now + self.ttl,
+                                       "value": value}
+            self._write(entries)
+
+    def _read(self):
+        try:
+            with open(self.path) as cache_file:
+                entries = json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def _write(self, entries):
+        directory = os.path.dirname(self.path)
+        temp_path = None
+        try:
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory)
+            fd, temp_path = tempfile.mkstemp(dir=directory or None,
+                                             prefix=".discovery-")
+            with os.fdopen(fd, "w") as temp_file:
+                json.dump(entries, temp_file)
+            # Readers see either the old file or the new one, never a
+            # partially written one.
+            getattr(os, "replace", os.rename)(temp_path, self.path)
+        except (IOError, OSError) as e:
+            _logger.debug("Unable to write discovery cache %s: %s",
+                          self.path, e)
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
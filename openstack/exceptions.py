@@ -108,3 +108,12 @@ class ResourceTimeout(SDKException):
 class ResourceFailure(SDKException):
     """General resource failure."""
     pass
+
+
+class ParallelListFailure(SDKException):
+    """Listing one or more parts of a parallel listing failed."""
+
+    def __init__(self, message=None, failures=None):
+        super(ParallelListFailure, self).__init__(message)
+        #: A list of (shard, exception) pairs for each part that failed.
+        self.failures = failures or []
@@ -448,6 +448,25 @@ class Proxy(proxy.BaseProxy):
         """
         self._delete(_project.Project, project, ignore_missing=ignore_missing)
 
+    def delete_projects(self, projects, concurrency=4, ignore_missing=True):
+        """Delete several projects concurrently
+
+        :param projects: The values can be the IDs of projects or
+                    :class:`~openstack.identity.v3.project.Project` instances.
+        :param int concurrency: The maximum number of deletes in flight.
+        :param bool ignore_missing: When set to ``False``
+                    :class:`~openstack.exceptions.ResourceNotFound` will be
+                    reported for each project that does not exist.
+                    When set to ``True``, nonexistent projects are
+                    reported as deleted.
+
+        :returns: A list of :class:`~openstack.utils.DeleteResult`, one for
+                  each of ``projects`` in the same order.
+        """
+        return self._delete_many(_project.Project, projects,
+                                 concurrency=concurrency,
+                                 ignore_missing=ignore_missing)
+
     def find_project(self, name_or_id, ignore_missing=True):
         """Find a single project
 
@@ -604,6 +623,25 @@ class Proxy(proxy.BaseProxy):
         """
         self._delete(_user.User, user, ignore_missing=ignore_missing)
 
+    def delete_users(self, users, concurrency=4, ignore_missing=True):
+        """Delete several users concurrently
+
+        :param users: The values can be the IDs of users or
+                    :class:`~openstack.identity.v3.user.User` instances.
+        :param int concurrency: The maximum number of deletes in flight.
+        :param bool ignore_missing: When set to ``False``
+                    :class:`~openstack.exceptions.ResourceNotFound` will be
+                    reported for each user that does not exist.
+                    When set to ``True``, nonexistent users are
+                    reported as deleted.
+
+        :returns: A list of :class:`~openstack.utils.DeleteResult`, one for
+                  each of ``users`` in the same order.
+        """
+        return self._delete_many(_user.User, users,
+                                 concurrency=concurrency,
+                                 ignore_missing=ignore_missing)
+
     def find_user(self, name_or_id, ignore_missing=True):
         """Find a single user
 
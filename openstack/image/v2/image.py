@@ -15,6 +15,7 @@ import logging
 
 from openstack import exceptions
 from openstack.image import image_service
+from openstack import pagination
 from openstack import resource2
 from openstack import utils
 
@@ -33,6 +34,7 @@ class Image(resource2.Resource):
     allow_delete = True
     allow_list = True
     patch_update = True
+    pagination = pagination.NextLink("next")
 
     _query_mapping = resource2.QueryParameters("name", "visibility",
                                                "member_status", "owner",
@@ -0,0 +1,317 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+A :class:`~openstack.json_codec.JSONCodec` encodes the JSON bodies of the
+requests a :class:`~openstack.session.Session` makes and decodes those of
+its responses, with a faster library than the standard :mod:`json` module
+when one is installed.
+
+Decoding large listings, e.g., of thousands of ports, is where most of the
+time spent by the SDK itself goes, and `orjson`_ in particular decodes them
+faster. The libraries are tried in the order of
+:data:`CODECS`, and the standard :mod:`json` module is used when none is
+installed.
+
+A session with a codec decodes every response with it, including when
+resources call ``response.json()``. Bodies it can't encode, e.g., because
+they contain types only the standard module's encoder supports, are
+encoded as they would have been without a codec.
+
+Streaming
+---------
+
+:func:`~openstack.json_codec.stream` parses the items of a list response
+as its body is received, yielding each as soon as it's complete, so that
+only one item, rather than the whole body, is held at a time. Resources
+are listed this way with ``stream=True``::
+
+    for obj in conn.object_store.objects(container, stream=True):
+        ...
+
+.. _orjson: https://pypi.org/project/orjson/
+.. _ujson: https://pypi.org/project/ujson/
+
+Usage
+-----
+
+Pass ``"auto"`` to the :class:`~openstack.connection.Connection` to use
+the fastest codec installed, or the name of one to use it::
+
+    from openstack import connection
+
+    conn = connection.Connection(json_codec="auto", **auth_args)
+    conn = connection.Connection(json_codec="ujson", **auth_args)
+"""
+
+import codecs
+import functools
+import importlib
+import json
+import re
+
+import six
+
+from openstack import exceptions
+
+#: The names of the codecs, fastest first.
+CODECS = ("orjson", "ujson", "simplejson", "json")
+
+AUTO = "auto"
+
+_UTF8 = frozenset(["utf-8", "utf8"])
+
+#: The number of bytes read from a streamed response at a time.
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER = frozenset(u"0123456789.eE+-")
+
+
+class JSONCodec(object):
+
+    def __init__(self, name, loads, dumps):
+        """Encode and decode JSON with a library
+
+        :param str name: The name of the library.
+        :param loads: A callable decoding a JSON document, given as bytes.
+        :param dumps: A callable encoding an object as a JSON document,
+                      returned as bytes or text.
+        """
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+    def __repr__(self):
+        return "JSONCodec(%r)" % self.name
+
+    def decode(self, response):
+        """Decode the JSON body of a response
+
+        :param response: The response.
+        :type response: :class:`requests.Response`
+        """
+        encoding = response.encoding
+        if encoding is not None and encoding.lower() not in _UTF8:
+            # JSON is almost always UTF-8; leave anything else to requests.
+            return type(response).json(response)
+        return self.loads(response.content)
+
+    def attach(self, response):
+        """Make ``response.json()`` decode the response with this codec"""
+        response.json = functools.partial(self.decode, response)
+        return response
+
+
+def _load(name):
+    """Return the codec of a library, or ``None`` if it isn't installed"""
+    if name not in CODECS:
+        raise exceptions.SDKException(
+            "Unknown JSON codec %s, expected one of %s" %
+            (name, ", ".join(CODECS)))
+    try:
+        module = importlib.import_module(name)
+    except ImportError:
+        return None
+
+    loads = module.loads
+    if name == "json" and six.PY3:
+        loads = _text_loads
+    return JSONCodec(name, loads, module.dumps)
+
+
+def _text_loads(data):
+    """Decode JSON text or UTF-8 bytes with the standard module
+
+    Before Python 3.6, :func:`json.loads` only decodes text.
+    """
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def get_codec(name=AUTO):
+    """Return a codec
+
+    :param str name: The name of a codec in :data:`CODECS`, or ``"auto"``
+                     for the first of them which is installed.
+
+    :returns: A :class:`JSONCodec`.
+    :raises: :class:`~openstack.exceptions.SDKException` if the codec is
+             unknown or its library isn't installed.
+    """
+    if name == AUTO:
+        for candidate in CODECS:
+            codec = _load(candidate)
+            if codec is not None:
+                return codec
+
+    codec = _load(name)
+    if codec is None:
+        raise exceptions.SDKException(
+            "JSON codec %s is not installed" % name)
+    return codec
+
+
+class _Reader(object):
+    """Decode the JSON values of a document received in chunks
+
+    Only what follows the cursor, ``pos``, is kept as more is received.
+    """
+
+    _decoder = json.JSONDecoder()
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self.buf = u""
+        self.pos = 0
+        self.done = False
+
+    def _more(self):
+        if self.done:
+            return False
+        for chunk in self._chunks:
+            text = self._text.decode(chunk)
+            if text:
+                self.buf = self.buf[self.pos:] + text
+                self.pos = 0
+                return True
+        self.done = True
+        self.buf = self.buf[self.pos:] + self._text.decode(b"", True)
+        self.pos = 0
+        return True
+
+    def drain(self):
+        for _ in self._chunks:
+            pass
+
+    def peek(self):
+        """Skip whitespace, returning the next character, or "" at the end"""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._more():
+                return u""
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError("Expected %r but found %r" % (char, found))
+        self.pos += 1
+
+    def read(self):
+        """Decode the next value"""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buf, self.pos)
+            except ValueError:
+                # The value may not have been completely received yet.
+                if not self._more():
+                    raise
+                continue
+            # A number may continue in what hasn't been received yet,
+            # e.g., "1" may be the start of "1.5".
+            if ((end == len(self.buf) or self.buf[end] in _NUMBER)
+                    and self._more()):
+                continue
+            self.pos = end
+            return value
+
+
+def iter_array(chunks, key=None, members=None):
+    """Decode the items of a JSON array as the document is received
+
+    Each item is decoded as soon as it's complete, and only it and what
+    has been received since are held at a time.
+
+    :param chunks: An iterable of the bytes of the document, encoded as
+                   UTF-8.
+    :param str key: The key of the array in the top-level object, or
+                    ``None`` if the document is the array itself.
+    :param dict members: When given, the other members of the top-level
+                         object, e.g., links to other pages, are added to
+                         it once the document has been read.
+
+    :returns: A generator of the items.
+    :raises: ``KeyError`` if there's no ``key``, and ``ValueError`` if the
+             document isn't valid JSON.
+    """
+    reader = _Reader(chunks)
+
+    if key is not None:
+        reader.expect(u"{")
+        while True:
+            if reader.peek() == u"}":
+                raise KeyError(key)
+            name = reader.read()
+            reader.expect(u":")
+            if name == key:
+                break
+            value = reader.read()
+            if members is not None:
+                members[name] = value
+            if reader.peek() == u",":
+                reader.pos += 1
+
+    if reader.peek() == u"n" and reader.read() is None:
+        _read_rest(reader, key, members)
+        return
+    reader.expect(u"[")
+    if reader.peek() == u"]":
+        reader.pos += 1
+        _read_rest(reader, key, members)
+        return
+    while True:
+        yield reader.read()
+        found = reader.peek()
+        reader.pos += 1
+        if found == u"]":
+            break
+        if found != u",":
+            raise ValueError("Expected ',' or ']' but found %r" % found)
+    _read_rest(reader, key, members)
+
+
+def _read_rest(reader, key, members):
+    """Read what follows the array, so the connection can be reused"""
+    if key is not None and members is not None:
+        while reader.peek() == u",":
+            reader.pos += 1
+            name = reader.read()
+            reader.expect(u":")
+            members[name] = reader.read()
+    reader.drain()
+
+
+def stream(response, key=None, chunk_size=CHUNK_SIZE, members=None):
+    """Decode the items of a list response as its body is received
+
+    :param response: A response requested with ``stream=True``.
+    :type response: :class:`requests.Response`
+    :param str key: The key of the list in the response's body, e.g.,
+                    ``"ports"``, or ``None`` if the body is the list.
+    :param int chunk_size: The number of bytes read at a time.
+    :param dict members: When given, the other members of the response's
+                         body are added to it once it has been read.
+
+    :returns: A generator of the items. The response is closed once it's
+              exhausted or closed.
+    """
+    try:
+        for item in iter_array(response.iter_content(chunk_size), key,
+                               members):
+            yield item
+    finally:
+        response.close()
@@ -0,0 +1,347 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+:class:`~openstack.metrics.Metrics` records the performance of the requests
+made by a :class:`~openstack.session.Session`.
+
+Requests are grouped by service type, HTTP method, and, for requests made
+through a proxy, the resource class and the proxy method which made them,
+e.g., ``compute``, ``GET``, ``Server`` and ``servers``. For each group it
+records
+
+* histograms of the total time taken by calls, including any retries, and
+  of the time until the response's headers were received, which is the
+  closest to the time to first byte that :mod:`requests` exposes; DNS and
+  connection times aren't exposed, so aren't recorded;
+* the numbers of request and response body bytes;
+* the numbers of responses with each status;
+* the numbers of retries, of GET requests coalesced with identical ones in
+  flight, and of responses served from the response cache.
+
+Nothing is recorded unless the session is given a
+:class:`~openstack.metrics.Metrics`.
+
+Usage
+-----
+
+Pass metrics to the :class:`~openstack.connection.Connection`, and read
+them with :meth:`~openstack.connection.Connection.stats`::
+
+    from openstack import connection
+    from openstack import metrics
+
+    conn = connection.Connection(metrics=metrics.Metrics(), **auth_args)
+    ...
+    print(conn.stats())
+    print(conn.session.metrics.to_prometheus())
+
+An ``exporter`` callable can be given to receive each call as it
+completes, e.g., to forward it to StatsD.
+"""
+
+import bisect
+import datetime
+import functools
+import inspect
+import logging
+import sys
+import threading
+import time
+
+import six
+
+_logger = logging.getLogger(__name__)
+
+#: The upper bounds, in seconds, of the buckets of latency histograms.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+                   10.0, 30.0, 60.0)
+
+LABELS = ("service_type", "method", "resource", "operation")
+
+_now = getattr(time, "perf_counter", time.time)
+
+_context = threading.local()
+
+
+def _caller_name(depth):
+    try:
+        return sys._getframe(depth + 1).f_code.co_name
+    except (AttributeError, ValueError):
+        return ""
+
+
+def _labelled_generator(generator, labels):
+    """Yield from a generator with labels set while it's advanced"""
+    while True:
+        previous = getattr(_context, "labels", None)
+        _context.labels = previous or labels
+        try:
+            item = next(generator)
+        except StopIteration:
+            return
+        finally:
+            _context.labels = previous
+        yield item
+
+
+def proxy_operation(method):
+    """Label the requests a proxy helper makes, when metrics are recorded
+
+    The requests are labelled with the resource type passed to the helper,
+    and the name of the proxy method calling it, unless they're already
+    labelled by an outer proxy method.
+    """
+    @functools.wraps(method)
+    def wrapper(self, resource_type, *args, **kwargs):
+        if getattr(self.session, "metrics", None) is None:
+            return method(self, resource_type, *args, **kwargs)
+
+        previous = getattr(_context, "labels", None)
+        labels = previous or (getattr(resource_type, "__name__", ""),
+                              _caller_name(1))
+        _context.labels = labels
+        try:
+            result = method(self, resource_type, *args, **kwargs)
+        finally:
+            _context.labels = previous
+        if inspect.isgenerator(result):
+            return _labelled_generator(result, labels)
+        return result
+
+    return wrapper
+
+
+class _Histogram(object):
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def to_dict(self):
+        cumulative = []
+        total = 0
+        for count in self.counts[:-1]:
+            total += count
+            cumulative.append(total)
+        return {"buckets": dict(zip(self.buckets, cumulative)),
+                "sum": self.sum, "count": self.count}
+
+
+class _Series(object):
+    """What is recorded for one group of requests"""
+
+    def __init__(self, buckets):
+        self.duration = _Histogram(buckets)
+        self.ttfb = _Histogram(buckets)
+        self.statuses = {}
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.retries = 0
+        self.coalesced = 0
+        self.cache_hits = 0
+
+    def to_dict(self):
+        return {"duration": self.duration.to_dict(),
+                "ttfb": self.ttfb.to_dict(),
+                "statuses": dict(self.statuses),
+                "request_bytes": self.request_bytes,
+                "response_bytes": self.response_bytes,
+                "retries": self.retries,
+                "coalesced": self.coalesced,
+                "cache_hits": self.cache_hits}
+
+
+class Call(object):
+    """A call being recorded, i.e., a request and any retries"""
+
+    def __init__(self, metrics, labels):
+        self.metrics = metrics
+        self.labels = labels
+        self.started = _now()
+        self.events = {"retries": 0, "coalesced": 0, "cache_hits": 0}
+        self.ttfb = None
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def count(self, event):
+        """Count an event, e.g., ``retries``, during the call"""
+        self.events[event] += 1
+
+    def add_response(self, response):
+        """Record the sizes and time to first byte of a response"""
+        request = getattr(response, "request", None)
+        body = getattr(request, "body", None)
+        if isinstance(body, (bytes, six.text_type)):
+            self.request_bytes += len(body)
+        elapsed = getattr(response, "elapsed", None)
+        if isinstance(elapsed, datetime.timedelta):
+            self.ttfb = elapsed.total_seconds()
+        headers = getattr(response, "headers", None) or {}
+        length = headers.get("Content-Length")
+        content = getattr(response, "_content", None)
+        if isinstance(length, six.string_types) and length.isdigit():
+            self.response_bytes += int(length)
+        elif isinstance(content, bytes):
+            # The body was already read, i.e., it isn't being streamed.
+            self.response_bytes += len(content)
+
+    def finish(self, status):
+        """Record the call as completed with a status"""
+        self.metrics._record(self, status, _now() - self.started)
+
+
+class Metrics(object):
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, exporter=None):
+        """Record the performance of requests.
+
+        :param buckets: The upper bounds of the buckets of the latency
+                        histograms, in seconds.
+        :param exporter: A callable called with a dict describing each call
+                         once it completes: its labels, ``status``,
+                         ``duration``, ``ttfb``, ``request_bytes``,
+                         ``response_bytes``, ``retries``, ``coalesced`` and
+                         ``cache_hits``. Exceptions it raises are logged.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.exporter = exporter
+        self._lock = threading.Lock()
+        self._series = {}
+
+    def start(self, service_type, method):
+        """Start recording a call
+
+        :returns: A :class:`Call`, to :meth:`~Call.finish` once the call
+                  has completed.
+        """
+        resource, operation = getattr(_context, "labels", None) or ("", "")
+        return Call(self, (service_type or "", method.upper(), resource,
+                           operation))
+
+    def _record(self, call, status, duration):
+        status = str(status)
+        with self._lock:
+            series = self._series.get(call.labels)
+            if series is None:
+                series = self._series[call.labels] = _Series(self.buckets)
+            series.duration.observe(duration)
+            if call.ttfb is not None:
+                series.ttfb.observe(call.ttfb)
+            series.statuses[status] = series.statuses.get(status, 0) + 1
+            series.request_bytes += call.request_bytes
+            series.response_bytes += call.response_bytes
+            series.retries += call.events["retries"]
+            series.coalesced += call.events["coalesced"]
+            series.cache_hits += call.events["cache_hits"]
+
+        if self.exporter is not None:
+            record = dict(zip(LABELS, call.labels))
+            record.update(call.events)
+            record.update(status=status, duration=duration, ttfb=call.ttfb,
+                          request_bytes=call.request_bytes,
+                          response_bytes=call.response_bytes)
+            try:
+                self.exporter(record)
+            except Exception as e:
+                _logger.debug("Metrics exporter failed: %s", e)
+
+    def snapshot(self):
+        """Return what has been recorded so far
+
+        :returns: A list of dicts, one per group of requests, with their
+                  labels and what was recorded for them.
+        """
+        with self._lock:
+            items = sorted(self._series.items())
+            snapshot = []
+            for labels, series in items:
+                entry = dict(zip(LABELS, labels))
+                entry.update(series.to_dict())
+                snapshot.append(entry)
+            return snapshot
+
+    def reset(self):
+        """Forget everything recorded so far"""
+        with self._lock:
+            self._series.clear()
+
+    def to_prometheus(self, prefix="openstack_sdk"):
+        """Return what has been recorded in Prometheus' text format"""
+        lines = []
+
+        def header(name, kind, text):
+            lines.append("# HELP %s_%s %s" % (prefix, name, text))
+            lines.append("# TYPE %s_%s %s" % (prefix, name, kind))
+
+        snapshot = self.snapshot()
+
+        for name, key, text in (
+                ("request_duration_seconds", "duration",
+                 "Time taken by calls, including retries."),
+                ("time_to_first_byte_seconds", "ttfb",
+                 "Time until response headers were received.")):
+            header(name, "histogram", text)
+            for entry in snapshot:
+                labels = _format_labels(entry)
+                histogram = entry[key]
+                for bound in self.buckets:
+                    lines.append('%s_%s_bucket{%s,le="%s"} %d' % (
+                        prefix, name, labels, repr(float(bound)),
+                        histogram["buckets"][bound]))
+                lines.append('%s_%s_bucket{%s,le="+Inf"} %d' % (
+                    prefix, name, labels, histogram["count"]))
+                lines.append("%s_%s_sum{%s} %r" % (
+                    prefix, name, labels, histogram["sum"]))
+                lines.append("%s_%s_count{%s} %d" % (
+                    prefix, name, labels, histogram["count"]))
+
+        header("responses_total", "counter", "Calls by response status.")
+        for entry in snapshot:
+            labels = _format_labels(entry)
+            for status, count in sorted(entry["statuses"].items()):
+                lines.append('%s_responses_total{%s,status="%s"} %d' % (
+                    prefix, labels, _escape(status), count))
+
+        for name, key, text in (
+                ("request_bytes_total", "request_bytes",
+                 "Request body bytes sent."),
+                ("response_bytes_total", "response_bytes",
+                 "Response body bytes received."),
+                ("retries_total", "retries", "Requests retried."),
+                ("coalesced_total", "coalesced",
+                 "GET requests which shared an identical one's response."),
+                ("cache_hits_total", "cache_hits",
+                 "Responses served from the response cache.")):
+            header(name, "counter", text)
+            for entry in snapshot:
+                lines.append("%s_%s{%s} %d" % (
+                    prefix, name, _format_labels(entry), entry[key]))
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    return (value.replace("\\", "\\\\").replace("\n", "\\n")
+            .replace('"', '\\"'))
+
+
+def _format_labels(entry):
+    return ",".join('%s="%s"' % (label, _escape(entry[label]))
+                    for label in LABELS)
@@ -17,6 +17,7 @@ class NetworkService(service_filter.ServiceFilter):
     """The network service."""
 
     valid_versions = [service_filter.ValidVersion('v2', 'v2.0')]
+    supports_fields = True
 
     def __init__(self, version=None):
         """Create a network service."""
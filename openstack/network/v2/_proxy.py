@@ -762,6 +762,24 @@ class Proxy(proxy.BaseProxy):
         """
         return self._create(_network.Network, **attrs)
 
+    def create_networks(self, data, batch_size=100, concurrency=4):
+        """Create several networks from lists of attributes
+
+        :param list data: A list of dicts which will each be used to create
+                          a :class:`~openstack.network.v2.network.Network`,
+                          comprised of the properties on the Network class.
+        :param int batch_size: The maximum number of networks created
+                               by a single request.
+        :param int concurrency: The maximum number of concurrent requests
+                                if the service doesn't support bulk creates.
+
+        :returns: The created networks, in the same order as ``data``
+        :rtype: list of :class:`~openstack.network.v2.network.Network`
+        """
+        return self._bulk_create(_network.Network, data,
+                                 batch_size=batch_size,
+                                 concurrency=concurrency)
+
     def delete_network(self, network, ignore_missing=True):
         """Delete a network
 
@@ -778,6 +796,25 @@ class Proxy(proxy.BaseProxy):
         """
         self._delete(_network.Network, network, ignore_missing=ignore_missing)
 
+    def delete_networks(self, networks, concurrency=4, ignore_missing=True):
+        """Delete several networks concurrently
+
+        :param networks: The values can be the IDs of networks or
+                    :class:`~openstack.network.v2.network.Network` instances.
+        :param int concurrency: The maximum number of deletes in flight.
+        :param bool ignore_missing: When set to ``False``
+                    :class:`~openstack.exceptions.ResourceNotFound` will be
+                    reported for each network that does not exist.
+                    When set to ``True``, nonexistent networks are
+                    reported as deleted.
+
+        :returns: A list of :class:`~openstack.utils.DeleteResult`, one for
+                  each of ``networks`` in the same order.
+        """
+        return self._delete_many(_network.Network, networks,
+                                 concurrency=concurrency,
+                                 ignore_missing=ignore_missing)
+
     def find_network(self, name_or_id, ignore_missing=True):
         """Find a single network
 
@@ -1171,6 +1208,23 @@ class Proxy(proxy.BaseProxy):
         """
         return self._create(_port.Port, **attrs)
 
+    def create_ports(self, data, batch_size=100, concurrency=4):
+        """Create several ports from lists of attributes
+
+        :param list data: A list of dicts which will each be used to create
+                          a :class:`~openstack.network.v2.port.Port`,
+                          comprised of the properties on the Port class.
+        :param int batch_size: The maximum number of ports created
+                               by a single request.
+        :param int concurrency: The maximum number of concurrent requests
+                                if the service doesn't support bulk creates.
+
+        :returns: The created ports, in the same order as ``data``
+        :rtype: list of :class:`~openstack.network.v2.port.Port`
+        """
+        return self._bulk_create(_port.Port, data, batch_size=batch_size,
+                                 concurrency=concurrency)
+
     def delete_port(self, port, ignore_missing=True):
         """Delete a port
 
@@ -1186,6 +1240,25 @@ class Proxy(proxy.BaseProxy):
         """
         self._delete(_port.Port, port, ignore_missing=ignore_missing)
 
+    def delete_ports(self, ports, concurrency=4, ignore_missing=True):
+        """Delete several ports concurrently
+
+        :param ports: The values can be the IDs of ports or
+                    :class:`~openstack.network.v2.port.Port` instances.
+        :param int concurrency: The maximum number of deletes in flight.
+        :param bool ignore_missing: When set to ``False``
+                    :class:`~openstack.exceptions.ResourceNotFound` will be
+                    reported for each port that does not exist.
+                    When set to ``True``, nonexistent ports are
+                    reported as deleted.
+
+        :returns: A list of :class:`~openstack.utils.DeleteResult`, one for
+                  each of ``ports`` in the same order.
+        """
+        return self._delete_many(_port.Port, ports,
+                                 concurrency=concurrency,
+                                 ignore_missing=ignore_missing)
+
     def find_port(self, name_or_id, ignore_missing=True):
         """Find a single port
 
@@ -2048,6 +2121,28 @@ class Proxy(proxy.BaseProxy):
         self._delete(_security_group.SecurityGroup, security_group,
                      ignore_missing=ignore_missing)
 
+    def delete_security_groups(self, security_groups, concurrency=4,
+                               ignore_missing=True):
+        """Delete several security groups concurrently
+
+        :param security_groups: The values can be the IDs of security groups
+            or :class:`~openstack.network.v2.security_group.SecurityGroup`
+            instances.
+        :param int concurrency: The maximum number of deletes in flight.
+        :param bool ignore_missing: When set to ``False``
+                    :class:`~openstack.exceptions.ResourceNotFound` will be
+                    reported for each security group that does not exist.
+                    When set to ``True``, nonexistent security groups are
+                    reported as deleted.
+
+        :returns: A list of :class:`~openstack.utils.DeleteResult`, one for
+                  each of ``security_groups`` in the same order.
+        """
+        return self._delete_many(_security_group.SecurityGroup,
+                                 security_groups,
+                                 concurrency=concurrency,
+                                 ignore_missing=ignore_missing)
+
     def find_security_group(self, name_or_id, ignore_missing=True):
         """Find a single security group
 
@@ -2142,6 +2237,27 @@ class Proxy(proxy.BaseProxy):
         """
         return self._create(_security_group_rule.SecurityGroupRule, **attrs)
 
+    def create_security_group_rules(self, data, batch_size=100,
+                                    concurrency=4):
+        """Create several security group rules from lists of attributes
+
+        :param list data: A list of dicts which will each be used to create a
+            :class:`~openstack.network.v2.security_group_rule.
+            SecurityGroupRule`, comprised of the properties on the
+            SecurityGroupRule class.
+        :param int batch_size: The maximum number of rules created
+                               by a single request.
+        :param int concurrency: The maximum number of concurrent requests
+                                if the service doesn't support bulk creates.
+
+        :returns: The created rules, in the same order as ``data``
+        :rtype: list of :class:`~openstack.network.v2.security_group_rule.\
+            SecurityGroupRule`
+        """
+        return self._bulk_create(_security_group_rule.SecurityGroupRule,
+                                 data, batch_size=batch_size,
+                                 concurrency=concurrency)
+
     def delete_security_group_rule(self, security_group_rule,
                                    ignore_missing=True):
         """Delete a security group rule
@@ -2409,6 +2525,23 @@ class Proxy(proxy.BaseProxy):
         """
         return self._create(_subnet.Subnet, **attrs)
 
+    def create_subnets(self, data, batch_size=100, concurrency=4):
+        """Create several subnets from lists of attributes
+
+        :param list data: A list of dicts which will each be used to create
+                          a :class:`~openstack.network.v2.subnet.Subnet`,
+                          comprised of the properties on the Subnet class.
+        :param int batch_size: The maximum number of subnets created
+                               by a single request.
+        :param int concurrency: The maximum number of concurrent requests
+                                if the service doesn't support bulk creates.
+
+        :returns: The created subnets, in the same order as ``data``
+        :rtype: list of :class:`~openstack.network.v2.subnet.Subnet`
+        """
+        return self._bulk_create(_subnet.Subnet, data, batch_size=batch_size,
+                                 concurrency=concurrency)
+
     def delete_subnet(self, subnet, ignore_missing=True):
         """Delete a subnet
 
@@ -2424,6 +2557,25 @@ class Proxy(proxy.BaseProxy):
         """
         self._delete(_subnet.Subnet, subnet, ignore_missing=ignore_missing)
 
+    def delete_subnets(self, subnets, concurrency=4, ignore_missing=True):
+        """Delete several subnets concurrently
+
+        :param subnets: The values can be the IDs of subnets or
+                    :class:`~openstack.network.v2.subnet.Subnet` instances.
+        :param int concurrency: The maximum number of deletes in flight.
+        :param bool ignore_missing: When set to ``False``
+                    :class:`~openstack.exceptions.ResourceNotFound` will be
+                    reported for each subnet that does not exist.
+                    When set to ``True``, nonexistent subnets are
+                    reported as deleted.
+
+        :returns: A list of :class:`~openstack.utils.DeleteResult`, one for
+                  each of ``subnets`` in the same order.
+        """
+        return self._delete_many(_subnet.Subnet, subnets,
+                                 concurrency=concurrency,
+                                 ignore_missing=ignore_missing)
+
     def find_subnet(self, name_or_id, ignore_missing=True):
         """Find a single subnet
 
@@ -26,6 +26,7 @@ class AvailabilityZone(_resource.Resource):
     allow_update = False
     allow_delete = False
     allow_list = True
+    cache_responses = True
 
     # Properties
     #: Name of the availability zone.
@@ -24,6 +24,7 @@ class Extension(resource.Resource):
     # capabilities
     allow_retrieve = True
     allow_list = True
+    cache_responses = True
 
     # Properties
     #: An alias the extension is known under.
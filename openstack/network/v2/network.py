@@ -26,6 +26,7 @@ class Network(resource.Resource):
     allow_update = True
     allow_delete = True
     allow_list = True
+    allow_bulk_create = True
 
     # Properties
     #: Availability zone hints to use when scheduling the network.
@@ -26,6 +26,7 @@ class Port(resource.Resource):
     allow_update = True
     allow_delete = True
     allow_list = True
+    allow_bulk_create = True
 
     # Properties
     #: Allowed address pairs.
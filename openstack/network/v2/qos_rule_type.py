@@ -26,6 +26,7 @@ class QoSRuleType(resource.Resource):
     allow_update = False
     allow_delete = False
     allow_list = True
+    cache_responses = True
 
     # Properties
     #: QoS rule type name.
@@ -26,6 +26,7 @@ class SecurityGroupRule(resource.Resource):
     allow_update = False
     allow_delete = True
     allow_list = True
+    allow_bulk_create = True
 
     # Properties
     #: Timestamp when the security group rule was created.
@@ -25,6 +25,7 @@ class ServiceProvider(resource.Resource):
     allow_update = False
     allow_delete = False
     allow_list = True
+    cache_responses = True
 
     # Properties
     #: Service type (FIREWALL, FLAVORS, METERING, QOS, etc..)
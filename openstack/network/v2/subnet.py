@@ -26,6 +26,7 @@ class Subnet(resource.Resource):
     allow_update = True
     allow_delete = True
     allow_list = True
+    allow_bulk_create = True
 
     # Properties
     #: The start and end addresses for the allocation pools.
@@ -254,6 +254,35 @@ class Proxy(proxy.BaseProxy):
         self._delete(_obj.Object, obj, ignore_missing=ignore_missing,
                      path_args={"container": container_name})
 
+    def delete_objects(self, objects, container=None, concurrency=4,
+                       ignore_missing=True):
+        """Delete several objects concurrently
+
+        :param objects: The values can be the names of objects or
+               :class:`~openstack.object_store.v1.obj.Object` instances.
+        :param container: The value can be the ID of a container or a
+               :class:`~openstack.object_store.v1.container.Container`
+               instance. It is used for each of ``objects`` that doesn't
+               name its own container.
+        :param int concurrency: The maximum number of deletes in flight.
+        :param bool ignore_missing: When set to ``False``
+                    :class:`~openstack.exceptions.ResourceNotFound` will be
+                    reported for each object that does not exist.
+                    When set to ``True``, nonexistent objects are
+                    reported as deleted.
+
+        :returns: A list of :class:`~openstack.utils.DeleteResult`, one for
+                  each of ``objects`` in the same order.
+        """
+        objects = [
+            self._get_resource(_obj.Object, obj, path_args={
+                "container": self._get_container_name(obj, container)})
+            for obj in objects]
+
+        return self._delete_many(_obj.Object, objects,
+                                 concurrency=concurrency,
+                                 ignore_missing=ignore_missing)
+
     def get_object_metadata(self, obj, container=None):
         """Get metadata for an object.
 
@@ -0,0 +1,127 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+The :attr:`~openstack.resource2.Resource.pagination` of a resource class
+decides how the pages after the first are requested when its resources
+are listed with ``paginated=True``, and when the last page has been
+received.
+
+:class:`Marker`, the default, requests the items after the last one
+received until a page has fewer items than the one before, which costs
+an empty page at the end when the items fill the last page. Services which
+describe the next page in their responses, e.g., Nova's ``servers_links``
+or Glance's ``next``, are followed with :class:`NextLink` instead, which
+stops exactly at the last page and follows the page sizes the service
+chooses, e.g., when it caps ``limit``.
+
+Usage
+-----
+
+Set the strategy on the resource class::
+
+    from openstack import pagination
+    from openstack import resource2
+
+    class Server(resource2.Resource):
+        resources_key = "servers"
+        pagination = pagination.NextLink("servers_links")
+"""
+
+import six
+from six.moves.urllib import parse
+
+
+class Pagination(object):
+    """How the pages of a listing after the first are requested"""
+
+    def next_params(self, params, body, count, last):
+        """Return the query parameters of the next page
+
+        :param dict params: The query parameters of the page received.
+        :param dict body: The top-level members of the body of the page
+                          received, which may not include the items, or
+                          an empty dict if the body is the list of items.
+        :param int count: The number of items in the page.
+        :param last: The last item of the page, or ``None`` if empty.
+
+        :returns: The query parameters of the next page, or ``None`` if the
+                  page received was the last.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _is_last(params, count):
+        # A page with fewer items than the limit is the last, so there's
+        # no need to request an empty page to find out.
+        return not count or (
+            "limit" in params and count < int(params["limit"]))
+
+
+class Marker(Pagination):
+    """Request the items after the ``marker``, the ID of the last item"""
+
+    def next_params(self, params, body, count, last):
+        if self._is_last(params, count):
+            return None
+        return dict(params, limit=count, marker=last.id)
+
+
+class Offset(Pagination):
+    """Request the items after the ``offset`` items already received"""
+
+    def next_params(self, params, body, count, last):
+        if self._is_last(params, count):
+            return None
+        return dict(params, limit=count,
+                    offset=int(params.get("offset", 0)) + count)
+
+
+class NextLink(Pagination):
+
+    def __init__(self, key):
+        """Follow the link to the next page given in each page
+
+        Services only give the link when there's a next page, so a page
+        without it is the last. Only the query of the link is used, with
+        the URL the pages are listed from, since the host of the links may
+        not be reachable, e.g., behind a load balancer.
+
+        :param str key: The key of the link in the body of pages, whose
+                        value is either the link, e.g., Glance's ``next``,
+                        a dict with a ``next`` link, e.g., Keystone's
+                        ``links``, or a list of dicts with a ``rel`` of
+                        ``next``, e.g., Nova's ``servers_links``.
+        """
+        self.key = key
+
+    def next_params(self, params, body, count, last):
+        link = _next_link(body.get(self.key))
+        if not count or not link:
+            return None
+        params = dict(params)
+        query = parse.parse_qs(parse.urlparse(link).query)
+        for name, values in six.iteritems(query):
+            params[name] = values[0] if len(values) == 1 else values
+        return params
+
+
+def _next_link(links):
+    """Return the link to the next page, or ``None``"""
+    if isinstance(links, dict):
+        return links.get("next")
+    if isinstance(links, list):
+        for link in links:
+            if link.get("rel") == "next":
+                return link.get("href")
+        return None
+    return links
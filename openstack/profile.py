@@ -36,6 +36,7 @@ normally be something like 'compute', 'identity', 'object-store', etc.::
     prof.set_region(prof.ALL, 'zion')
     prof.set_version('identity', 'v3')
     prof.set_interface('object-store', 'internal')
+    prof.set_rate_limit('compute', 10)
     for service in prof.get_services():
         print(prof.get_filter(service.service_type)
 
@@ -52,28 +53,51 @@ The resulting preference print out would look something like::
 """
 
 import copy
+import importlib
 import logging
 import six
+import threading
 
-from openstack.block_store import block_store_service
-from openstack.cluster import cluster_service
-from openstack.compute import compute_service
-from openstack.database import database_service
 from openstack import exceptions
-from openstack.identity import identity_service
-from openstack.image import image_service
-from openstack.key_manager import key_manager_service
-from openstack.message import message_service
 from openstack import module_loader
-from openstack.network import network_service
-from openstack.object_store import object_store_service
-from openstack.orchestration import orchestration_service
-from openstack.telemetry.alarm import alarm_service
-from openstack.telemetry import telemetry_service
-from openstack.workflow import workflow_service
+from openstack import rate_limit
 
 _logger = logging.getLogger(__name__)
 
+#: The services known to every Profile. Each entry is the service type,
+#: the module and name of its ServiceFilter class, and the default version.
+#: Service modules are only imported when the service is first used.
+_SERVICES = [
+    ("alarming", "openstack.telemetry.alarm.alarm_service",
+     "AlarmService", "v2"),
+    ("volume", "openstack.block_store.block_store_service",
+     "BlockStoreService", "v2"),
+    ("clustering", "openstack.cluster.cluster_service",
+     "ClusterService", "v1"),
+    ("compute", "openstack.compute.compute_service",
+     "ComputeService", "v2"),
+    ("database", "openstack.database.database_service",
+     "DatabaseService", "v1"),
+    ("identity", "openstack.identity.identity_service",
+     "IdentityService", "v3"),
+    ("image", "openstack.image.image_service",
+     "ImageService", "v2"),
+    ("key-manager", "openstack.key_manager.key_manager_service",
+     "KeyManagerService", "v1"),
+    ("messaging", "openstack.message.message_service",
+     "MessageService", "v1"),
+    ("network", "openstack.network.network_service",
+     "NetworkService", "v2"),
+    ("object-store", "openstack.object_store.object_store_service",
+     "ObjectStoreService", "v1"),
+    ("orchestration", "openstack.orchestration.orchestration_service",
+     "OrchestrationService", "v1"),
+    ("metering", "openstack.telemetry.telemetry_service",
+     "TelemetryService", "v2"),
+    ("workflowv2", "openstack.workflow.workflow_service",
+     "WorkflowService", "v2"),
+]
+
 
 class Profile(object):
 
@@ -91,35 +115,49 @@ class Profile(object):
         'compute', etc.
         """
         self._services = {}
+        self._rate_limiters = {}
+        # Services that are known but whose modules haven't been imported.
+        self._unloaded = {}
+        self._load_lock = threading.Lock()
 
-        self._add_service(alarm_service.AlarmService(version="v2"))
-        self._add_service(block_store_service.BlockStoreService(version="v2"))
-        self._add_service(cluster_service.ClusterService(version="v1"))
-        self._add_service(compute_service.ComputeService(version="v2"))
-        self._add_service(database_service.DatabaseService(version="v1"))
-        self._add_service(identity_service.IdentityService(version="v3"))
-        self._add_service(image_service.ImageService(version="v2"))
-        self._add_service(key_manager_service.KeyManagerService(version="v1"))
-        self._add_service(message_service.MessageService(version="v1"))
-        self._add_service(network_service.NetworkService(version="v2"))
-        self._add_service(
-            object_store_service.ObjectStoreService(version="v1"))
-        self._add_service(
-            orchestration_service.OrchestrationService(version="v1"))
-        self._add_service(telemetry_service.TelemetryService(version="v2"))
-        self._add_service(workflow_service.WorkflowService(version="v2"))
+        for service_type, module, name, version in _SERVICES:
+            self._unloaded[service_type] = (module, name, version)
 
         if plugins:
             for plugin in plugins:
                 self._load_plugin(plugin)
-        self.service_keys = sorted(self._services.keys())
+        self.service_keys = sorted(set(self._services) | set(self._unloaded))
 
     def __repr__(self):
+        self._load_services()
         return repr(self._services)
 
     def _add_service(self, serv):
         serv.interface = None
+        # Only forget it once it's set, so that other threads find it in
+        # one or the other.
         self._services[serv.service_type] = serv
+        self._unloaded.pop(serv.service_type, None)
+
+    def _load_service(self, service_type):
+        """Import and add a service that hasn't been used yet.
+
+        :param str service_type: Service type.
+        """
+        with self._load_lock:
+            try:
+                module, name, version = self._unloaded[service_type]
+            except KeyError:
+                # It was loaded by another thread since the caller checked.
+                return self._services[service_type]
+            service_class = getattr(importlib.import_module(module), name)
+            self._add_service(service_class(version=version))
+            return self._services[service_type]
+
+    def _load_services(self):
+        """Import and add all of the services that haven't been used yet."""
+        for service_type in list(self._unloaded):
+            self._load_service(service_type)
 
     def _load_plugin(self, namespace):
         """Load a service plugin.
@@ -128,7 +166,8 @@ class Profile(object):
         """
         services = module_loader.load_service_plugins(namespace)
         for service_type in services:
-            if service_type in self._services:
+            if service_type in self._services or (
+                    service_type in self._unloaded):
                 _logger.debug("Overriding %s with %s", service_type,
                               services[service_type])
             self._add_service(services[service_type])
@@ -148,10 +187,22 @@ class Profile(object):
         serv = self._services.get(service, None)
         if serv is not None:
             return serv
+        if service in self._unloaded:
+            return self._load_service(service)
         msg = ("Service %s not in list of valid services: %s" %
                (service, self.service_keys))
         raise exceptions.SDKException(msg)
 
+    def _get_service_module(self, service):
+        """Get the module version of a service's name, without loading it.
+
+        :param str service: Desired service type.
+        """
+        entry = self._unloaded.get(service)
+        if entry is not None:
+            return entry[0].split(".")[-2]
+        return self._get_filter(service).get_service_module()
+
     def _get_services(self, service):
         return self.service_keys if service == self.ALL else [service]
 
@@ -161,11 +212,20 @@ class Profile(object):
 
     def get_services(self):
         """Get a list of all the known services."""
+        self._load_services()
         services = []
         for name, service in six.iteritems(self._services):
             services.append(service)
         return services
 
+    def _get_loaded_services(self):
+        """Get the services which have been used, without loading others.
+
+        Only these can have preferences, since setting one loads the
+        service.
+        """
+        return list(self._services.values())
+
     def set_name(self, service, name):
         """Set the desired name for the specified service.
 
@@ -205,3 +265,35 @@ class Profile(object):
         :param str interface: Desired service interface.
         """
         self._setter(service, "interface", interface)
+
+    def set_rate_limit(self, service, rate, burst=None, **kwargs):
+        """Limit the rate of requests to the specified service.
+
+        Each service gets its own
+        :class:`~openstack.rate_limit.RateLimiter`, shared by all of the
+        sessions using this profile.
+
+        :param str service: Service type.
+        :param float rate: The most requests made per second, or ``None``
+                           to remove the limit.
+        :param int burst: The most requests made at once.
+        :param kwargs: Further arguments of
+                       :class:`~openstack.rate_limit.RateLimiter`.
+        """
+        for service in self._get_services(service):
+            # Raise for unknown services like the other setters.
+            self._get_filter(service)
+            if rate is None:
+                self._rate_limiters.pop(service, None)
+            else:
+                self._rate_limiters[service] = rate_limit.RateLimiter(
+                    rate, burst=burst, **kwargs)
+
+    def get_rate_limiter(self, service):
+        """Get the rate limiter of the specified service.
+
+        :param str service: Service type.
+        :returns: A :class:`~openstack.rate_limit.RateLimiter`, or ``None``
+                  if the service's requests aren't limited.
+        """
+        return self._rate_limiters.get(service)
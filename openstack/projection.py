@@ -0,0 +1,129 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+A :class:`~openstack.projection.Projection` limits the attributes of the
+resources listed to those needed, e.g., when sweeping through every port
+to find those of a device::
+
+    for port in conn.network.ports(fields=["id", "device_id", "fixed_ips"]):
+        ...
+
+Services whose :class:`~openstack.service_filter.ServiceFilter` has
+``supports_fields`` set, such as Neutron, are asked to only return those
+attributes, which makes the responses smaller. For other services, the
+other attributes are dropped from the resources as they're listed.
+
+Records
+-------
+
+With ``records=True``, resources are listed as immutable named tuples of
+the attributes, as returned by the service, rather than as
+:class:`~openstack.resource2.Resource` objects, which are much cheaper to
+create and hold in large numbers::
+
+    ports = conn.network.ports(fields=["id", "device_id"], records=True)
+    by_device = dict((port.device_id, port.id) for port in ports)
+
+Without ``fields``, records have every attribute of the resource.
+"""
+
+import collections
+
+import six
+
+_record_types = {}
+
+
+def record_type(name, attrs):
+    """Return the named tuple type of records of some attributes
+
+    Types are created once for each name and attributes. Attributes which
+    aren't valid identifiers are renamed to their position, e.g., ``_1``.
+
+    :param str name: The name of the type.
+    :param attrs: The names of the attributes.
+    :type attrs: tuple of str
+    """
+    key = (name, attrs)
+    try:
+        return _record_types[key]
+    except KeyError:
+        record = collections.namedtuple(name, attrs, rename=True)
+        _record_types[key] = record
+        return record
+
+
+class Projection(object):
+
+    def __init__(self, resource_type, mapping, fields=None, records=False,
+                 paginated=False):
+        """Select the attributes of the resources being listed
+
+        :param resource_type: The class of the resources.
+        :param dict mapping: The client-side names of the attributes of the
+                             resources, mapped to their server-side names.
+        :param fields: The names of the attributes to keep, either
+                       client-side or server-side. All are kept when it's
+                       ``None``.
+        :type fields: list of str
+        :param bool records: Make records rather than resources.
+        :param bool paginated: Whether the resources are listed in pages,
+                               in which case ``id`` is always kept, as the
+                               marker of the next page.
+        """
+        reverse = dict((server, attr) for attr, server in mapping.items())
+        #: Whether the service is asked to only return the attributes.
+        self.server_side = (
+            fields is not None and
+            getattr(resource_type.service, "supports_fields", False))
+        if fields is None:
+            fields = sorted(mapping)
+        elif isinstance(fields, six.string_types):
+            fields = [fields]
+
+        #: The server-side names of the attributes, in order.
+        self.names = []
+        attrs = []
+        for field in fields:
+            server = mapping.get(field, field)
+            if server not in self.names:
+                self.names.append(server)
+                attrs.append(field if field in mapping
+                             else reverse.get(field, field))
+        id_name = mapping.get("id", "id")
+        if paginated and id_name not in self.names:
+            self.names.append(id_name)
+            attrs.append("id")
+
+        self.record = None
+        if records:
+            self.record = record_type("%sRecord" % resource_type.__name__,
+                                      tuple(attrs))
+
+    def query(self):
+        """Return the ``fields`` query parameter to send, or ``None``"""
+        return list(self.names) if self.server_side else None
+
+    def select(self, data):
+        """Return the data of the selected attributes
+
+        :param dict data: An item of the body of a list response.
+        """
+        return dict((name, data[name]) for name in self.names if name in data)
+
+    def make_record(self, data):
+        """Return a record of the selected attributes
+
+        :param dict data: An item of the body of a list response.
+        """
+        return self.record._make(data.get(name) for name in self.names)
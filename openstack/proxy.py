@@ -11,7 +11,9 @@
 # under the License.
 
 from openstack import exceptions
+from openstack import metrics
 from openstack import resource
+from openstack import utils
 
 
 # The _check_resource decorator is used on BaseProxy methods to ensure that
@@ -74,6 +76,7 @@ class BaseProxy(object):
 
         return res
 
+    @metrics.proxy_operation
     def _find(self, resource_type, name_or_id, path_args=None,
               ignore_missing=True):
         """Find a resource
@@ -91,6 +94,7 @@ class BaseProxy(object):
                                   path_args=path_args,
                                   ignore_missing=ignore_missing)
 
+    @metrics.proxy_operation
     @_check_resource(strict=False)
     def _delete(self, resource_type, value, path_args=None,
                 ignore_missing=True):
@@ -137,6 +141,54 @@ class BaseProxy(object):
 
         return rv
 
+    def _delete_many(self, resource_type, values, path_args=None,
+                     concurrency=4, ignore_missing=True,
+                     wait_for_delete=False, interval=2, wait=120):
+        """Delete several resources concurrently
+
+        The deletes are made on a pool of up to ``concurrency`` threads,
+        which share this proxy's session and its connection pool. A failure
+        to delete one resource doesn't stop the others from being deleted.
+
+        :param resource_type: The type of resource to delete. This should
+                              be a :class:`~openstack.resource.Resource`
+                              subclass with a ``from_id`` method.
+        :param values: The values to delete. Each can be either the ID of a
+                       resource or a :class:`~openstack.resource.Resource`
+                       subclass.
+        :param path_args: A dict containing arguments for forming the request
+                          URL, if needed.
+        :param int concurrency: The maximum number of deletes in flight.
+        :param bool ignore_missing: When set to ``False``
+                    :class:`~openstack.exceptions.ResourceNotFound` will be
+                    reported for each resource that does not exist.
+                    When set to ``True``, nonexistent resources are
+                    reported as deleted.
+        :param bool wait_for_delete: When set to ``True``, wait for each
+                    of the deleted resources to be gone, for services which
+                    delete asynchronously. The waits are made concurrently
+                    once all of the deletes have been made.
+        :param interval: Number of seconds to wait between checks.
+        :param wait: Maximum number of seconds to wait for each delete.
+
+        :returns: A list of :class:`~openstack.utils.DeleteResult`, one for
+                  each of ``values`` in the same order, holding the resource
+                  and the exception that prevented it from being deleted,
+                  or ``None``.
+        """
+        def delete(value):
+            res = self._get_resource(resource_type, value, path_args)
+            self._delete(resource_type, res, ignore_missing=ignore_missing)
+            return res
+
+        def wait_for(res):
+            self.wait_for_delete(res, interval=interval, wait=wait)
+
+        return utils.delete_concurrently(
+            delete, values, concurrency,
+            wait_for if wait_for_delete else None)
+
+    @metrics.proxy_operation
     @_check_resource(strict=False)
     def _update(self, resource_type, value, path_args=None, **attrs):
         """Update a resource
@@ -159,6 +211,7 @@ class BaseProxy(object):
         res.update_attrs(attrs)
         return res.update(self.session)
 
+    @metrics.proxy_operation
     def _create(self, resource_type, path_args=None, **attrs):
         """Create a resource from attributes
 
@@ -178,6 +231,30 @@ class BaseProxy(object):
             res.update_attrs(path_args)
         return res.create(self.session)
 
+    def _bulk_create(self, resource_type, data, path_args=None,
+                     batch_size=100, concurrency=4):
+        """Create several resources from lists of attributes
+
+        :param resource_type: The type of resource to create.
+        :type resource_type: :class:`~openstack.resource.Resource`
+        :param list data: A list of dicts of attributes, one for each
+                          resource to create.
+        :param path_args: A dict containing arguments for forming the request
+                          URL, if needed.
+        :param int batch_size: The maximum number of resources sent in
+                               a single request.
+        :param int concurrency: The maximum number of concurrent requests
+                                if the service doesn't support bulk creates.
+
+        :returns: The result of the ``bulk_create``
+        :rtype: A list of :class:`~openstack.resource.Resource`
+        """
+        return resource_type.bulk_create(self.session, data,
+                                         path_args=path_args,
+                                         batch_size=batch_size,
+                                         concurrency=concurrency)
+
+    @metrics.proxy_operation
     @_check_resource(strict=False)
     def _get(self, resource_type, value=None, path_args=None, args=None):
         """Get a resource
@@ -207,8 +284,10 @@ class BaseProxy(object):
                 request_id=e.request_id, url=e.url, method=e.method,
                 http_status=e.http_status, cause=e.cause)
 
+    @metrics.proxy_operation
     def _list(self, resource_type, value=None, paginated=False,
-              path_args=None, **query):
+              path_args=None, stream=False, fields=None, records=False,
+              prefetch=0, **query):
         """List a resource
 
         :param resource_type: The type of resource to delete. This should
@@ -223,6 +302,19 @@ class BaseProxy(object):
                                returned across multiple pages.
         :param path_args: A dictionary containing arguments for use when
                           forming the request URL for resource retrieval.
+        :param bool stream: When set to ``True``, parse each response as it's
+                            received. See
+                            :meth:`~openstack.resource.Resource.list`.
+        :param fields: The names of the only attributes to list. See
+                       :meth:`~openstack.resource.Resource.list`.
+        :type fields: list of str
+        :param bool records: When set to ``True``, list immutable records
+                             rather than resources. See
+                             :meth:`~openstack.resource.Resource.list`.
+        :param int prefetch: The number of pages to request ahead of the
+                             one being consumed, which implies
+                             ``paginated``. See
+                             :meth:`~openstack.resource.Resource.list`.
         :param kwargs **query: Keyword arguments that are sent to the list
                                method, which are then attached as query
                                parameters on the request URL.
@@ -235,9 +327,23 @@ class BaseProxy(object):
         res = self._get_resource(resource_type, value, path_args)
 
         query = res.convert_ids(query)
+        # Only pass these when set, for resources overriding list without
+        # them.
+        kwargs = {}
+        if stream:
+            kwargs["stream"] = True
+        if fields is not None:
+            kwargs["fields"] = fields
+        if records:
+            kwargs["records"] = True
+        if prefetch:
+            # Prefetching only helps when there are pages to walk.
+            kwargs["prefetch"] = prefetch
+            paginated = True
         return res.list(self.session, path_args=path_args, paginated=paginated,
-                        params=query)
+                        params=query, **kwargs)
 
+    @metrics.proxy_operation
     def _head(self, resource_type, value=None, path_args=None):
         """Retrieve a resource's header
 
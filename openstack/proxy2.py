@@ -10,8 +10,21 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from concurrent import futures
+import logging
+import threading
+
+from six.moves import queue
+
 from openstack import exceptions
+from openstack import metrics
 from openstack import resource2
+from openstack import utils
+
+_logger = logging.getLogger(__name__)
+
+# The number of resources parallel_list buffers ahead of its caller.
+_PARALLEL_LIST_BUFFER = 1000
 
 
 # The _check_resource decorator is used on BaseProxy methods to ensure that
@@ -84,6 +97,7 @@ class BaseProxy(object):
             value = resource2.Resource._get_id(parent)
         return value
 
+    @metrics.proxy_operation
     def _find(self, resource_type, name_or_id, ignore_missing=True,
               **attrs):
         """Find a resource
@@ -104,6 +118,7 @@ class BaseProxy(object):
                                   ignore_missing=ignore_missing,
                                   **attrs)
 
+    @metrics.proxy_operation
     @_check_resource(strict=False)
     def _delete(self, resource_type, value, ignore_missing=True, **attrs):
         """Delete a resource
@@ -150,6 +165,55 @@ class BaseProxy(object):
 
         return rv
 
+    def _delete_many(self, resource_type, values, concurrency=4,
+                     ignore_missing=True, wait_for_delete=False, interval=2,
+                     wait=120, **attrs):
+        """Delete several resources concurrently
+
+        The deletes are made on a pool of up to ``concurrency`` threads,
+        which share this proxy's session and its connection pool. A failure
+        to delete one resource doesn't stop the others from being deleted.
+
+        :param resource_type: The type of resource to delete. This should
+                              be a :class:`~openstack.resource2.Resource`
+                              subclass with a ``from_id`` method.
+        :param values: The values to delete. Each can be either the ID of a
+                       resource or a :class:`~openstack.resource2.Resource`
+                       subclass.
+        :param int concurrency: The maximum number of deletes in flight.
+        :param bool ignore_missing: When set to ``False``
+                    :class:`~openstack.exceptions.ResourceNotFound` will be
+                    reported for each resource that does not exist.
+                    When set to ``True``, nonexistent resources are
+                    reported as deleted.
+        :param bool wait_for_delete: When set to ``True``, wait for each
+                    of the deleted resources to be gone, for services which
+                    delete asynchronously. The waits are made concurrently
+                    once all of the deletes have been made.
+        :param interval: Number of seconds to wait between checks.
+        :param wait: Maximum number of seconds to wait for each delete.
+        :param dict attrs: Attributes to be passed onto the
+                           :meth:`~openstack.resource2.Resource.delete`
+                           method, such as the ID of a parent resource.
+
+        :returns: A list of :class:`~openstack.utils.DeleteResult`, one for
+                  each of ``values`` in the same order, holding the resource
+                  and the exception that prevented it from being deleted,
+                  or ``None``.
+        """
+        def delete(value):
+            res = self._get_resource(resource_type, value, **attrs)
+            self._delete(resource_type, res, ignore_missing=ignore_missing)
+            return res
+
+        def wait_for(res):
+            self.wait_for_delete(res, interval=interval, wait=wait)
+
+        return utils.delete_concurrently(
+            delete, values, concurrency,
+            wait_for if wait_for_delete else None)
+
+    @metrics.proxy_operation
     @_check_resource(strict=False)
     def _update(self, resource_type, value, **attrs):
         """Update a resource
@@ -172,6 +236,7 @@ class BaseProxy(object):
         res = self._get_resource(resource_type, value, **attrs)
         return res.update(self.session)
 
+    @metrics.proxy_operation
     def _create(self, resource_type, **attrs):
         """Create a resource from attributes
 
@@ -192,6 +257,30 @@ class BaseProxy(object):
         res = resource_type.new(**attrs)
         return res.create(self.session)
 
+    def _bulk_create(self, resource_type, data, batch_size=100,
+                     concurrency=4):
+        """Create several resources from lists of attributes
+
+        :param resource_type: The type of resource to create.
+        :type resource_type: :class:`~openstack.resource2.Resource`
+        :param list data: A list of dicts of attributes, one for each
+                          resource to create. These should correspond
+                          to either :class:`~openstack.resource2.Body`
+                          or :class:`~openstack.resource2.URI` values
+                          on this resource.
+        :param int batch_size: The maximum number of resources sent in
+                               a single request.
+        :param int concurrency: The maximum number of concurrent requests
+                                if the service doesn't support bulk creates.
+
+        :returns: The result of the ``bulk_create``
+        :rtype: A list of :class:`~openstack.resource2.Resource`
+        """
+        return resource_type.bulk_create(self.session, data,
+                                         batch_size=batch_size,
+                                         concurrency=concurrency)
+
+    @metrics.proxy_operation
     @_check_resource(strict=False)
     def _get(self, resource_type, value=None, requires_id=True, **attrs):
         """Get a resource
@@ -223,6 +312,7 @@ class BaseProxy(object):
                 request_id=e.request_id, url=e.url, method=e.method,
                 http_status=e.http_status, cause=e.cause)
 
+    @metrics.proxy_operation
     def _list(self, resource_type, value=None, paginated=False, **attrs):
         """List a resource
 
@@ -249,6 +339,90 @@ class BaseProxy(object):
         res = self._get_resource(resource_type, value, **attrs)
         return res.list(self.session, paginated=paginated, **attrs)
 
+    def parallel_list(self, list_method, shards, concurrency=4,
+                      ignore_errors=False, **query):
+        """List several disjoint parts of a collection concurrently
+
+        Very large collections can be listed faster by splitting them into
+        parts with server-side filters, such as one part per status for
+        servers, and walking the pages of each part at the same time::
+
+            shards = [{"status": status}
+                      for status in ("ACTIVE", "BUILD", "SHUTOFF", "ERROR")]
+            for server in conn.compute.parallel_list(conn.compute.servers,
+                                                     shards):
+                ...
+
+        :param list_method: A listing method of a proxy, such as
+                            :meth:`~openstack.compute.v2._proxy.Proxy.servers`.
+        :param list shards: A list of dicts of query parameters, each of
+                            which selects one part of the collection.
+                            Parts that overlap yield their common resources
+                            more than once.
+        :param int concurrency: The maximum number of parts that are
+                                listed at the same time.
+        :param bool ignore_errors: When set to ``False``
+                    :class:`~openstack.exceptions.ParallelListFailure` is
+                    raised once the other parts have been listed if any
+                    part fails. When set to ``True``, failures are logged
+                    and the resources of the other parts are still yielded.
+        :param kwargs query: Query parameters sent along with every part.
+
+        :returns: A generator of Resource objects, in no particular order.
+        """
+        results = queue.Queue(maxsize=_PARALLEL_LIST_BUFFER)
+        stopped = threading.Event()
+        failures = []
+        done = object()
+
+        def put(item):
+            while not stopped.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def walk(shard):
+            try:
+                if stopped.is_set():
+                    return
+                params = dict(query)
+                params.update(shard)
+                for item in list_method(**params):
+                    if not put(item):
+                        return
+            except Exception as e:
+                _logger.debug("Listing %s failed: %s", shard, e)
+                failures.append((shard, e))
+            finally:
+                put(done)
+
+        executor = futures.ThreadPoolExecutor(
+            max_workers=max(1, min(concurrency, len(shards))))
+        try:
+            pending = [executor.submit(walk, shard) for shard in shards]
+            remaining = len(pending)
+            while remaining:
+                item = results.get()
+                if item is done:
+                    remaining -= 1
+                else:
+                    yield item
+        finally:
+            stopped.set()
+            executor.shutdown(wait=False)
+
+        if failures:
+            message = "Listing %d of %d parts failed" % (
+                len(failures), len(shards))
+            if not ignore_errors:
+                raise exceptions.ParallelListFailure(message,
+                                                     failures=failures)
+            _logger.warning(message)
+
+    @metrics.proxy_operation
     def _head(self, resource_type, value=None, **attrs):
         """Retrieve a resource's header
 
@@ -293,6 +467,42 @@ class BaseProxy(object):
         return resource2.wait_for_status(self.session, value, status,
                                          failures, interval, wait)
 
+    def wait_for_statuses(self, values, status, failures=[], interval=2,
+                          wait=120, list_type=None, **query):
+        """Wait for several resources to be in a particular status.
+
+        The resources are all polled with a single list call per cycle
+        rather than a GET each. For example, to wait on a batch of
+        servers that share a name prefix::
+
+            for server, error in conn.compute.wait_for_statuses(
+                    servers, "ACTIVE", failures=["ERROR"],
+                    list_type=ServerDetail, name="batch-"):
+                ...
+
+        :param values: The resources to wait on to reach the status. The
+                       resources must have a status attribute.
+        :type values: A list of :class:`~openstack.resource2.Resource`
+        :param status: Desired status of the resources.
+        :param list failures: Statuses that would indicate the transition
+                              failed such as 'ERROR'.
+        :param interval: Number of seconds to wait between checks.
+        :param wait: Maximum number of seconds to wait for each change,
+                     or a dict of them keyed by resource id, where those
+                     missing wait for 120 seconds.
+        :param list_type: The resource type to list with, if the type of
+                          ``values`` doesn't list their status.
+        :param kwargs query: Optional query parameters to narrow the list
+                             down to the resources being waited on.
+
+        :return: A generator of ``(resource, exception)`` pairs, yielded as
+                 each resource reaches the status, fails or times out.
+                 See :func:`~openstack.resource2.wait_for_statuses`.
+        """
+        return resource2.wait_for_statuses(self.session, values, status,
+                                           failures, interval, wait,
+                                           list_type=list_type, **query)
+
     def wait_for_delete(self, value, interval=2, wait=120):
         """Wait for the resource to be deleted.
 
@@ -0,0 +1,186 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+The :class:`~openstack.rate_limit.RateLimiter` paces the requests made to a
+service so that bursts of them, e.g., from a batch job, don't exceed the
+service's rate limits.
+
+It's a token bucket, refilled at a rate which adapts to the service: each
+time the service rejects a request as over its limit, with a ``429 Too Many
+Requests`` or ``503 Service Unavailable`` response, the rate is halved and
+no request is made until any ``Retry-After`` the service asked for has
+passed. Each successful request then raises the rate a little, back up to
+the configured one.
+
+A limiter is shared by all the threads making requests to its service.
+
+Usage
+-----
+
+Set a limit for a service type in the
+:class:`~openstack.profile.Profile`::
+
+    from openstack import profile
+
+    prof = profile.Profile()
+    prof.set_rate_limit("compute", 10)
+    prof.set_rate_limit("network", 20, burst=40)
+
+Requests rejected with a ``429`` response are retried, once the service
+allows it, up to ``max_retries`` times.
+"""
+
+import email.utils
+import threading
+import time
+
+#: The statuses with which services reject requests over their limit.
+THROTTLED_STATUSES = frozenset([429, 503])
+
+#: The status of requests over Nova's legacy absolute and rate limits,
+#: which is only a rate limit when a ``Retry-After`` is given.
+OVER_LIMIT_STATUS = 413
+
+_now = getattr(time, "monotonic", time.time)
+
+
+def parse_retry_after(value):
+    """Return the number of seconds a ``Retry-After`` header asks for
+
+    :param str value: The header, either a number of seconds or an HTTP
+                      date.
+
+    :returns: The number of seconds, or ``None`` if there's no header or it
+              can't be parsed.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    parsed = email.utils.parsedate_tz(value)
+    if parsed is None:
+        return None
+    return max(0.0, email.utils.mktime_tz(parsed) - time.time())
+
+
+class RateLimiter(object):
+
+    def __init__(self, rate, burst=None, min_rate=None, max_retries=3,
+                 decrease=0.5, increase=None):
+        """Limit the rate of requests to a service.
+
+        :param float rate: The most requests made per second.
+        :param int burst: The most requests made at once after a period
+                          without requests. The default is ``rate``, or 1.
+        :param float min_rate: The least the rate is reduced to when
+                               requests are rejected. The default is a
+                               hundredth of ``rate``.
+        :param int max_retries: The number of times a request rejected with
+                                a ``429`` response is retried.
+        :param float decrease: What the rate is multiplied by when a request
+                               is rejected.
+        :param float increase: What is added to the rate after each
+                               successful request. The default is a
+                               hundredth of ``rate``.
+        """
+        self.max_rate = float(rate)
+        self.rate = self.max_rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self.min_rate = (min_rate if min_rate is not None
+                         else self.max_rate / 100)
+        self.max_retries = max_retries
+        self.decrease = decrease
+        self.increase = (increase if increase is not None
+                         else self.max_rate / 100)
+
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = _now()
+        self._paused_until = 0.0
+        self._decreased = None
+        self._stats = {"requests": 0, "throttled": 0, "waited": 0.0}
+
+    def _refill(self, now):
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """Wait until a request may be made
+
+        :returns: The number of seconds waited.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = _now()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    self._refill(now)
+                    # Allow for rounding in the refill.
+                    if self._tokens >= 1 - 1e-9:
+                        self._tokens = max(0.0, self._tokens - 1)
+                        self._stats["requests"] += 1
+                        self._stats["waited"] += waited
+                        return waited
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+    def succeeded(self):
+        """Raise the rate after a request was accepted"""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self._refill(_now())
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def throttled(self, retry_after=None):
+        """Lower the rate after a request was rejected as over the limit
+
+        Requests which were already in flight are often rejected together,
+        so the rate is lowered at most once a second.
+
+        :param float retry_after: The number of seconds the service asked
+                                  for no requests to be made for.
+        """
+        with self._lock:
+            now = _now()
+            self._stats["throttled"] += 1
+            if self._decreased is None or now - self._decreased >= 1:
+                self._refill(now)
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                self._tokens = min(self._tokens, 0.0)
+                self._decreased = now
+            if retry_after:
+                self._refill(now)
+                self._paused_until = max(self._paused_until,
+                                         now + retry_after)
+                # No tokens are added while paused, so that requests don't
+                # all burst out once the pause is over.
+                self._updated = self._paused_until
+
+    def get_stats(self):
+        """Report how requests were limited
+
+        :returns: A dict of the current ``rate``, and the number of
+                  ``requests`` made, how many were ``throttled`` by the
+                  service, and the total seconds ``waited`` before making
+                  them.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["rate"] = self.rate
+            return stats
@@ -40,6 +40,9 @@ from six.moves.urllib import parse as url_parse
 
 from openstack import exceptions
 from openstack import format
+from openstack import json_codec
+from openstack import pagination as _pagination
+from openstack import projection as _projection
 from openstack import utils
 
 
@@ -240,8 +243,17 @@ class Resource(collections.MutableMapping):
     allow_list = False
     #: Allow head operation for this resource.
     allow_head = False
+    #: Allow creating several resources in one request, with a list of them
+    #: under :data:`Resource.resources_key`. See :meth:`Resource.bulk_create`.
+    allow_bulk_create = False
 
     patch_update = False
+    #: Cache the responses of get and list operations for this resource,
+    #: when the session has a :mod:`~openstack.response_cache`.
+    cache_responses = False
+    #: How the pages after the first are requested when listing with
+    #: ``paginated=True``. See :mod:`~openstack.pagination`.
+    pagination = _pagination.Marker()
 
     def __init__(self, attrs=None, loaded=False):
         """Construct a Resource to interact with a service's REST API.
@@ -524,6 +536,22 @@ class Resource(collections.MutableMapping):
             url = utils.urljoin(url, resource_id)
         return url
 
+    @classmethod
+    def _prop_mapping(cls):
+        """Return the server-side names of the props of this class"""
+        mapping = {'id': cls.id_attribute}
+        # Walk the MRO from the base, so subclasses override their bases.
+        for klass in reversed(cls.__mro__):
+            for key, value in klass.__dict__.items():
+                if isinstance(value, prop) and not isinstance(value, header):
+                    mapping[key] = value.name
+        return mapping
+
+    @classmethod
+    def _cache_args(cls):
+        """Return the arguments of requests which may be cached"""
+        return {"cache": True} if cls.cache_responses else {}
+
     @classmethod
     def create_by_id(cls, session, attrs, resource_id=None, path_args=None):
         """Create a remote resource from its attributes.
@@ -584,6 +612,95 @@ class Resource(collections.MutableMapping):
         self._reset_dirty()
         return self
 
+    @classmethod
+    def bulk_create(cls, session, data, path_args=None, batch_size=100,
+                    concurrency=4):
+        """Create several remote resources from their attributes.
+
+        When :data:`Resource.allow_bulk_create` is set, the resources are
+        sent in batches of up to `batch_size` under the
+        :data:`Resource.resources_key`, as services such as Networking
+        accept. Otherwise, or when the service replies to a batch with
+        a 405 or 501 status, the resources are created one request at
+        a time, with up to `concurrency` requests in flight.
+
+        :param session: The session to use for making this request.
+        :type session: :class:`~openstack.session.Session`
+        :param list data: A list of dicts of attributes, one for each
+                          resource to create.
+        :param dict path_args: A dictionary of arguments to construct
+                               a compound URL.
+                               See `How path_args are used`_ for details.
+        :param int batch_size: The maximum number of resources sent in
+                               a single request.
+        :param int concurrency: The maximum number of concurrent requests
+                                when falling back to individual creates.
+
+        :return: A list of :class:`Resource` objects in the same order
+                 as `data`.
+        :raises: :exc:`~openstack.exceptions.MethodNotSupported` if
+                 :data:`Resource.allow_create` is not set to ``True``.
+        """
+        if not cls.allow_create:
+            raise exceptions.MethodNotSupported(cls, 'create')
+
+        resources = []
+        for attrs in data:
+            res = cls.new(**attrs)
+            if path_args is not None:
+                res.update_attrs(path_args)
+            resources.append(res)
+
+        for start in range(0, len(resources), batch_size):
+            batch = resources[start:start + batch_size]
+            if not cls.allow_bulk_create or cls.resources_key is None:
+                cls._create_each(session, batch, concurrency)
+                continue
+
+            try:
+                cls._create_batch(session, batch, path_args)
+            except exceptions.HttpException as e:
+                # A 400 can't be told apart from invalid attributes, so
+                # only a service refusing the request falls back.
+                if e.http_status not in (405, 501):
+                    raise
+                cls._create_each(session, batch, concurrency)
+
+        return resources
+
+    @classmethod
+    def _create_batch(cls, session, batch, path_args=None):
+        bodies = []
+        for res in batch:
+            attrs = cls.convert_ids(res._attrs)
+            attrs.pop(HEADERS, None)
+            # Resources may change their create body, e.g., to leave out
+            # the attributes which are only part of their URL.
+            body = cls._get_create_body(attrs)
+            if cls.resource_key:
+                body = body[cls.resource_key]
+            bodies.append(body)
+
+        url = cls._get_url(path_args)
+        resp = session.post(url, endpoint_filter=cls.service,
+                            json={cls.resources_key: bodies})
+        bodies = resp.json()[cls.resources_key]
+        if len(bodies) != len(batch):
+            raise exceptions.InvalidResponse(resp)
+
+        for res, body in zip(batch, bodies):
+            res._update_attrs_from_response(body)
+            res._reset_dirty()
+
+    @classmethod
+    def _create_each(cls, session, batch, concurrency):
+        """Create each resource of a batch with its own request"""
+        results = utils.map_concurrently(
+            lambda res: res.create(session), batch, concurrency)
+        for _, exc in results:
+            if exc is not None:
+                raise exc
+
     @classmethod
     def get_data_by_id(cls, session, resource_id, path_args=None, args=None,
                        include_headers=False):
@@ -612,7 +729,8 @@ class Resource(collections.MutableMapping):
         url = cls._get_url(path_args, resource_id)
         if args:
             url = '?'.join([url, url_parse.urlencode(args)])
-        response = session.get(url, endpoint_filter=cls.service)
+        response = session.get(url, endpoint_filter=cls.service,
+                               **cls._cache_args())
         body = response.json()
 
         if cls.resource_key:
@@ -837,7 +955,8 @@ class Resource(collections.MutableMapping):
         self.delete_by_id(session, self.id, path_args=self)
 
     @classmethod
-    def list(cls, session, path_args=None, paginated=False, params=None):
+    def list(cls, session, path_args=None, paginated=False, params=None,
+             stream=False, fields=None, records=False, prefetch=0):
         """This method is a generator which yields resource objects.
 
         This resource object list generator handles pagination and takes query
@@ -858,6 +977,26 @@ class Resource(collections.MutableMapping):
                             :meth:`~openstack.session.Session.get` method.
                             Values that the server may support include `limit`
                             and `marker`.
+        :param bool stream: When set to ``True``, each page is parsed as
+                            it's received, yielding each resource once its
+                            data is complete, so that a huge page isn't
+                            held in memory at once. Responses aren't
+                            cached.
+        :param fields: The names of the only attributes to list, which the
+                       service is asked to only return if it supports it.
+                       See :mod:`~openstack.projection`.
+        :type fields: list of str
+        :param bool records: When set to ``True``, yield immutable named
+                             tuples of the attributes, as returned by the
+                             service, rather than :class:`Resource`
+                             objects.
+        :param int prefetch: When greater than zero, pages are requested
+                             in a background thread while the caller
+                             consumes the current one, keeping up to
+                             ``prefetch`` pages buffered. By default each
+                             page is only requested once the previous one
+                             has been consumed. It's ignored when
+                             ``stream`` is set.
 
         :return: A generator of :class:`Resource` objects.
         :raises: :exc:`~openstack.exceptions.MethodNotSupported` if
@@ -866,37 +1005,84 @@ class Resource(collections.MutableMapping):
         if not cls.allow_list:
             raise exceptions.MethodNotSupported(cls, 'list')
 
-        more_data = True
         params = {} if params is None else params
         url = cls._get_url(path_args)
-        headers = {'Accept': 'application/json'}
-        while more_data:
+        projection = None
+        if fields is not None or records:
+            projection = _projection.Projection(
+                cls, cls._prop_mapping(), fields, records, paginated)
+            if projection.server_side:
+                params['fields'] = projection.query()
+
+        if stream:
+            for value in cls._list_streamed(session, url, paginated, params,
+                                            projection):
+                yield value
+            return
+
+        pages = cls._list_pages(session, url, paginated, params, projection)
+        if prefetch:
+            pages = utils.prefetch(pages, prefetch)
+
+        for page in pages:
+            for value in page:
+                yield value
+
+    @classmethod
+    def _list_pages(cls, session, url, paginated, params, projection):
+        """A generator which yields a list of resources per page
+
+        See :meth:`~openstack.resource.Resource.list` for the arguments.
+        """
+        while params is not None:
             resp = session.get(url, endpoint_filter=cls.service,
-                               headers=headers, params=params)
-            resp = resp.json()
+                               headers={'Accept': 'application/json'},
+                               params=params, **cls._cache_args())
+            body = resp.json()
             if cls.resources_key:
-                resp = resp[cls.resources_key]
-
-            if not resp:
-                more_data = False
-
-            # Keep track of how many items we've yielded. If we yielded
-            # less than our limit, we don't need to do an extra request
-            # to get back an empty data set, which acts as a sentinel.
-            yielded = 0
-            new_marker = None
-            for data in resp:
-                value = cls.existing(**data)
-                new_marker = value.id
-                yielded += 1
-                yield value
+                resp = body[cls.resources_key]
+            else:
+                resp, body = body, {}
+
+            page = [cls._list_item(data, projection) for data in resp]
+            yield page
 
             if not paginated:
                 return
-            if 'limit' in params and yielded < params['limit']:
+            params = cls.pagination.next_params(
+                params, body, len(page), page[-1] if page else None)
+
+    @classmethod
+    def _list_streamed(cls, session, url, paginated, params, projection):
+        """A generator which yields resources as their data is parsed
+
+        See :meth:`~openstack.resource.Resource.list` for the arguments.
+        """
+        while params is not None:
+            resp = session.get(url, endpoint_filter=cls.service,
+                               headers={'Accept': 'application/json'},
+                               params=params, stream=True)
+            body = {}
+            count = 0
+            value = None
+            for data in json_codec.stream(resp, cls.resources_key,
+                                          members=body):
+                value = cls._list_item(data, projection)
+                count += 1
+                yield value
+
+            if not paginated:
                 return
-            params['limit'] = yielded
-            params['marker'] = new_marker
+            params = cls.pagination.next_params(params, body, count, value)
+
+    @classmethod
+    def _list_item(cls, data, projection):
+        """Return what is listed for an item of a list response"""
+        if projection is None:
+            return cls.existing(**data)
+        if projection.record is not None:
+            return projection.make_record(data)
+        return cls.existing(**projection.select(data))
 
     @classmethod
     def find(cls, session, name_or_id, path_args=None, ignore_missing=True):
@@ -34,13 +34,24 @@ and then returned to the caller.
 import collections
 import itertools
 import time
-import sys
+
+try:
+    from types import MappingProxyType as _frozen_mapping
+except ImportError:
+    # types.MappingProxyType was added in Python 3.3. On Python 2 the
+    # mappings are plain dicts, which callers must treat as read-only.
+    _frozen_mapping = dict
+
+import six
 
 from openstack import exceptions
 from openstack import format
+from openstack import json_codec
+from openstack import pagination as _pagination
+from openstack import projection as _projection
 from openstack import utils
 
-utils.enable_logging(debug=True, path='/opt/stack/logs/openstack.log', stream=sys.stdout)
+
 class _BaseComponent(object):
 
     # The name this component is being tracked as in the Resource
@@ -127,12 +138,59 @@ class URI(_BaseComponent):
     key = "_uri"
 
 
+class _Id(Body):
+    """The id of a Resource
+
+    The value is read from the "id" key of the body when it exists, and
+    otherwise from the `alternate_id` Body attribute of the class, if any.
+    """
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return None
+
+        attributes = instance._body.attributes
+        try:
+            return attributes["id"]
+        except KeyError:
+            pass
+
+        try:
+            return attributes[owner._alternate_id_name]
+        except KeyError:
+            return None
+
+
+#: Placeholder for a _ComponentManager with no modified attributes. The
+#: set of dirty keys is only allocated once something is modified, which
+#: keeps synchronized resources, such as those returned by list(), small.
+_CLEAN = frozenset()
+
+
 class _ComponentManager(collections.MutableMapping):
     """Storage of a component type"""
 
-    def __init__(self, attributes=None, synchronized=False):
-        self.attributes = dict() if attributes is None else attributes.copy()
-        self._dirty = set() if synchronized else set(self.attributes.keys())
+    __slots__ = ("attributes", "_dirty")
+
+    def __init__(self, attributes=None, synchronized=False, copy=True):
+        """Create storage for a component type
+
+        :param dict attributes: The initial values of this component.
+        :param bool synchronized: Whether the initial values match the
+                                  server. If ``False`` they're all dirty.
+        :param bool copy: When ``False``, ``attributes`` is used directly
+                          as storage instead of being copied. Only do this
+                          with a dict nothing else holds on to.
+        """
+        if attributes is None:
+            attributes = dict()
+        elif copy:
+            attributes = attributes.copy()
+        self.attributes = attributes
+        if synchronized or not attributes:
+            self._dirty = _CLEAN
+        else:
+            self._dirty = set(attributes.keys())
 
     def __getitem__(self, key):
         return self.attributes[key]
@@ -147,11 +205,11 @@ class _ComponentManager(collections.MutableMapping):
 
         if changed:
             self.attributes[key] = value
-            self._dirty.add(key)
+            self._set_dirty(key)
 
     def __delitem__(self, key):
         del self.attributes[key]
-        self._dirty.add(key)
+        self._set_dirty(key)
 
     def __iter__(self):
         return iter(self.attributes)
@@ -159,6 +217,11 @@ class _ComponentManager(collections.MutableMapping):
     def __len__(self):
         return len(self.attributes)
 
+    def _set_dirty(self, key):
+        if self._dirty is _CLEAN:
+            self._dirty = set()
+        self._dirty.add(key)
+
     @property
     def dirty(self):
         """Return a dict of modified attributes"""
@@ -167,7 +230,7 @@ class _ComponentManager(collections.MutableMapping):
 
     def clean(self):
         """Signal that the resource no longer has modified attributes"""
-        self._dirty = set()
+        self._dirty = _CLEAN
 
 
 class _Request(object):
@@ -212,15 +275,74 @@ class QueryParameters(object):
         return result
 
 
+def _collect_mapping(cls, component):
+    """Return a dict of attributes of a given component on a class"""
+    mapping = {}
+    # Since we're looking at class definitions we need to include
+    # subclasses, so check the whole MRO.
+    for klass in cls.__mro__:
+        for key, value in klass.__dict__.items():
+            if isinstance(value, component):
+                # Make sure base classes don't end up overwriting
+                # mappings we've found previously in subclasses.
+                if key not in mapping:
+                    mapping[key] = value.name
+    return mapping
+
+
+class _ResourceMeta(type):
+    """Precompute the component lookup tables of a Resource class
+
+    Walking the MRO to find Body, Header, and URI members is expensive
+    and the result only depends on the class definition, so it is done
+    once when each class is created rather than every time a resource
+    is instantiated or a response is translated.
+    """
+
+    def __init__(cls, name, bases, attrs):
+        super(_ResourceMeta, cls).__init__(name, bases, attrs)
+
+        # Classes that redefine `id`, such as Keypair using its name,
+        # still need the `id` lookup to consider the alternate id.
+        id_attr = attrs.get("id")
+        if isinstance(id_attr, Body) and not isinstance(id_attr, _Id):
+            cls.id = _Id(id_attr.name, type=id_attr.type,
+                         default=id_attr.default,
+                         alternate_id=id_attr.alternate_id)
+
+        mappings = {}
+        server_names = {}
+        for component in (Body, Header, URI):
+            mapping = _collect_mapping(cls, component)
+            mappings[component] = _frozen_mapping(mapping)
+            server_names[component] = frozenset(mapping.values())
+
+        alternate_id = ""
+        for value in attrs.values():
+            if isinstance(value, Body) and value.alternate_id:
+                alternate_id = value.name
+                break
+
+        cls._component_mappings = mappings
+        cls._component_server_names = server_names
+        cls._alternate_id_name = alternate_id
+
+
+@six.add_metaclass(_ResourceMeta)
 class Resource(object):
 
+    # Subclasses don't define __slots__ so they can still carry extra
+    # instance attributes, but as long as they only use these the
+    # instance __dict__ is never allocated.
+    __slots__ = ("_body", "_header", "_uri")
+
     #: Singular form of key for resource.
     resource_key = None
     #: Plural form of key for resource.
     resources_key = None
 
     #: The ID of this resource.
-    id = Body("id")
+    id = _Id("id")
     #: The name of this resource.
     name = Body("name")
     #: The location of this resource.
@@ -247,10 +369,19 @@ class Resource(object):
     allow_list = False
     #: Allow head operation for this resource.
     allow_head = False
+    #: Allow creating several resources in one request, with a list of them
+    #: under :data:`Resource.resources_key`. See :meth:`Resource.bulk_create`.
+    allow_bulk_create = False
     #: Use PATCH for update operations on this resource.
     patch_update = False
     #: Use PUT for create operations on this resource.
     put_create = False
+    #: Cache the responses of get and list operations for this resource,
+    #: when the session has a :mod:`~openstack.response_cache`.
+    cache_responses = False
+    #: How the pages after the first are requested when listing with
+    #: ``paginated=True``. See :mod:`~openstack.pagination`.
+    pagination = _pagination.Marker()
 
     def __init__(self, synchronized=False, **attrs):
         # NOTE: _collect_attrs modifies **attrs in place, removing
@@ -261,12 +392,15 @@ class Resource(object):
         # they're not being set anywhere. Log this? Raise exception?
         # How strict should we be here? Should strict be an option?
 
+        # The dicts from _collect_attrs are new objects only referenced
+        # here, so the managers can take them over rather than copy them.
         self._body = _ComponentManager(attributes=body,
-                                       synchronized=synchronized)
+                                       synchronized=synchronized, copy=False)
         self._header = _ComponentManager(attributes=header,
-                                         synchronized=synchronized)
+                                         synchronized=synchronized,
+                                         copy=False)
         self._uri = _ComponentManager(attributes=uri,
-                                      synchronized=synchronized)
+                                      synchronized=synchronized, copy=False)
 
     def __repr__(self):
         pairs = ["%s=%s" % (k, v) for k, v in dict(itertools.chain(
@@ -284,24 +418,6 @@ class Resource(object):
                     self._header.attributes == comparand._header.attributes,
                     self._uri.attributes == comparand._uri.attributes])
 
-    def __getattribute__(self, name):
-        """Return an attribute on this instance
-
-        This is mostly a pass-through except for a specialization on
-        the 'id' name, as this can exist under a different name via the
-        `alternate_id` argument to resource.Body.
-        """
-        if name == "id":
-            if name in self._body:
-                return self._body[name]
-            else:
-                try:
-                    return self._body[self._alternate_id()]
-                except KeyError:
-                    return None
-        else:
-            return object.__getattribute__(self, name)
-
     def _update(self, **attrs):
         """Given attributes, update them on this instance
 
@@ -322,13 +438,16 @@ class Resource(object):
         that correspond to the relevant body, header, and uri
         attributes that exist on this class.
         """
-        body = self._consume_attrs(self._body_mapping(), attrs)
-        header = self._consume_attrs(self._header_mapping(), attrs)
-        uri = self._consume_attrs(self._uri_mapping(), attrs)
+        body = self._consume_attrs(self._body_mapping(), attrs,
+                                   self._get_server_names(Body))
+        header = self._consume_attrs(self._header_mapping(), attrs,
+                                     self._get_server_names(Header))
+        uri = self._consume_attrs(self._uri_mapping(), attrs,
+                                  self._get_server_names(URI))
 
         return body, header, uri
 
-    def _consume_attrs(self, mapping, attrs):
+    def _consume_attrs(self, mapping, attrs, server_names=None):
         """Given a mapping and attributes, return relevant matches
 
         This method finds keys in attrs that exist in the mapping, then
@@ -337,7 +456,15 @@ class Resource(object):
         us to only calculate their place and existence in a particular
         type of Resource component one time, rather than looking at the
         same source dict several times.
+
+        :param server_names: A set of the server-side names in `mapping`,
+                             as returned by
+                             :meth:`~openstack.resource2.Resource._get_server_names`.
+                             It is computed from `mapping` if not given.
         """
+        if server_names is None:
+            server_names = frozenset(mapping.values())
+
         relevant_attrs = {}
         consumed_keys = []
         for key in attrs:
@@ -345,7 +472,7 @@ class Resource(object):
                 # Convert client-side key names into server-side.
                 relevant_attrs[mapping[key]] = attrs[key]
                 consumed_keys.append(key)
-            elif key in mapping.values():
+            elif key in server_names:
                 # Server-side names can be stored directly.
                 relevant_attrs[key] = attrs[key]
                 consumed_keys.append(key)
@@ -357,18 +484,23 @@ class Resource(object):
 
     @classmethod
     def _get_mapping(cls, component):
-        """Return a dict of attributes of a given component on the class"""
-        mapping = {}
-        # Since we're looking at class definitions we need to include
-        # subclasses, so check the whole MRO.
-        for klass in cls.__mro__:
-            for key, value in klass.__dict__.items():
-                if isinstance(value, component):
-                    # Make sure base classes don't end up overwriting
-                    # mappings we've found previously in subclasses.
-                    if key not in mapping:
-                        mapping[key] = value.name
-        return mapping
+        """Return a mapping of attributes of a given component on the class
+
+        Mappings for Body, Header, and URI are computed once when the
+        class is created and returned as read-only mappings.
+        """
+        try:
+            return cls._component_mappings[component]
+        except KeyError:
+            return _collect_mapping(cls, component)
+
+    @classmethod
+    def _get_server_names(cls, component):
+        """Return a frozenset of server-side names of a given component"""
+        try:
+            return cls._component_server_names[component]
+        except KeyError:
+            return frozenset(_collect_mapping(cls, component).values())
 
     @classmethod
     def _body_mapping(cls):
@@ -395,11 +527,7 @@ class Resource(object):
         Returns an empty string if no name exists, as this method is
         consumed by _get_id and passed to getattr.
         """
-        for value in cls.__dict__.values():
-            if isinstance(value, Body):
-                if value.alternate_id:
-                    return value.name
-        return ""
+        return cls._alternate_id_name
 
     @staticmethod
     def _get_id(value):
@@ -516,13 +644,18 @@ class Resource(object):
 
         return _Request(uri, body, headers)
 
-    def _filter_component(self, component, mapping):
+    def _filter_component(self, component, mapping, server_names=None):
         """Filter the keys in component based on a mapping
 
         This method converts a dict of server-side data to contain
         only the appropriate keys for attributes on this instance.
+
+        :param server_names: A set of the server-side names in `mapping`.
+                             It is computed from `mapping` if not given.
         """
-        return {k: v for k, v in component.items() if k in mapping.values()}
+        if server_names is None:
+            server_names = frozenset(mapping.values())
+        return {k: v for k, v in component.items() if k in server_names}
 
     def _translate_response(self, response, has_body=True):
         """Given a KSA response, inflate this instance with its data
@@ -538,12 +671,14 @@ class Resource(object):
             if self.resource_key and self.resource_key in body:
                 body = body[self.resource_key]
 
-            body = self._filter_component(body, self._body_mapping())
+            body = self._filter_component(body, self._body_mapping(),
+                                          self._get_server_names(Body))
             self._body.attributes.update(body)
             self._body.clean()
 
         headers = self._filter_component(response.headers,
-                                         self._header_mapping())
+                                         self._header_mapping(),
+                                         self._get_server_names(Header))
         self._header.attributes.update(headers)
         self._header.clean()
 
@@ -577,6 +712,83 @@ class Resource(object):
         self._translate_response(response)
         return self
 
+    @classmethod
+    def bulk_create(cls, session, data, batch_size=100, concurrency=4):
+        """Create several remote resources
+
+        When :data:`Resource.allow_bulk_create` is set, the resources are
+        sent in batches of up to `batch_size` under the
+        :data:`Resource.resources_key`, as services such as Networking
+        accept. Otherwise, or when the service replies to a batch with
+        a 405 or 501 status, the resources are created one request at
+        a time, with up to `concurrency` requests in flight.
+
+        :param session: The session to use for making this request.
+        :type session: :class:`~openstack.session.Session`
+        :param list data: A list of dicts of attributes, one for each
+                          resource to create.
+        :param int batch_size: The maximum number of resources sent in
+                               a single request.
+        :param int concurrency: The maximum number of concurrent requests
+                                when falling back to individual creates.
+
+        :return: A list of :class:`Resource` instances in the same order
+                 as `data`.
+        :raises: :exc:`~openstack.exceptions.MethodNotSupported` if
+                 :data:`Resource.allow_create` is not set to ``True``.
+        """
+        if not cls.allow_create:
+            raise exceptions.MethodNotSupported(cls, "create")
+
+        resources = [cls.new(**attrs) for attrs in data]
+
+        for start in range(0, len(resources), batch_size):
+            batch = resources[start:start + batch_size]
+            if (not cls.allow_bulk_create or cls.put_create or
+                    cls.resources_key is None):
+                cls._create_each(session, batch, concurrency)
+                continue
+
+            try:
+                cls._create_batch(session, batch)
+            except exceptions.HttpException as e:
+                # A 400 can't be told apart from invalid attributes, so
+                # only a service refusing the request falls back.
+                if e.http_status not in (405, 501):
+                    raise
+                cls._create_each(session, batch, concurrency)
+
+        return resources
+
+    @classmethod
+    def _create_batch(cls, session, batch):
+        """Create a batch of resources in one request"""
+        request = batch[0]._prepare_request(requires_id=False)
+        body = {cls.resources_key: [res._body.dirty for res in batch]}
+        response = session.post(request.uri, endpoint_filter=cls.service,
+                                json=body, headers=request.headers)
+
+        bodies = response.json()[cls.resources_key]
+        if len(bodies) != len(batch):
+            raise exceptions.InvalidResponse(response)
+
+        mapping = cls._body_mapping()
+        server_names = cls._get_server_names(Body)
+        for res, body in zip(batch, bodies):
+            body = res._filter_component(body, mapping, server_names)
+            res._body.attributes.update(body)
+            res._body.clean()
+            res._header.clean()
+
+    @classmethod
+    def _create_each(cls, session, batch, concurrency):
+        """Create each resource of a batch with its own request"""
+        results = utils.map_concurrently(
+            lambda res: res.create(session), batch, concurrency)
+        for _, exc in results:
+            if exc is not None:
+                raise exc
+
     def get(self, session, requires_id=True):
         """Get a remote resource based on this instance.
 
@@ -592,7 +804,8 @@ class Resource(object):
             raise exceptions.MethodNotSupported(self, "get")
 
         request = self._prepare_request(requires_id=requires_id)
-        response = session.get(request.uri, endpoint_filter=self.service)
+        response = session.get(request.uri, endpoint_filter=self.service,
+                               **self._cache_args())
 
         self._translate_response(response)
         return self
@@ -669,12 +882,12 @@ class Resource(object):
         response = session.delete(request.uri, endpoint_filter=self.service,
                                   headers={"Accept": ""})
 
-
         self._translate_response(response, has_body=False)
         return self
 
     @classmethod
-    def list(cls, session, paginated=False, **params):
+    def list(cls, session, paginated=False, prefetch=0, stream=False,
+             fields=None, records=False, **params):
         """This method is a generator which yields resource objects.
 
         This resource object list generator handles pagination and takes query
@@ -688,6 +901,25 @@ class Resource(object):
                                **When paginated is False only one
                                page of data will be returned regardless
                                of the API's support of pagination.**
+        :param int prefetch: When greater than zero, pages are requested
+                             in a background thread while the caller
+                             consumes the current one, keeping up to
+                             ``prefetch`` pages buffered. By default each
+                             page is only requested once the previous one
+                             has been consumed.
+        :param bool stream: When set to ``True``, each page is parsed as
+                            it's received, yielding each resource once its
+                            data is complete, so that a huge page isn't
+                            held in memory at once. ``prefetch`` is
+                            ignored, and responses aren't cached.
+        :param fields: The names of the only attributes to list, which the
+                       service is asked to only return if it supports it.
+                       See :mod:`~openstack.projection`.
+        :type fields: list of str
+        :param bool records: When set to ``True``, yield immutable named
+                             tuples of the attributes, as returned by the
+                             service, rather than :class:`Resource`
+                             objects.
         :param dict params: These keyword arguments are passed through the
             :meth:`~openstack.resource2.QueryParamter._transpose` method
             to find if any of them match expected query parameters to be
@@ -705,26 +937,48 @@ class Resource(object):
         if not cls.allow_list:
             raise exceptions.MethodNotSupported(cls, "list")
 
-        more_data = True
-        query_params = cls._query_mapping._transpose(params)
+        projection = None
+        if fields is not None or records:
+            projection = _projection.Projection(
+                cls, cls._body_mapping(), fields, records, paginated)
+
+        if stream:
+            for value in cls._list_streamed(session, paginated, params,
+                                            projection):
+                yield value
+            return
+
+        pages = cls._list_pages(session, paginated, params, projection)
+        if prefetch:
+            pages = utils.prefetch(pages, prefetch)
+
+        for page in pages:
+            for value in page:
+                yield value
+
+    @classmethod
+    def _list_pages(cls, session, paginated, params, projection=None):
+        """A generator which yields a list of resources per page
+
+        See :meth:`~openstack.resource2.Resource.list` for the arguments.
+
+        :param projection: The attributes to select, if not all.
+        :type projection: :class:`~openstack.projection.Projection`
+        """
+        query_params = cls._list_query(params, projection)
         uri = cls.base_path % params
 
-        while more_data:
+        while query_params is not None:
             resp = session.get(uri, endpoint_filter=cls.service,
                                headers={"Accept": "application/json"},
-                               params=query_params)
-            resp = resp.json()
+                               params=query_params, **cls._cache_args())
+            body = resp.json()
             if cls.resources_key:
-                resp = resp[cls.resources_key]
-
-            if not resp:
-                more_data = False
+                resp = body[cls.resources_key]
+            else:
+                resp, body = body, {}
 
-            # Keep track of how many items we've yielded. If we yielded
-            # less than our limit, we don't need to do an extra request
-            # to get back an empty data set, which acts as a sentinel.
-            yielded = 0
-            new_marker = None
+            page = []
             for data in resp:
                 # Do not allow keys called "self" through. Glance chose
                 # to name a key "self", so we need to pop it out because
@@ -733,17 +987,66 @@ class Resource(object):
                 # argument and is practically a reserved word.
                 data.pop("self", None)
 
-                value = cls.existing(**data)
-                new_marker = value.id
-                yielded += 1
-                yield value
+                page.append(cls._list_item(data, projection))
+
+            yield page
 
             if not paginated:
                 return
-            if "limit" in query_params and yielded < query_params["limit"]:
+            query_params = cls.pagination.next_params(
+                query_params, body, len(page), page[-1] if page else None)
+
+    @classmethod
+    def _list_streamed(cls, session, paginated, params, projection=None):
+        """A generator which yields resources as their data is parsed
+
+        See :meth:`~openstack.resource2.Resource._list_pages` for the
+        arguments.
+        """
+        query_params = cls._list_query(params, projection)
+        uri = cls.base_path % params
+
+        while query_params is not None:
+            resp = session.get(uri, endpoint_filter=cls.service,
+                               headers={"Accept": "application/json"},
+                               params=query_params, stream=True)
+            body = {}
+            count = 0
+            value = None
+            for data in json_codec.stream(resp, cls.resources_key,
+                                          members=body):
+                # See _list_pages for why "self" is dropped.
+                data.pop("self", None)
+                value = cls._list_item(data, projection)
+                count += 1
+                yield value
+
+            if not paginated:
                 return
-            query_params["limit"] = yielded
-            query_params["marker"] = new_marker
+            query_params = cls.pagination.next_params(
+                query_params, body, count, value)
+
+    @classmethod
+    def _list_query(cls, params, projection):
+        """Return the query parameters of list requests"""
+        query_params = cls._query_mapping._transpose(params)
+        if projection is not None and projection.server_side:
+            query_params["fields"] = projection.query()
+        return query_params
+
+    @classmethod
+    def _list_item(cls, data, projection):
+        """Return what is listed for an item of a list response"""
+        if projection is None:
+            return cls.existing(**data)
+        if projection.record is not None:
+            return projection.make_record(data)
+        return cls.existing(**projection.select(data))
+
+    @classmethod
+    def _cache_args(cls):
+        """Return the arguments of requests which may be cached"""
+        return {"cache": True} if cls.cache_responses else {}
 
     @classmethod
     def _get_one_match(cls, name_or_id, results):
@@ -852,6 +1155,120 @@ def wait_for_status(session, resource, status, failures, interval, wait):
     raise exceptions.ResourceTimeout(msg)
 
 
+def wait_for_statuses(session, resources, status, failures, interval, wait,
+                      list_type=None, default_wait=120, **query):
+    """Wait for several resources to be in a particular status.
+
+    Rather than polling each resource with its own GET, every cycle makes
+    a single list call and updates all of the resources still pending from
+    it. The list only needs to page until each of them has been seen.
+    Any resource missing from the list, such as when ``query`` filters it
+    out, is refreshed with its own GET.
+
+    :param session: The session to use for making this request.
+    :type session: :class:`~openstack.session.Session`
+    :param resources: The resources to wait on to reach the status. The
+                      resources must have a status attribute.
+    :type resources: A list of :class:`~openstack.resource2.Resource`
+    :param status: Desired status of the resources.
+    :param list failures: Statuses that would indicate the transition
+                          failed such as 'ERROR'.
+    :param interval: Number of seconds to wait between checks.
+    :param wait: Maximum number of seconds to wait for each transition,
+                 or a dict of them keyed by resource id.
+    :param list_type: The resource type to list with. This defaults to the
+                      type of the first resource, but may be a subclass
+                      that lists more detail, such as one that includes
+                      the status.
+    :param default_wait: Maximum number of seconds to wait for resources
+                         whose id isn't in a dict ``wait``.
+    :param kwargs query: Query parameters and URI attributes passed onto
+                         :meth:`~openstack.resource2.Resource.list`.
+
+    :return: A generator of ``(resource, exception)`` pairs, yielded as
+             each resource is resolved. ``exception`` is ``None`` when the
+             resource reached the status, or else one of
+             :class:`~openstack.exceptions.ResourceFailure`,
+             :class:`~openstack.exceptions.ResourceTimeout` or the
+             :class:`~openstack.exceptions.HttpException`, such as
+             :class:`~openstack.exceptions.NotFoundException`, raised
+             when getting a resource that wasn't listed.
+    :raises: :class:`~AttributeError` if the resources do not have a status
+             attribute
+    """
+    if failures is None:
+        failures = []
+
+    pending = collections.OrderedDict((res.id, res) for res in resources)
+    if not pending:
+        return
+    if list_type is None:
+        list_type = type(next(iter(pending.values())))
+    deadlines = dict(
+        (rid, wait.get(rid, default_wait) if isinstance(wait, dict) else wait)
+        for rid in pending)
+
+    total_sleep = 0
+    errors = {}
+    refresh = False
+    while pending:
+        if refresh:
+            errors = _refresh_statuses(session, list_type, pending, query)
+
+        for rid, res in list(pending.items()):
+            if rid in errors:
+                del pending[rid]
+                yield res, errors[rid]
+            elif res.status == status:
+                del pending[rid]
+                yield res, None
+            elif res.status in failures:
+                del pending[rid]
+                msg = ("Resource %s transitioned to failure state %s" %
+                       (rid, res.status))
+                yield res, exceptions.ResourceFailure(msg)
+
+        if refresh and pending:
+            time.sleep(interval)
+            total_sleep += interval
+
+        for rid, res in list(pending.items()):
+            if total_sleep >= deadlines[rid]:
+                del pending[rid]
+                msg = ("Timeout waiting for %s to transition to %s" %
+                       (rid, status))
+                yield res, exceptions.ResourceTimeout(msg)
+
+        refresh = True
+
+
+def _refresh_statuses(session, list_type, pending, query):
+    """Update the pending resources from a single paginated list call
+
+    :return: A dict of the exceptions raised when getting any resources
+             that weren't listed, keyed by resource id.
+    """
+    unseen = set(pending)
+    for listed in list_type.list(session, paginated=True, **query):
+        res = pending.get(listed.id)
+        if res is None:
+            continue
+        res._body.attributes.update(listed._body.attributes)
+        res._body.clean()
+        unseen.discard(listed.id)
+        if not unseen:
+            break
+
+    errors = {}
+    for rid in unseen:
+        try:
+            pending[rid].get(session)
+        except exceptions.HttpException as e:
+            # Only this resource's wait ends, not everyone else's.
+            errors[rid] = e
+    return errors
+
+
 def wait_for_delete(session, resource, interval, wait):
     """Wait for the resource to be deleted.
 
@@ -0,0 +1,212 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+The :class:`~openstack.response_cache.ResponseCache` keeps the responses of
+GET requests for resources which rarely change, such as flavors, extensions
+and availability zones, so that listing or getting them again doesn't
+request them from the cloud each time.
+
+What is cached
+--------------
+
+A :class:`~openstack.session.Session` with a response cache caches GET
+requests for
+
+* resource classes with ``cache_responses`` set to ``True``, which a few
+  read-mostly ones are by default, and which can be set on any other, e.g.,
+  ``openstack.image.v2.image.Image.cache_responses = True``;
+* every resource of the services in ``service_types``, e.g.,
+  ``service_types=["compute"]`` for everything read through the compute
+  proxy.
+
+Responses are kept for ``ttl`` seconds, and at most ``maxsize`` of them are
+kept, dropping the least recently used. Once a response has expired, it's
+revalidated with a conditional request if the service returned an
+``ETag`` or ``Last-Modified`` header for it, so an unchanged resource isn't
+sent again. Making any other request, e.g., a POST, PUT or DELETE, through
+the session drops the cached responses of that collection, and
+:meth:`~openstack.response_cache.ResponseCache.invalidate` can drop them
+explicitly.
+
+Usage
+-----
+
+Pass a cache to the :class:`~openstack.connection.Connection`::
+
+    from openstack import connection
+    from openstack import response_cache
+
+    cache = response_cache.ResponseCache(ttl=300)
+    conn = connection.Connection(response_cache=cache, **auth_args)
+
+Other implementations can be used as long as they provide the methods of
+:class:`~openstack.response_cache.ResponseCache`.
+"""
+
+import collections
+import threading
+import time
+
+DEFAULT_TTL = 60
+DEFAULT_MAXSIZE = 1000
+
+
+def normalize_url(url):
+    """Return a URL as it's identified in the cache
+
+    Resources request their collections as, e.g., ``/flavors`` but their
+    members as ``flavors/abc``, so leading and trailing slashes are
+    dropped, and the parameters of the query are sorted.
+    """
+    path, _, query = url.partition("?")
+    path = path.strip("/")
+    if query:
+        return path + "?" + "&".join(sorted(query.split("&")))
+    return path
+
+
+class CachedResponse(object):
+
+    def __init__(self, response, expires):
+        """A cached response
+
+        :param response: The response.
+        :type response: :class:`requests.Response`
+        :param float expires: The time the response expires at, as returned
+                              by :func:`time.time`.
+        """
+        self.response = response
+        self.expires = expires
+
+    @property
+    def fresh(self):
+        return self.expires > time.time()
+
+    @property
+    def etag(self):
+        return self.response.headers.get("ETag")
+
+    @property
+    def last_modified(self):
+        return self.response.headers.get("Last-Modified")
+
+
+class ResponseCache(object):
+
+    def __init__(self, ttl=DEFAULT_TTL, maxsize=DEFAULT_MAXSIZE,
+                 service_types=None):
+        """Create an in-memory cache of responses.
+
+        :param int ttl: The number of seconds a response is used for
+                        before it's revalidated or requested again.
+        :param int maxsize: The maximum number of responses kept.
+        :param service_types: The types of the services, e.g., ``compute``,
+                              whose responses are all cached, in addition
+                              to those of resources with
+                              ``cache_responses`` set.
+        :type service_types: list of str
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.service_types = frozenset(service_types or ())
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "revalidated": 0}
+
+    def caches(self, endpoint_filter):
+        """Whether to cache every GET request for a service
+
+        :param endpoint_filter: The filter the request is made with.
+        :type endpoint_filter: :class:`~openstack.service_filter.ServiceFilter`
+        """
+        if not endpoint_filter or not self.service_types:
+            return False
+        return endpoint_filter.get("service_type") in self.service_types
+
+    def get(self, key):
+        """Return the cached response for a request
+
+        :param tuple key: The URL of the request, followed by what else
+                          identifies it.
+
+        :return: A :class:`CachedResponse`, which may have expired, or
+                 ``None`` if there is none.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            # Move the entry to the end, as the most recently used.
+            self._entries[key] = entry
+            if entry.fresh:
+                self._stats["hits"] += 1
+            else:
+                self._stats["misses"] += 1
+            return entry
+
+    def set(self, key, response):
+        """Cache a response for ``ttl`` seconds
+
+        :param tuple key: The URL of the request, followed by what else
+                          identifies it.
+        :param response: The response.
+        :type response: :class:`requests.Response`
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = CachedResponse(response,
+                                                time.time() + self.ttl)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def revalidated(self, key):
+        """Keep a cached response for another ``ttl`` seconds
+
+        This is called when the service has confirmed, e.g., with a
+        ``304 Not Modified`` response, that it hasn't changed.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.expires = time.time() + self.ttl
+                self._stats["revalidated"] += 1
+
+    def invalidate(self, url=None):
+        """Drop cached responses
+
+        :param str url: Drop the responses of requests for this path and
+                        the paths below it, with any query. All responses
+                        are dropped when it's ``None``.
+        """
+        if url is not None:
+            url = normalize_url(url).split("?", 1)[0]
+        with self._lock:
+            if not url:
+                self._entries.clear()
+                return
+            prefixes = (url + "/", url + "?")
+            for key in list(self._entries):
+                path = normalize_url(key[0])
+                if path == url or path.startswith(prefixes):
+                    del self._entries[key]
+
+    def get_stats(self):
+        """Count the requests served from the cache
+
+        :returns: A dict of the number of cache ``hits``, ``misses``,
+                  including expired responses, and of expired responses
+                  which were ``revalidated`` rather than requested again.
+        """
+        with self._lock:
+            return dict(self._stats)
@@ -0,0 +1,156 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+A :class:`~openstack.retry.RetryPolicy` makes a
+:class:`~openstack.session.Session` retry requests which failed for
+transient reasons: a ``502``, ``503`` or ``504`` response, or a connection
+which couldn't be made or was dropped.
+
+Only idempotent requests, i.e., GET, HEAD, PUT and DELETE, are retried by
+default, since it can't be known whether a failed POST was acted on. Each
+retry waits for a random time of up to ``backoff`` seconds, doubled after
+each attempt ("full jitter"), so that many clients failing at once don't
+retry at once. An overall ``deadline`` limits how long a call, including
+its retries, can take.
+
+Usage
+-----
+
+Pass a policy for all requests to the
+:class:`~openstack.connection.Connection`::
+
+    from openstack import connection
+    from openstack import retry
+
+    policy = retry.RetryPolicy(max_attempts=5, deadline=60)
+    conn = connection.Connection(retry_policy=policy, **auth_args)
+
+A different policy can be used for the calls made within a block, e.g.,
+to also retry the POST made to create a server::
+
+    with conn.session.retries(retry.RetryPolicy(retry_post=True)):
+        conn.compute.create_server(**attrs)
+"""
+
+import random
+import threading
+import time
+
+#: The methods retried by default, which can safely be repeated.
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "PUT", "DELETE", "OPTIONS"])
+
+#: The statuses of responses retried by default.
+RETRY_STATUSES = frozenset([502, 503, 504])
+
+_now = getattr(time, "monotonic", time.time)
+
+
+class RetryPolicy(object):
+
+    def __init__(self, max_attempts=4, backoff=0.5, max_backoff=30,
+                 deadline=None, statuses=RETRY_STATUSES, retry_post=False):
+        """Configure the retries of failed requests.
+
+        :param int max_attempts: The most times a request is made,
+                                 including the first.
+        :param float backoff: The most seconds waited before the first
+                              retry, doubled for each later one.
+        :param float max_backoff: The most seconds waited before a retry.
+        :param float deadline: The most seconds a call may take, including
+                               its retries, or ``None`` for no limit.
+                               Each attempt's timeout is reduced to the
+                               time remaining.
+        :param statuses: The response statuses which are retried.
+        :param bool retry_post: Also retry POST and PATCH requests. Only use
+                                this for calls known to be safe to repeat.
+        """
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.statuses = frozenset(statuses)
+        self.methods = IDEMPOTENT_METHODS
+        if retry_post:
+            self.methods = self.methods | frozenset(["POST", "PATCH"])
+
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "retries": 0, "exhausted": 0,
+                       "deadline_exceeded": 0}
+
+    def retries_method(self, method):
+        return method.upper() in self.methods
+
+    def get_delay(self, attempt):
+        """Return the seconds to wait before retrying
+
+        :param int attempt: The number of attempts made so far.
+        """
+        limit = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return random.uniform(0, limit)
+
+    def start(self):
+        """Start a call, returning its :class:`Attempts`"""
+        self._count("calls")
+        return Attempts(self)
+
+    def _count(self, stat):
+        with self._lock:
+            self._stats[stat] += 1
+
+    def get_stats(self):
+        """Count the calls and retries made with this policy
+
+        :returns: A dict of the number of ``calls`` made, the ``retries``
+                  made for them, and how many failed once all attempts were
+                  ``exhausted`` or the ``deadline_exceeded``.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+
+class Attempts(object):
+    """The attempts made for one call under a :class:`RetryPolicy`"""
+
+    def __init__(self, policy):
+        self.policy = policy
+        self.count = 0
+        self._started = _now()
+
+    def remaining(self):
+        """Return the seconds left until the deadline, or ``None``"""
+        if self.policy.deadline is None:
+            return None
+        return self.policy.deadline - (_now() - self._started)
+
+    def next(self):
+        """Record an attempt being made"""
+        self.count += 1
+
+    def retry(self):
+        """Wait before retrying, if another attempt may be made
+
+        :returns: ``True`` once it's time to retry, or ``False`` if the
+                  failure should be raised.
+        """
+        policy = self.policy
+        if self.count >= policy.max_attempts:
+            policy._count("exhausted")
+            return False
+        delay = policy.get_delay(self.count)
+        remaining = self.remaining()
+        if remaining is not None and delay >= remaining:
+            policy._count("deadline_exceeded")
+            return False
+        policy._count("retries")
+        time.sleep(delay)
+        return True
@@ -70,6 +70,9 @@ class ServiceFilter(dict):
     INTERNAL = 'internal'
     ADMIN = 'admin'
     valid_versions = []
+    #: Whether list requests accept ``fields`` query parameters naming the
+    #: only attributes to return. See :mod:`~openstack.projection`.
+    supports_fields = False
 
     def __init__(self, service_type, interface=PUBLIC, region=None,
                  service_name=None, version=None, api_version=None,
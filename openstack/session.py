@@ -17,7 +17,12 @@ mapping KSA exceptions to SDK exceptions.
 
 """
 from collections import namedtuple
+import contextlib
+import datetime
 import logging
+import socket
+import threading
+import time
 
 try:
     from itertools import accumulate
@@ -43,8 +48,14 @@ except ImportError:
 
 from keystoneauth1 import exceptions as _exceptions
 from keystoneauth1 import session as _session
+import requests
+from requests import adapters
+import six
 
 from openstack import exceptions
+from openstack import json_codec as _json_codec
+from openstack import rate_limit
+from openstack import response_cache as _response_cache
 from openstack import utils
 from openstack import version as openstack_version
 
@@ -57,6 +68,58 @@ Version = namedtuple("Version", ["major", "minor"])
 
 _logger = logging.getLogger(__name__)
 
+# urllib3 disables Nagle's algorithm by default, which we keep, and we add
+# TCP keep-alive so idle pooled connections aren't silently dropped.
+_KEEPALIVE_SOCKET_OPTIONS = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+                             (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+
+
+class _KeepAliveAdapter(adapters.HTTPAdapter):
+    """An HTTPAdapter whose connections use TCP keep-alive"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", _KEEPALIVE_SOCKET_OPTIONS)
+        super(_KeepAliveAdapter, self).init_poolmanager(*args, **kwargs)
+
+
+def create_http_session(pool_maxsize=adapters.DEFAULT_POOLSIZE,
+                        pool_block=False, max_retries=0,
+                        pool_connections=adapters.DEFAULT_POOLSIZE,
+                        keepalive=True):
+    """Create a requests session with a configured connection pool
+
+    The returned session can be shared by several
+    :class:`~openstack.session.Session` objects, and so by several
+    connections, to the same cloud so that they reuse each other's
+    connections.
+
+    :param int pool_maxsize: The number of connections kept open to each
+                             host. When more requests than this are made
+                             to a host at once, the connections of the
+                             extra requests are closed afterwards rather
+                             than reused, unless ``pool_block`` is set.
+    :param bool pool_block: When set to ``True``, requests wait for a free
+                            connection rather than opening more than
+                            ``pool_maxsize`` to a host.
+    :param int max_retries: The number of times connecting is retried.
+                            This only retries failed connections, never
+                            requests which reached the server.
+    :param int pool_connections: The number of hosts to keep pools for.
+    :param bool keepalive: When set to ``True``, enable TCP keep-alive on
+                           the pooled connections.
+
+    :rtype: :class:`requests.Session`
+    """
+    adapter_class = _KeepAliveAdapter if keepalive else adapters.HTTPAdapter
+    adapter = adapter_class(pool_connections=pool_connections,
+                            pool_maxsize=pool_maxsize,
+                            max_retries=max_retries,
+                            pool_block=pool_block)
+    http_session = requests.Session()
+    http_session.mount("https://", adapter)
+    http_session.mount("http://", adapter)
+    return http_session
+
 
 def map_exceptions(func):
     def map_exceptions_wrapper(*args, **kwargs):
@@ -81,9 +144,178 @@ def map_exceptions(func):
     return map_exceptions_wrapper
 
 
+def _seconds_until(when):
+    """Return the number of seconds from now until a datetime"""
+    if when.tzinfo is not None:
+        when = (when - when.utcoffset()).replace(tzinfo=None)
+    delta = when - datetime.datetime.utcnow()
+    return delta.days * 86400 + delta.seconds + delta.microseconds / 1e6
+
+
+class _TokenRefresher(threading.Thread):
+    """Renew a session's token in the background before it expires"""
+
+    def __init__(self, session, margin, on_refresh=None, on_failure=None,
+                 retry_interval=30):
+        super(_TokenRefresher, self).__init__(name="token-refresher")
+        self.daemon = True
+        self.session = session
+        self.margin = margin
+        self.on_refresh = on_refresh
+        self.on_failure = on_failure
+        self.retry_interval = retry_interval
+        self._stopped = threading.Event()
+
+    def stop(self):
+        self._stopped.set()
+
+    def run(self):
+        while not self._stopped.is_set():
+            if self._stopped.wait(self._next_refresh()):
+                break
+            self._refresh()
+
+    def _next_refresh(self):
+        """Return the number of seconds to wait before the next refresh"""
+        auth_ref = getattr(self.session.auth, "auth_ref", None)
+        if auth_ref is None:
+            # Not authenticated yet, so do it now rather than on the
+            # first request.
+            return 0
+        if auth_ref.expires is None:
+            # Tokens which don't expire never need refreshing.
+            return None
+        # Wait at least retry_interval so that tokens which are issued
+        # with less than margin left don't keep us refreshing.
+        return max(_seconds_until(auth_ref.expires) - self.margin,
+                   self.retry_interval)
+
+    def _refresh(self):
+        start = time.time()
+        try:
+            auth_ref = self.session.auth.get_auth_ref(self.session)
+        except Exception as e:
+            _logger.warning("Unable to refresh token: %s", e)
+            self._call_hook(self.on_failure, e)
+            # Try again soon, while the current token is still valid.
+            self._stopped.wait(self.retry_interval)
+            return
+
+        # Swapping in the new reference is a single assignment, so
+        # requests made meanwhile use either the old token or the new one.
+        self.session.auth.auth_ref = auth_ref
+        self._call_hook(self.on_refresh, time.time() - start)
+
+    def _call_hook(self, hook, *args):
+        if hook is None:
+            return
+        try:
+            hook(*args)
+        except Exception:
+            _logger.exception("Token refresh hook %s failed", hook)
+
+
+def _freeze(value):
+    """Return a hashable equivalent of a request argument"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class _InFlight(object):
+    """A request which other threads are waiting on the response of"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+
+class _SingleFlight(object):
+    """Share the response of a request with identical concurrent requests
+
+    The first thread to make a request makes it, and any others making
+    the same request before it completes wait for and share its response,
+    or its exception.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self.requests = 0
+        self.coalesced = 0
+
+    def request(self, key, func, on_coalesced=None):
+        with self._lock:
+            self.requests += 1
+            flight = self._in_flight.get(key)
+            if flight is None:
+                flight = self._in_flight[key] = _InFlight()
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            if on_coalesced is not None:
+                on_coalesced()
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.response
+
+        try:
+            flight.response = func()
+            return flight.response
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            flight.done.set()
+
+    def get_stats(self):
+        with self._lock:
+            return {"requests": self.requests, "coalesced": self.coalesced}
+
+
+_UNSET = object()
+
+
+def _throttled_retry_after(status, response):
+    """Return the Retry-After of a response rejected as over a rate limit
+
+    :returns: The number of seconds to wait, ``None`` when the response
+              doesn't say, or ``False`` if it wasn't rate limited.
+    """
+    headers = getattr(response, "headers", None) or {}
+    retry_after = rate_limit.parse_retry_after(headers.get("Retry-After"))
+    if status in rate_limit.THROTTLED_STATUSES:
+        return retry_after
+    if status == rate_limit.OVER_LIMIT_STATUS and retry_after is not None:
+        return retry_after
+    return False
+
+
+def _invalidated_url(url, method):
+    """Return the path of the responses a request may change"""
+    path = _response_cache.normalize_url(url).split("?", 1)[0]
+    if method.upper() == "POST":
+        # Creating a resource within a collection, or an action.
+        return path
+    # Changing or deleting a resource, which may be in its collection's
+    # cached responses too.
+    return path.rsplit("/", 1)[0]
+
+
 class Session(_session.Session):
 
-    def __init__(self, profile, user_agent=None, **kwargs):
+    def __init__(self, profile, user_agent=None, discovery_cache=None,
+                 coalesce_gets=False, response_cache=None, retry_policy=None,
+                 metrics=None, json_codec=None, **kwargs):
         """Create a new Keystone auth session with a profile.
 
         :param profile: If the user has any special profiles such as the
@@ -96,6 +328,34 @@ class Session(_session.Session):
                            is used, which contains the openstacksdk version
                            When a non-None value is passed, it will be
                            prepended to the default.
+        :param discovery_cache: A cache to share discovered endpoints
+                                with other sessions and processes. If not
+                                provided, each session discovers them.
+        :type discovery_cache:
+            :class:`~openstack.discovery_cache.DiscoveryCache`
+        :param bool coalesce_gets: When ``True``, a GET request made while
+                                   an identical one is in flight on another
+                                   thread waits for and shares its response
+                                   rather than being sent as well. See
+                                   :meth:`get_coalesce_stats`.
+        :param response_cache: A cache of the responses of GET requests
+                               for resources which rarely change.
+        :type response_cache:
+            :class:`~openstack.response_cache.ResponseCache`
+        :param retry_policy: The policy by which requests which failed for
+                             transient reasons are retried. By default,
+                             they aren't. See :meth:`retries`.
+        :type retry_policy: :class:`~openstack.retry.RetryPolicy`
+        :param metrics: Where to record the performance of requests. By
+                        default, it isn't recorded.
+        :type metrics: :class:`~openstack.metrics.Metrics`
+        :param json_codec: The codec to encode and decode JSON bodies with,
+                           or the name of one to get with
+                           :func:`~openstack.json_codec.get_codec`, e.g.,
+                           ``"auto"`` for the fastest installed. By
+                           default, the standard :mod:`json` module is
+                           used as :mod:`requests` does.
+        :type json_codec: :class:`~openstack.json_codec.JSONCodec`
         :type profile: :class:`~openstack.profile.Profile`
         """
         if user_agent is not None:
@@ -106,6 +366,16 @@ class Session(_session.Session):
         self.profile = profile
         api_version_header = self._get_api_requests()
         self.endpoint_cache = {}
+        self.discovery_cache = discovery_cache
+        self._token_refresher = None
+        self._single_flight = _SingleFlight() if coalesce_gets else None
+        self.response_cache = response_cache
+        self.retry_policy = retry_policy
+        self.metrics = metrics
+        if isinstance(json_codec, six.string_types):
+            json_codec = _json_codec.get_codec(json_codec)
+        self.json_codec = json_codec
+        self._local = threading.local()
 
         super(Session, self).__init__(user_agent=self.user_agent,
                                       additional_headers=api_version_header,
@@ -124,7 +394,8 @@ class Session(_session.Session):
             return None
 
         req = []
-        for svc in self.profile.get_services():
+        # Services which haven't been used have no API version set.
+        for svc in self.profile._get_loaded_services():
             if svc.service_type and svc.api_version:
                 req.append(" ".join([svc.service_type, svc.api_version]))
         if req:
@@ -241,6 +512,20 @@ class Session(_session.Session):
         raise exceptions.EndpointNotFound(
             "Unable to parse endpoints for %s" % service_type)
 
+    def _get_cached_endpoint_versions(self, service_type, endpoint):
+        """Get available endpoints, using the discovery cache if possible"""
+        if self.discovery_cache is None:
+            return self._get_endpoint_versions(service_type, endpoint)
+
+        key = ("versions", endpoint)
+        cached = self.discovery_cache.get(key)
+        if cached is not None:
+            return self._Endpoint(**cached)
+
+        result = self._get_endpoint_versions(service_type, endpoint)
+        self.discovery_cache.set(key, vars(result))
+        return result
+
     def _parse_version(self, version):
         """Parse the version and return major and minor components
 
@@ -320,7 +605,10 @@ class Session(_session.Session):
 
         Endpoints are cached per service type and interface combination
         so that they're only requested from the remote service once
-        per instance of this class.
+        per instance of this class. When there is a ``discovery_cache``,
+        both the versions found for each catalog endpoint and the
+        resolved endpoints are also kept there, keyed by the auth URL,
+        region, interface and service type they were resolved for.
         """
         key = (service_type, interface)
         if key in self.endpoint_cache:
@@ -340,7 +628,18 @@ class Session(_session.Session):
             self.endpoint_cache[key] = sc_endpoint
             return sc_endpoint
 
-        endpoint = self._get_endpoint_versions(service_type, sc_endpoint)
+        if self.discovery_cache is not None:
+            auth_url = getattr(auth or self.auth, "auth_url", None)
+            discovery_key = ("endpoint", auth_url, filt.region,
+                             filt.interface, service_type, filt.version,
+                             sc_endpoint)
+            match = self.discovery_cache.get(discovery_key)
+            if match is not None:
+                self.endpoint_cache[key] = match
+                return match
+
+        endpoint = self._get_cached_endpoint_versions(service_type,
+                                                      sc_endpoint)
 
         profile_version = self._parse_version(filt.version)
         match = self._get_version_match(endpoint, profile_version,
@@ -349,9 +648,312 @@ class Session(_session.Session):
         _logger.debug("Using %s as %s %s endpoint",
                       match, interface, service_type)
 
+        if self.discovery_cache is not None:
+            self.discovery_cache.set(discovery_key, match)
         self.endpoint_cache[key] = match
         return match
 
+    def start_token_refresh(self, margin=300, on_refresh=None,
+                            on_failure=None, retry_interval=30):
+        """Renew the token in the background shortly before it expires
+
+        Without this, the first request made after the token expires
+        waits while a new one is requested. A daemon thread instead
+        requests a new token ``margin`` seconds before the current one
+        expires and swaps it in, so requests are never held up by
+        authentication.
+
+        :param int margin: The number of seconds before the token expires
+                           that a new one is requested.
+        :param on_refresh: A callable called with the number of seconds
+                           each refresh took.
+        :param on_failure: A callable called with the exception of each
+                           refresh that failed. Failed refreshes are retried
+                           every ``retry_interval`` seconds.
+        :param int retry_interval: The number of seconds to wait before
+                                   retrying a failed refresh, and the least
+                                   time between refreshes.
+        """
+        self.stop_token_refresh()
+        self._token_refresher = _TokenRefresher(
+            self, margin, on_refresh=on_refresh, on_failure=on_failure,
+            retry_interval=retry_interval)
+        self._token_refresher.start()
+
+    def stop_token_refresh(self):
+        """Stop renewing the token started by :meth:`start_token_refresh`"""
+        if self._token_refresher is not None:
+            self._token_refresher.stop()
+            self._token_refresher = None
+
+    def get_coalesce_stats(self):
+        """Count the GET requests shared with identical concurrent ones
+
+        :returns: A dict of the number of GET ``requests`` made with
+                  ``coalesce_gets`` enabled, and how many of them were
+                  ``coalesced``, i.e., shared the response of another
+                  request rather than being sent. ``None`` when coalescing
+                  isn't enabled.
+        """
+        if self._single_flight is None:
+            return None
+        return self._single_flight.get_stats()
+
+    def _request_key(self, url, method, kwargs):
+        """Return what identifies a request whose response may be shared
+
+        Only GET requests without a body, which aren't streamed, can
+        share a response. ``None`` is returned for any others.
+        """
+        if method.upper() != "GET" or kwargs.get("stream"):
+            return None
+        if kwargs.get("json") is not None or kwargs.get("data") is not None:
+            return None
+        key = (_response_cache.normalize_url(url), _freeze(kwargs))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _get_rate_limiter(self, endpoint_filter):
+        if self.profile is None or not endpoint_filter:
+            return None
+        return self.profile.get_rate_limiter(
+            endpoint_filter.get("service_type"))
+
+    def _send_once(self, url, method, kwargs):
+        call = getattr(self._local, "metrics_call", None)
+        if call is None and self.json_codec is None:
+            return super(Session, self).request(url, method, **kwargs)
+        try:
+            response = super(Session, self).request(url, method, **kwargs)
+        except _exceptions.HttpError as e:
+            self._received(call, e.response)
+            raise
+        self._received(call, response)
+        return response
+
+    def _received(self, call, response):
+        if response is None:
+            return
+        if self.json_codec is not None:
+            self.json_codec.attach(response)
+        if call is not None:
+            call.add_response(response)
+
+    def _encode_json(self, kwargs):
+        """Encode a ``json`` body with the session's codec
+
+        Bodies the codec can't encode are left for keystoneauth to encode
+        with the standard module's encoder.
+        """
+        body = kwargs.get("json")
+        if body is None:
+            return
+        try:
+            data = self.json_codec.dumps(body)
+        except (TypeError, ValueError, OverflowError) as e:
+            _logger.debug("Unable to encode body with %s: %s",
+                          self.json_codec.name, e)
+            return
+        headers = dict(kwargs.get("headers") or {})
+        headers.setdefault("Content-Type", "application/json")
+        kwargs["headers"] = headers
+        kwargs["data"] = data
+        del kwargs["json"]
+
+    def _send_limited(self, url, method, kwargs):
+        """Send a request at the pace of its service's rate limiter
+
+        Requests rejected with a ``429`` response, or a ``413`` with a
+        ``Retry-After``, weren't acted on, so they're retried once the
+        service allows it.
+        """
+        limiter = self._get_rate_limiter(kwargs.get("endpoint_filter"))
+        if limiter is None:
+            return self._send_once(url, method, kwargs)
+
+        # Streamed bodies can't be sent again.
+        retries = (0 if hasattr(kwargs.get("data"), "read")
+                   else limiter.max_retries)
+        while True:
+            limiter.acquire()
+            try:
+                response = self._send_once(url, method, kwargs)
+            except _exceptions.HttpError as e:
+                retry_after = _throttled_retry_after(e.http_status,
+                                                     e.response)
+                if retry_after is False:
+                    raise
+                limiter.throttled(retry_after)
+                if e.http_status == 503 or retries <= 0:
+                    raise
+                retries -= 1
+                _logger.debug("Retrying %s %s rejected with %s",
+                              method, url, e.http_status)
+                self._count_event("retries")
+                continue
+
+            retry_after = _throttled_retry_after(response.status_code,
+                                                 response)
+            if retry_after is False:
+                limiter.succeeded()
+            else:
+                limiter.throttled(retry_after)
+            return response
+
+    @contextlib.contextmanager
+    def retries(self, policy):
+        """Use a retry policy for the requests made within a block
+
+        It only applies to requests made by the current thread.
+
+        :param policy: The policy to use instead of ``retry_policy``, or
+                       ``None`` to not retry requests.
+        :type policy: :class:`~openstack.retry.RetryPolicy`
+        """
+        previous = getattr(self._local, "retry_policy", _UNSET)
+        self._local.retry_policy = policy
+        try:
+            yield policy
+        finally:
+            if previous is _UNSET:
+                del self._local.retry_policy
+            else:
+                self._local.retry_policy = previous
+
+    def _get_retry_policy(self):
+        policy = getattr(self._local, "retry_policy", _UNSET)
+        return self.retry_policy if policy is _UNSET else policy
+
+    def _send_retrying(self, url, method, kwargs):
+        """Send a request, retrying it as the retry policy allows"""
+        policy = self._get_retry_policy()
+        if (policy is None or not policy.retries_method(method) or
+                hasattr(kwargs.get("data"), "read")):
+            return self._send_limited(url, method, kwargs)
+
+        attempts = policy.start()
+        while True:
+            attempts.next()
+            attempt_kwargs = kwargs
+            remaining = attempts.remaining()
+            if remaining is not None:
+                timeout = kwargs.get("timeout", self.timeout)
+                if timeout is None or timeout > remaining:
+                    attempt_kwargs = dict(kwargs,
+                                          timeout=max(remaining, 0.001))
+
+            try:
+                response = self._send_limited(url, method, attempt_kwargs)
+            except _exceptions.HttpError as e:
+                if e.http_status not in policy.statuses:
+                    raise
+                failure = e.http_status
+                if not attempts.retry():
+                    raise
+            except _exceptions.RetriableConnectionFailure as e:
+                failure = e
+                if not attempts.retry():
+                    raise
+            else:
+                if response.status_code not in policy.statuses:
+                    return response
+                failure = response.status_code
+                if not attempts.retry():
+                    return response
+
+            _logger.debug("Retrying %s %s after attempt %d failed: %s",
+                          method, url, attempts.count, failure)
+            self._count_event("retries")
+
+    def _send(self, url, method, kwargs):
+        if self._single_flight is not None:
+            key = self._request_key(url, method, kwargs)
+            if key is not None:
+                return self._single_flight.request(
+                    key, lambda: self._send_retrying(url, method, kwargs),
+                    on_coalesced=lambda: self._count_event("coalesced"))
+        return self._send_retrying(url, method, kwargs)
+
+    def _send_cached(self, key, url, method, kwargs):
+        entry = self.response_cache.get(key)
+        if entry is not None and entry.fresh:
+            self._count_event("cache_hits")
+            return entry.response
+
+        if entry is not None and (entry.etag or entry.last_modified):
+            headers = dict(kwargs.get("headers") or {})
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+            kwargs = dict(kwargs, headers=headers)
+
+        response = self._send(url, method, kwargs)
+        if entry is not None and response.status_code == 304:
+            self.response_cache.revalidated(key)
+            return entry.response
+        if response.status_code == 200:
+            self.response_cache.set(key, response)
+        return response
+
     @map_exceptions
-    def request(self, *args, **kwargs):
-        return super(Session, self).request(*args, **kwargs)
+    def request(self, url, method, cache=None, **kwargs):
+        """Send a request
+
+        See :meth:`keystoneauth1.session.Session.request` for the
+        arguments.
+
+        :param bool cache: Whether the response of a GET request may be
+                           served from and stored in the ``response_cache``.
+                           By default, it's only cached for the cache's
+                           ``service_types``.
+        """
+        if self.metrics is None:
+            return self._request(url, method, cache, kwargs)
+
+        endpoint_filter = kwargs.get("endpoint_filter")
+        call = self.metrics.start(
+            endpoint_filter.get("service_type") if endpoint_filter else None,
+            method)
+        previous = getattr(self._local, "metrics_call", None)
+        self._local.metrics_call = call
+        status = "error"
+        try:
+            response = self._request(url, method, cache, kwargs)
+            status = response.status_code
+            return response
+        except _exceptions.HttpError as e:
+            status = e.http_status
+            raise
+        finally:
+            self._local.metrics_call = previous
+            call.finish(status)
+
+    def _count_event(self, event):
+        call = getattr(self._local, "metrics_call", None)
+        if call is not None:
+            call.count(event)
+
+    def _request(self, url, method, cache, kwargs):
+        if self.json_codec is not None:
+            self._encode_json(kwargs)
+
+        if self.response_cache is None:
+            return self._send(url, method, kwargs)
+
+        if method.upper() not in ("GET", "HEAD"):
+            try:
+                return self._send(url, method, kwargs)
+            finally:
+                self.response_cache.invalidate(
+                    _invalidated_url(url, method))
+
+        if cache is None:
+            cache = self.response_cache.caches(kwargs.get("endpoint_filter"))
+        key = self._request_key(url, method, kwargs) if cache else None
+        if key is None:
+            return self._send(url, method, kwargs)
+        return self._send_cached(key, url, method, kwargs)
@@ -44,6 +44,17 @@ class TestVolumeProxy(test_proxy_base2.TestProxyBase):
         self.verify_delete(self.proxy.delete_snapshot,
                            snapshot.Snapshot, False)
 
+    def test_snapshot_delete_many(self):
+        self._verify2('openstack.proxy2.BaseProxy._delete_many',
+                      self.proxy.delete_snapshots,
+                      method_args=[["a", "b"]],
+                      method_kwargs={'wait_for_delete': True},
+                      expected_args=[snapshot.Snapshot, ["a", "b"]],
+                      expected_kwargs={'concurrency': 4,
+                                       'ignore_missing': True,
+                                       'wait_for_delete': True,
+                                       'interval': 2, 'wait': 120})
+
     def test_snapshot_delete_ignore(self):
         self.verify_delete(self.proxy.delete_snapshot,
                            snapshot.Snapshot, True)
@@ -84,5 +95,26 @@ class TestVolumeProxy(test_proxy_base2.TestProxyBase):
     def test_volume_delete(self):
         self.verify_delete(self.proxy.delete_volume, volume.Volume, False)
 
+    def test_volume_delete_many(self):
+        self._verify2('openstack.proxy2.BaseProxy._delete_many',
+                      self.proxy.delete_volumes,
+                      method_args=[["a", "b"]],
+                      method_kwargs={'wait_for_delete': True},
+                      expected_args=[volume.Volume, ["a", "b"]],
+                      expected_kwargs={'concurrency': 4,
+                                       'ignore_missing': True,
+                                       'wait_for_delete': True,
+                                       'interval': 2, 'wait': 120})
+
     def test_volume_delete_ignore(self):
         self.verify_delete(self.proxy.delete_volume, volume.Volume, True)
+
+    def test_wait_for_volumes(self):
+        values = [volume.Volume(id='1234')]
+        self._verify2('openstack.proxy2.BaseProxy.wait_for_statuses',
+                      self.proxy.wait_for_volumes,
+                      method_args=[values],
+                      expected_args=[values, 'available'],
+                      expected_kwargs={'failures': ['error'],
+                                       'interval': 2, 'wait': 120,
+                                       'list_type': volume.VolumeDetail})
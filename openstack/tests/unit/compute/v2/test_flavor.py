@@ -43,6 +43,7 @@ class TestFlavor(testtools.TestCase):
         self.assertTrue(sot.allow_delete)
         self.assertTrue(sot.allow_list)
         self.assertFalse(sot.allow_update)
+        self.assertEqual("flavors_links", sot.pagination.key)
 
         self.assertDictEqual({"sort_key": "sort_key",
                               "sort_dir": "sort_dir",
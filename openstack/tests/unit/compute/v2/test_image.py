@@ -49,6 +49,7 @@ class TestImage(testtools.TestCase):
         self.assertFalse(sot.allow_update)
         self.assertTrue(sot.allow_delete)
         self.assertTrue(sot.allow_list)
+        self.assertEqual("images_links", sot.pagination.key)
 
         self.assertDictEqual({"server": "server",
                               "name": "name",
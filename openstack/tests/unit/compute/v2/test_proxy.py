@@ -205,6 +205,17 @@ class TestComputeProxy(test_proxy_base2.TestProxyBase):
     def test_server_delete(self):
         self.verify_delete(self.proxy.delete_server, server.Server, False)
 
+    def test_server_delete_many(self):
+        self._verify2('openstack.proxy2.BaseProxy._delete_many',
+                      self.proxy.delete_servers,
+                      method_args=[["a", "b"]],
+                      method_kwargs={'wait_for_delete': True},
+                      expected_args=[server.Server, ["a", "b"]],
+                      expected_kwargs={'concurrency': 4,
+                                       'ignore_missing': True,
+                                       'wait_for_delete': True,
+                                       'interval': 2, 'wait': 120})
+
     def test_server_delete_ignore(self):
         self.verify_delete(self.proxy.delete_server, server.Server, True)
 
@@ -244,6 +255,18 @@ class TestComputeProxy(test_proxy_base2.TestProxyBase):
             method_args=[value],
             expected_args=[value, 'ACTIVE', ['ERROR'], 2, 120])
 
+    def test_wait_for_servers(self):
+        values = [server.Server(id='1234'), server.Server(id='5678')]
+        self._verify2('openstack.proxy2.BaseProxy.wait_for_statuses',
+                      self.proxy.wait_for_servers,
+                      method_args=[values],
+                      method_kwargs={'name': 'test'},
+                      expected_args=[values, 'ACTIVE'],
+                      expected_kwargs={'failures': ['ERROR'],
+                                       'interval': 2, 'wait': 120,
+                                       'list_type': server.ServerDetail,
+                                       'name': 'test'})
+
     def test_server_resize(self):
         self._verify("openstack.compute.v2.server.Server.resize",
                      self.proxy.resize_server,
@@ -76,6 +76,7 @@ class TestServer(testtools.TestCase):
         self.assertTrue(sot.allow_update)
         self.assertTrue(sot.allow_delete)
         self.assertTrue(sot.allow_list)
+        self.assertEqual("servers_links", sot.pagination.key)
 
         self.assertDictEqual({"image": "image",
                               "flavor": "flavor",
@@ -70,6 +70,14 @@ class TestIdentityProxy(test_proxy_base.TestProxyBase):
     def test_user_delete(self):
         self.verify_delete(self.proxy.delete_user, user.User, False)
 
+    def test_user_delete_many(self):
+        self._verify2('openstack.proxy.BaseProxy._delete_many',
+                      self.proxy.delete_users,
+                      method_args=[["a", "b"]],
+                      expected_args=[user.User, ["a", "b"]],
+                      expected_kwargs={'concurrency': 4,
+                                       'ignore_missing': True})
+
     def test_user_delete_ignore(self):
         self.verify_delete(self.proxy.delete_user, user.User, True)
 
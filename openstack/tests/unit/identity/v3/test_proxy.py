@@ -147,6 +147,14 @@ class TestIdentityProxy(test_proxy_base2.TestProxyBase):
     def test_project_delete(self):
         self.verify_delete(self.proxy.delete_project, project.Project, False)
 
+    def test_project_delete_many(self):
+        self._verify2('openstack.proxy2.BaseProxy._delete_many',
+                      self.proxy.delete_projects,
+                      method_args=[["a", "b"]],
+                      expected_args=[project.Project, ["a", "b"]],
+                      expected_kwargs={'concurrency': 4,
+                                       'ignore_missing': True})
+
     def test_project_delete_ignore(self):
         self.verify_delete(self.proxy.delete_project, project.Project, True)
 
@@ -189,6 +197,14 @@ class TestIdentityProxy(test_proxy_base2.TestProxyBase):
     def test_user_delete(self):
         self.verify_delete(self.proxy.delete_user, user.User, False)
 
+    def test_user_delete_many(self):
+        self._verify2('openstack.proxy2.BaseProxy._delete_many',
+                      self.proxy.delete_users,
+                      method_args=[["a", "b"]],
+                      expected_args=[user.User, ["a", "b"]],
+                      expected_kwargs={'concurrency': 4,
+                                       'ignore_missing': True})
+
     def test_user_delete_ignore(self):
         self.verify_delete(self.proxy.delete_user, user.User, True)
 
@@ -98,6 +98,7 @@ class TestImage(testtools.TestCase):
         self.assertTrue(sot.allow_update)
         self.assertTrue(sot.allow_delete)
         self.assertTrue(sot.allow_list)
+        self.assertEqual("next", sot.pagination.key)
 
     def test_make_it(self):
         sot = image.Image(**EXAMPLE)
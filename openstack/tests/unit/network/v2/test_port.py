@@ -58,6 +58,7 @@ class TestPort(testtools.TestCase):
         self.assertTrue(sot.allow_update)
         self.assertTrue(sot.allow_delete)
         self.assertTrue(sot.allow_list)
+        self.assertTrue(sot.allow_bulk_create)
 
     def test_make_it(self):
         sot = port.Port(EXAMPLE)
@@ -281,9 +281,26 @@ class TestNetworkProxy(test_proxy_base.TestProxyBase):
     def test_network_create_attrs(self):
         self.verify_create(self.proxy.create_network, network.Network)
 
+    def test_networks_create(self):
+        data = [{'name': 'a'}, {'name': 'b'}]
+        self._verify2('openstack.proxy.BaseProxy._bulk_create',
+                      self.proxy.create_networks,
+                      method_args=[data],
+                      expected_args=[network.Network, data],
+                      expected_kwargs={'batch_size': 100,
+                                       'concurrency': 4})
+
     def test_network_delete(self):
         self.verify_delete(self.proxy.delete_network, network.Network, False)
 
+    def test_network_delete_many(self):
+        self._verify2('openstack.proxy.BaseProxy._delete_many',
+                      self.proxy.delete_networks,
+                      method_args=[["a", "b"]],
+                      expected_args=[network.Network, ["a", "b"]],
+                      expected_kwargs={'concurrency': 4,
+                                       'ignore_missing': True})
+
     def test_network_delete_ignore(self):
         self.verify_delete(self.proxy.delete_network, network.Network, True)
 
@@ -420,9 +437,26 @@ class TestNetworkProxy(test_proxy_base.TestProxyBase):
     def test_port_create_attrs(self):
         self.verify_create(self.proxy.create_port, port.Port)
 
+    def test_ports_create(self):
+        data = [{'name': 'a'}, {'name': 'b'}]
+        self._verify2('openstack.proxy.BaseProxy._bulk_create',
+                      self.proxy.create_ports,
+                      method_args=[data],
+                      expected_args=[port.Port, data],
+                      expected_kwargs={'batch_size': 100,
+                                       'concurrency': 4})
+
     def test_port_delete(self):
         self.verify_delete(self.proxy.delete_port, port.Port, False)
 
+    def test_port_delete_many(self):
+        self._verify2('openstack.proxy.BaseProxy._delete_many',
+                      self.proxy.delete_ports,
+                      method_args=[["a", "b"]],
+                      expected_args=[port.Port, ["a", "b"]],
+                      expected_kwargs={'concurrency': 4,
+                                       'ignore_missing': True})
+
     def test_port_delete_ignore(self):
         self.verify_delete(self.proxy.delete_port, port.Port, True)
 
@@ -435,6 +469,20 @@ class TestNetworkProxy(test_proxy_base.TestProxyBase):
     def test_ports(self):
         self.verify_list(self.proxy.ports, port.Port, paginated=False)
 
+    def test_ports_prefetch(self):
+        full_page = mock.Mock()
+        full_page.json.return_value = {'ports': [{'id': 'a'}, {'id': 'b'}]}
+        last_page = mock.Mock()
+        last_page.json.return_value = {'ports': [{'id': 'c'}]}
+        self.session.get.side_effect = [full_page, last_page]
+
+        ports = list(self.proxy.ports(prefetch=2, limit=2))
+
+        self.assertEqual(['a', 'b', 'c'], [obj.id for obj in ports])
+        self.assertEqual(
+            [{'limit': 2}, {'limit': 2, 'marker': 'b'}],
+            [call[1]['params'] for call in self.session.get.call_args_list])
+
     def test_port_update(self):
         self.verify_update(self.proxy.update_port, port.Port)
 
@@ -684,6 +732,14 @@ class TestNetworkProxy(test_proxy_base.TestProxyBase):
         self.verify_delete(self.proxy.delete_security_group,
                            security_group.SecurityGroup, False)
 
+    def test_security_group_delete_many(self):
+        self._verify2('openstack.proxy.BaseProxy._delete_many',
+                      self.proxy.delete_security_groups,
+                      method_args=[["a", "b"]],
+                      expected_args=[security_group.SecurityGroup, ["a", "b"]],
+                      expected_kwargs={'concurrency': 4,
+                                       'ignore_missing': True})
+
     def test_security_group_delete_ignore(self):
         self.verify_delete(self.proxy.delete_security_group,
                            security_group.SecurityGroup, True)
@@ -750,6 +806,16 @@ class TestNetworkProxy(test_proxy_base.TestProxyBase):
         self.verify_create(self.proxy.create_security_group_rule,
                            security_group_rule.SecurityGroupRule)
 
+    def test_security_group_rules_create(self):
+        data = [{'name': 'a'}, {'name': 'b'}]
+        self._verify2('openstack.proxy.BaseProxy._bulk_create',
+                      self.proxy.create_security_group_rules,
+                      method_args=[data],
+                      expected_args=[security_group_rule.SecurityGroupRule,
+                                     data],
+                      expected_kwargs={'batch_size': 100,
+                                       'concurrency': 4})
+
     def test_security_group_rule_delete(self):
         self.verify_delete(self.proxy.delete_security_group_rule,
                            security_group_rule.SecurityGroupRule, False)
@@ -795,9 +861,26 @@ class TestNetworkProxy(test_proxy_base.TestProxyBase):
     def test_subnet_create_attrs(self):
         self.verify_create(self.proxy.create_subnet, subnet.Subnet)
 
+    def test_subnets_create(self):
+        data = [{'name': 'a'}, {'name': 'b'}]
+        self._verify2('openstack.proxy.BaseProxy._bulk_create',
+                      self.proxy.create_subnets,
+                      method_args=[data],
+                      expected_args=[subnet.Subnet, data],
+                      expected_kwargs={'batch_size': 100,
+                                       'concurrency': 4})
+
     def test_subnet_delete(self):
         self.verify_delete(self.proxy.delete_subnet, subnet.Subnet, False)
 
+    def test_subnet_delete_many(self):
+        self._verify2('openstack.proxy.BaseProxy._delete_many',
+                      self.proxy.delete_subnets,
+                      method_args=[["a", "b"]],
+                      expected_args=[subnet.Subnet, ["a", "b"]],
+                      expected_kwargs={'concurrency': 4,
+                                       'ignore_missing': True})
+
     def test_subnet_delete_ignore(self):
         self.verify_delete(self.proxy.delete_subnet, subnet.Subnet, True)
 
@@ -46,6 +46,7 @@ class TestSecurityGroupRule(testtools.TestCase):
         self.assertFalse(sot.allow_update)
         self.assertTrue(sot.allow_delete)
         self.assertTrue(sot.allow_list)
+        self.assertTrue(sot.allow_bulk_create)
 
     def test_make_it(self):
         sot = security_group_rule.SecurityGroupRule(EXAMPLE)
@@ -52,6 +52,7 @@ class TestSubnet(testtools.TestCase):
         self.assertTrue(sot.allow_update)
         self.assertTrue(sot.allow_delete)
         self.assertTrue(sot.allow_list)
+        self.assertTrue(sot.allow_bulk_create)
 
     def test_make_it(self):
         sot = subnet.Subnet(EXAMPLE)
@@ -66,6 +66,20 @@ class TestObjectStoreProxy(test_proxy_base.TestProxyBase):
     def test_object_delete_ignore(self):
         self._test_object_delete(True)
 
+    def test_object_delete_many(self):
+        named = obj.Object.new(name="b", container="other")
+        with mock.patch("openstack.proxy.BaseProxy._delete_many") as mocked:
+            self.proxy.delete_objects(["a", named], container="name")
+
+        args, kwargs = mocked.call_args
+        self.assertEqual(obj.Object, args[0])
+        self.assertEqual([("a", "name"), ("b", "other")],
+                         [(o.name, o.container) for o in args[1]])
+        self.assertEqual({"concurrency": 4, "ignore_missing": True}, kwargs)
+
+    def test_object_delete_many_no_container(self):
+        self.assertRaises(ValueError, self.proxy.delete_objects, ["a"])
+
     def test_object_create_attrs(self):
         path_args = {"path_args": {"container": "name"}}
         method_kwargs = {"name": "test", "data": "data", "container": "name"}
@@ -0,0 +1,222 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import mock
+import testtools
+
+from openstack import exceptions
+from openstack import proxy2
+from openstack import resource2
+from openstack import session
+from openstack.tests.unit import base
+
+try:
+    import asyncio
+
+    from openstack import asynchronous
+except ImportError:
+    asynchronous = None
+
+
+class FakeResource(resource2.Resource):
+    base_path = "/fakes"
+    resources_key = "fakes"
+    allow_list = True
+
+    name = resource2.Body("name")
+
+
+class UnlistableResource(resource2.Resource):
+    base_path = "/unlistable"
+
+
+@testtools.skipIf(asynchronous is None, "asyncio is not available")
+class AsyncTestCase(base.TestCase):
+
+    def setUp(self):
+        super(AsyncTestCase, self).setUp()
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+        self.session = mock.Mock(spec=session.Session)
+        self.sot = asynchronous.AsyncSession(self.session, max_workers=4,
+                                             loop=self.loop)
+        self.addCleanup(self.sot.close)
+
+    def run_async(self, awaitable):
+        return self.loop.run_until_complete(
+            asyncio.ensure_future(awaitable, loop=self.loop))
+
+    def collect(self, aiterable):
+        """Iterate asynchronously, as ``async for`` would"""
+        iterator = aiterable.__aiter__()
+        items = []
+        while True:
+            try:
+                items.append(self.run_async(iterator.__anext__()))
+            except asynchronous._StopAsyncIteration:
+                return items
+
+
+class TestAsyncSession(AsyncTestCase):
+
+    def test_run(self):
+        func = mock.Mock(return_value="result")
+
+        result = self.sot.run(func, 1, two=2)
+
+        # Nothing is called until the result is awaited.
+        self.assertFalse(func.called)
+        self.assertEqual("result", self.run_async(result))
+        func.assert_called_once_with(1, two=2)
+
+    def test_run_awaited_twice(self):
+        func = mock.Mock(return_value="result")
+        result = self.sot.run(func)
+
+        self.assertEqual("result", self.run_async(result))
+        self.assertEqual("result", self.run_async(result))
+        func.assert_called_once_with()
+
+    def test_run_raises(self):
+        func = mock.Mock(side_effect=exceptions.NotFoundException("gone"))
+
+        self.assertRaises(exceptions.NotFoundException,
+                          self.run_async, self.sot.run(func))
+
+    def test_requests(self):
+        for method in ("get", "head", "post", "put", "patch", "delete"):
+            self.session.request.reset_mock()
+            self.session.request.return_value = method
+
+            result = self.run_async(
+                getattr(self.sot, method)("/uri", json={"a": 1}))
+
+            self.assertEqual(method, result)
+            self.session.request.assert_called_once_with(
+                "/uri", method.upper(), json={"a": 1})
+
+    def test_resource_operations(self):
+        res = mock.Mock()
+        res.create.return_value = "created"
+        res.get.return_value = "got"
+        res.update.return_value = "updated"
+        res.delete.return_value = "deleted"
+
+        self.assertEqual("created",
+                         self.run_async(self.sot.create_resource(res)))
+        res.create.assert_called_once_with(self.session, prepend_key=True)
+        self.assertEqual("got", self.run_async(self.sot.get_resource(res)))
+        res.get.assert_called_once_with(self.session, requires_id=True)
+        self.assertEqual("updated",
+                         self.run_async(self.sot.update_resource(res)))
+        res.update.assert_called_once_with(self.session, prepend_key=True,
+                                           has_body=True)
+        self.assertEqual("deleted",
+                         self.run_async(self.sot.delete_resource(res)))
+        res.delete.assert_called_once_with(self.session)
+
+    def test_list_resources(self):
+        responses = [{"fakes": [{"id": "1"}, {"id": "2"}]},
+                     {"fakes": [{"id": "3"}]}]
+        self.session.get.side_effect = [
+            mock.Mock(json=mock.Mock(return_value=r)) for r in responses]
+
+        result = self.collect(self.sot.list_resources(FakeResource,
+                                                      paginated=True))
+
+        self.assertEqual(["1", "2", "3"], [r.id for r in result])
+        self.assertTrue(all(isinstance(r, FakeResource) for r in result))
+        self.assertEqual(2, self.session.get.call_count)
+
+    def test_list_resources_not_allowed(self):
+        self.assertRaises(exceptions.MethodNotSupported, self.collect,
+                          self.sot.list_resources(UnlistableResource))
+
+    def test_list_resources_raises(self):
+        self.session.get.side_effect = exceptions.HttpException("boom")
+
+        self.assertRaises(exceptions.HttpException, self.collect,
+                          self.sot.list_resources(FakeResource))
+
+    def test_iterate_batches(self):
+        self.sot.batch_size = 2
+
+        result = self.collect(self.sot.run(lambda: (i for i in range(5))))
+
+        self.assertEqual([0, 1, 2, 3, 4], result)
+
+    def test_iterate_list(self):
+        self.assertEqual([1, 2], self.collect(self.sot.run(lambda: [1, 2])))
+
+    def test_iterate_empty(self):
+        self.assertEqual([], self.collect(self.sot.run(lambda: iter([]))))
+
+    def test_running_loop(self):
+        # Made before the loop runs, as is usual outside of asyncio.run.
+        sot = asynchronous.AsyncSession(self.session, max_workers=1)
+        self.addCleanup(sot.close)
+
+        self.assertEqual("result", self.run_async(sot.run(lambda: "result")))
+
+    def test_close_owned_executor(self):
+        executor = mock.Mock()
+        sot = asynchronous.AsyncSession(self.session, executor=executor,
+                                        loop=self.loop)
+        sot.close()
+        self.assertFalse(executor.shutdown.called)
+
+
+@testtools.skipIf(asynchronous is None, "asyncio is not available")
+class TestAsyncConnection(AsyncTestCase):
+
+    def setUp(self):
+        super(TestAsyncConnection, self).setUp()
+        self.proxy = proxy2.BaseProxy(self.session)
+        self.connection = mock.Mock(session=self.session,
+                                    compute=self.proxy,
+                                    version="1.0")
+        self.sot = asynchronous.AsyncConnection(self.connection,
+                                                max_workers=4,
+                                                loop=self.loop)
+        self.addCleanup(self.sot.close)
+
+    def test_proxy_is_wrapped(self):
+        compute = self.sot.compute
+
+        self.assertIsInstance(compute, asynchronous.AsyncProxy)
+        self.assertIs(compute, self.sot.compute)
+
+    def test_other_attributes(self):
+        self.assertEqual("1.0", self.sot.version)
+
+    def test_proxy_method(self):
+        with mock.patch.object(self.proxy, "_get",
+                               return_value="server") as mock_get:
+            result = self.sot.compute._get(FakeResource, "id")
+
+            self.assertEqual("server", self.run_async(result))
+            mock_get.assert_called_once_with(FakeResource, "id")
+
+    def test_proxy_method_raises(self):
+        with mock.patch.object(
+                self.proxy, "_get",
+                side_effect=exceptions.ResourceNotFound("gone")):
+            self.assertRaises(exceptions.ResourceNotFound, self.run_async,
+                              self.sot.compute._get(FakeResource, "id"))
+
+    def test_proxy_generator(self):
+        self.session.get.return_value = mock.Mock(json=mock.Mock(
+            return_value={"fakes": [{"id": "1"}, {"id": "2"}]}))
+
+        result = self.collect(self.sot.compute._list(FakeResource))
+
+        self.assertEqual(["1", "2"], [r.id for r in result])
@@ -0,0 +1,135 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import datetime
+import os
+import stat
+import threading
+import time
+
+import fixtures
+from keystoneauth1 import access
+from keystoneauth1 import fixture
+from keystoneauth1.identity import v3
+import mock
+import testtools
+
+from openstack import auth_cache
+from openstack.tests.unit import base
+
+
+class TestAuthCache(base.TestCase):
+
+    def setUp(self):
+        super(TestAuthCache, self).setUp()
+        self.directory = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, "auth")
+        self.sot = auth_cache.AuthCache(self.directory)
+        self.session = mock.Mock()
+
+    def _plugin(self, password="secret", expires_in=3600):
+        plugin = v3.Password(auth_url="http://keystone/v3",
+                             username="user", password=password,
+                             user_domain_id="default",
+                             project_name="project",
+                             project_domain_id="default")
+        expires = (datetime.datetime.utcnow() +
+                   datetime.timedelta(seconds=expires_in))
+        token = fixture.V3Token(expires=expires)
+        plugin.get_auth_ref = mock.Mock(
+            return_value=access.create(body=token, auth_token="token"))
+        return plugin
+
+    def test_default_directory(self):
+        self.useFixture(fixtures.EnvironmentVariable("XDG_CACHE_HOME",
+                                                     "/cache"))
+        self.assertEqual("/cache/openstack/auth",
+                         auth_cache.AuthCache().directory)
+
+    def test_authenticate_and_reuse(self):
+        first = self._plugin()
+        self.assertFalse(self.sot.authenticate(first, self.session))
+        first.get_auth_ref.assert_called_once_with(self.session)
+
+        second = self._plugin()
+        self.assertTrue(
+            auth_cache.AuthCache(self.directory).authenticate(
+                second, self.session))
+        self.assertFalse(second.get_auth_ref.called)
+        self.assertEqual("token", second.auth_ref.auth_token)
+
+    def test_permissions(self):
+        self.sot.authenticate(self._plugin(), self.session)
+
+        self.assertEqual(0o700,
+                         stat.S_IMODE(os.stat(self.directory).st_mode))
+        for name in os.listdir(self.directory):
+            mode = os.stat(os.path.join(self.directory, name)).st_mode
+            self.assertEqual(0o600, stat.S_IMODE(mode))
+
+    def test_other_credentials(self):
+        self.sot.authenticate(self._plugin(), self.session)
+
+        other = self._plugin(password="other")
+        self.assertFalse(self.sot.authenticate(other, self.session))
+        other.get_auth_ref.assert_called_once_with(self.session)
+
+    def test_expiring(self):
+        self.sot.authenticate(self._plugin(expires_in=60), self.session)
+
+        plugin = self._plugin()
+        self.assertFalse(self.sot.authenticate(plugin, self.session))
+        plugin.get_auth_ref.assert_called_once_with(self.session)
+
+    def test_unreadable_state(self):
+        plugin = self._plugin()
+        self.sot.authenticate(plugin, self.session)
+        with open(self.sot._get_path(plugin), "w") as state_file:
+            state_file.write("{not json")
+
+        plugin = self._plugin()
+        self.assertFalse(self.sot.authenticate(plugin, self.session))
+        plugin.get_auth_ref.assert_called_once_with(self.session)
+
+    def test_not_cacheable(self):
+        plugin = mock.Mock()
+        plugin.get_cache_id.return_value = None
+
+        self.assertFalse(self.sot.authenticate(plugin, self.session))
+        self.assertFalse(plugin.get_access.called)
+        self.assertFalse(os.path.exists(self.directory))
+
+    @testtools.skipIf(auth_cache.fcntl is None, "No file locking")
+    def test_single_authentication(self):
+        def slow(auth_ref):
+            def get_auth_ref(session):
+                time.sleep(0.1)
+                return auth_ref
+            return get_auth_ref
+
+        plugins = [self._plugin() for i in range(4)]
+        for plugin in plugins:
+            plugin.get_auth_ref.side_effect = slow(
+                plugin.get_auth_ref.return_value)
+
+        threads = [threading.Thread(target=self.sot.authenticate,
+                                    args=(plugin, self.session))
+                   for plugin in plugins]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(1, sum(plugin.get_auth_ref.call_count
+                                for plugin in plugins))
+        for plugin in plugins:
+            self.assertEqual("token", plugin.auth_ref.auth_token)
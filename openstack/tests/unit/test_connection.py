@@ -11,6 +11,8 @@
 # under the License.
 
 import os
+import threading
+import time
 
 import fixtures
 from keystoneauth1 import session as ksa_session
@@ -19,6 +21,7 @@ import os_client_config
 
 from openstack import connection
 from openstack import exceptions
+from openstack import metrics
 from openstack import profile
 from openstack import session
 from openstack.tests.unit import base
@@ -55,6 +58,14 @@ clouds:
       project_name: {project}
     cacert: {cacert}
     insecure: False
+  pooled:
+    auth:
+      auth_url: {auth_url}
+      username: {username}
+      password: {password}
+      project_name: {project}
+    pool_maxsize: 32
+    pool_block: True
 """.format(auth_url=CONFIG_AUTH_URL, username=CONFIG_USERNAME,
            password=CONFIG_PASSWORD, project=CONFIG_PROJECT,
            cacert=CONFIG_CACERT)
@@ -66,16 +77,57 @@ class TestConnection(base.TestCase):
         mock_session_init.return_value = mock_session_init
         mock_profile = mock.Mock()
         mock_profile.get_services = mock.Mock(return_value=[])
+        mock_profile.service_keys = []
         conn = connection.Connection(profile=mock_profile, authenticator='2',
-                                     verify=True, cert='cert', user_agent='1')
-        args = {'auth': '2', 'user_agent': '1', 'verify': True, 'cert': 'cert'}
+                                     verify=True, cert='cert', user_agent='1',
+                                     discovery_cache='3', coalesce_gets=True,
+                                     response_cache='4', retry_policy='5',
+                                     metrics='6', json_codec='7')
+        args = {'auth': '2', 'user_agent': '1', 'verify': True, 'cert': 'cert',
+                'discovery_cache': '3', 'session': None,
+                'coalesce_gets': True, 'response_cache': '4',
+                'retry_policy': '5', 'metrics': '6', 'json_codec': '7'}
         mock_session_init.assert_called_with(mock_profile, **args)
         self.assertEqual(mock_session_init, conn.session)
 
+    def test_stats(self):
+        recorded = metrics.Metrics()
+        conn = connection.Connection(authenticator=mock.Mock(),
+                                     metrics=recorded)
+
+        self.assertIs(recorded, conn.session.metrics)
+        self.assertEqual([], conn.stats())
+
+    def test_stats_disabled(self):
+        conn = connection.Connection(authenticator=mock.Mock())
+
+        self.assertIsNone(conn.stats())
+
+    def test_pool_maxsize(self):
+        conn = connection.Connection(authenticator=mock.Mock(),
+                                     pool_maxsize=32, pool_block=True,
+                                     max_retries=2)
+
+        adapter = conn.session.session.get_adapter('https://cloud')
+        self.assertEqual(32, adapter._pool_maxsize)
+        self.assertTrue(adapter._pool_block)
+        self.assertEqual(2, adapter.max_retries.total)
+
+    def test_http_session(self):
+        http_session = session.create_http_session()
+        first = connection.Connection(authenticator=mock.Mock(),
+                                      http_session=http_session)
+        second = connection.Connection(authenticator=mock.Mock(),
+                                       http_session=http_session)
+
+        self.assertIs(http_session, first.session.session)
+        self.assertIs(http_session, second.session.session)
+
     def test_session_provided(self):
         mock_session = mock.Mock(spec=session.Session)
         mock_profile = mock.Mock()
         mock_profile.get_services = mock.Mock(return_value=[])
+        mock_profile.service_keys = []
         conn = connection.Connection(session=mock_session,
                                      profile=mock_profile,
                                      user_agent='1')
@@ -85,6 +137,7 @@ class TestConnection(base.TestCase):
         mock_session = mock.Mock(spec=ksa_session.Session)
         mock_profile = mock.Mock()
         mock_profile.get_services = mock.Mock(return_value=[])
+        mock_profile.service_keys = []
         self.assertRaises(exceptions.SDKException, connection.Connection,
                           session=mock_session, profile=mock_profile,
                           user_agent='1')
@@ -154,6 +207,55 @@ class TestConnection(base.TestCase):
         self.assertEqual('openstack.workflow.v2._proxy',
                          conn.workflow.__class__.__module__)
 
+    def test_proxies_loaded_on_demand(self):
+        conn = connection.Connection(authenticator=mock.Mock(),
+                                     profile=profile.Profile())
+        self.assertNotIn('compute', conn.__dict__)
+        self.assertIn('compute', conn._unloaded)
+
+        compute = conn.compute
+        self.assertIs(compute, conn.__dict__['compute'])
+        self.assertNotIn('compute', conn._unloaded)
+        self.assertIs(compute, conn.compute)
+
+    def test_open_loads_no_services(self):
+        prof = profile.Profile()
+        conn = connection.Connection(authenticator=mock.Mock(), profile=prof)
+
+        self.assertEqual(prof.service_keys, sorted(prof._unloaded))
+        self.assertEqual(prof.service_keys, sorted(conn._unloaded.values()))
+        self.assertEqual('object-store', conn._unloaded['object_store'])
+        self.assertEqual('alarming', conn._unloaded['alarm'])
+
+    def test_proxy_loaded_concurrently(self):
+        conn = connection.Connection(authenticator=mock.Mock(),
+                                     profile=profile.Profile())
+        load = conn._load
+
+        def slow_load(service_type):
+            time.sleep(0.05)
+            load(service_type)
+
+        results = []
+        with mock.patch.object(conn, '_load',
+                               side_effect=slow_load) as mock_load:
+            threads = [threading.Thread(
+                target=lambda: results.append(conn.compute))
+                for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(2, len(results))
+        self.assertIs(results[0], results[1])
+        mock_load.assert_called_once_with('compute')
+
+    def test_unknown_attribute(self):
+        conn = connection.Connection(authenticator=mock.Mock(),
+                                     profile=profile.Profile())
+        self.assertRaises(AttributeError, getattr, conn, 'bogus')
+
     def _prepare_test_config(self):
         # Create a temporary directory where our test config will live
         # and insert it into the search path via OS_CLIENT_CONFIG_FILE.
@@ -166,6 +268,15 @@ class TestConnection(base.TestCase):
         self.useFixture(fixtures.EnvironmentVariable(
             "OS_CLIENT_CONFIG_FILE", config_path))
 
+    def test_from_config_pool(self):
+        self._prepare_test_config()
+
+        sot = connection.from_config(cloud_name="pooled")
+
+        adapter = sot.session.session.get_adapter('https://cloud')
+        self.assertEqual(32, adapter._pool_maxsize)
+        self.assertTrue(adapter._pool_block)
+
     def test_from_config_given_data(self):
         self._prepare_test_config()
 
@@ -231,6 +342,54 @@ class TestConnection(base.TestCase):
         res = sot.authorize()
         self.assertEqual('FAKE_TOKEN', res)
 
+    def test_warm_up(self):
+        fake_session = mock.Mock(spec=session.Session)
+        fake_session.get_auth_headers.return_value = {}
+
+        def get_endpoint(interface, service_type):
+            if service_type == 'network':
+                raise exceptions.EndpointNotFound('not in the catalog')
+            return 'http://%s/%s' % (interface, service_type)
+
+        fake_session.get_endpoint.side_effect = get_endpoint
+
+        sot = connection.Connection(session=fake_session)
+        result = sot.warm_up(services=['compute', 'network', 'image'])
+
+        self.assertEqual({'compute': 'http://public/compute',
+                          'image': 'http://public/image'}, result)
+        fake_session.get_auth_headers.assert_called_once_with()
+        self.assertEqual(3, fake_session.get_endpoint.call_count)
+
+    def test_warm_up_all_services(self):
+        fake_session = mock.Mock(spec=session.Session)
+        fake_session.get_endpoint.return_value = 'http://endpoint'
+        prof = profile.Profile()
+
+        sot = connection.Connection(session=fake_session, profile=prof)
+        result = sot.warm_up()
+
+        self.assertEqual(sorted(prof.service_keys), sorted(result))
+
+    def test_auth_cache(self):
+        fake_session = mock.Mock(spec=session.Session)
+        fake_session.auth = mock.Mock()
+        cache = mock.Mock()
+
+        connection.Connection(session=fake_session, auth_cache=cache)
+        cache.authenticate.assert_called_once_with(fake_session.auth,
+                                                   fake_session)
+
+    @mock.patch.object(connection.Connection, 'warm_up')
+    def test_warm_up_on_init(self, mock_warm_up):
+        fake_session = mock.Mock(spec=session.Session)
+
+        connection.Connection(session=fake_session)
+        self.assertFalse(mock_warm_up.called)
+
+        connection.Connection(session=fake_session, warm_up=True)
+        mock_warm_up.assert_called_once_with()
+
     def test_authorize_silent_failure(self):
         fake_session = mock.Mock(spec=session.Session)
         fake_session.get_auth_headers.return_value = None
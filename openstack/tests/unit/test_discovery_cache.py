@@ -0,0 +1,89 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import json
+import os
+
+import fixtures
+import mock
+
+from openstack import discovery_cache
+from openstack.tests.unit import base
+
+
+class TestDiscoveryCache(base.TestCase):
+
+    def setUp(self):
+        super(TestDiscoveryCache, self).setUp()
+        self.directory = self.useFixture(fixtures.TempDir()).path
+        self.path = os.path.join(self.directory, "cache", "discovery.json")
+        self.sot = discovery_cache.DiscoveryCache(self.path, ttl=10)
+
+    def test_default_path(self):
+        self.useFixture(fixtures.EnvironmentVariable("XDG_CACHE_HOME",
+                                                     self.directory))
+        sot = discovery_cache.DiscoveryCache()
+        self.assertEqual(
+            os.path.join(self.directory, "openstack", "discovery.json"),
+            sot.path)
+
+    def test_get_missing(self):
+        self.assertIsNone(self.sot.get(("a", "b")))
+
+    def test_set_get(self):
+        self.sot.set(("a", None), {"uri": "http://x"})
+
+        self.assertEqual({"uri": "http://x"}, self.sot.get(("a", None)))
+        self.assertIsNone(self.sot.get(("a", "b")))
+        # Only the cache file is left in the directory.
+        self.assertEqual(["discovery.json"],
+                         os.listdir(os.path.dirname(self.path)))
+
+    def test_shared(self):
+        self.sot.set(("a",), 1)
+        other = discovery_cache.DiscoveryCache(self.path)
+        other.set(("b",), 2)
+
+        self.assertEqual(1, self.sot.get(("a",)))
+        self.assertEqual(2, self.sot.get(("b",)))
+
+    @mock.patch("time.time")
+    def test_expired(self, mock_time):
+        mock_time.return_value = 100
+        self.sot.set(("a",), 1)
+        mock_time.return_value = 105
+        self.sot.set(("b",), 2)
+
+        mock_time.return_value = 110
+        self.assertIsNone(self.sot.get(("a",)))
+        self.assertEqual(2, self.sot.get(("b",)))
+
+        # Expired entries are dropped when the file is next written.
+        self.sot.set(("c",), 3)
+        with open(self.path) as cache_file:
+            self.assertEqual(2, len(json.load(cache_file)))
+
+    def test_corrupt(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w") as cache_file:
+            cache_file.write("{not json")
+
+        self.assertIsNone(self.sot.get(("a",)))
+        self.sot.set(("a",), 1)
+        self.assertEqual(1, self.sot.get(("a",)))
+
+    def test_write_failure(self):
+        with mock.patch("json.dump", side_effect=IOError("full")):
+            self.sot.set(("a",), 1)
+
+        self.assertIsNone(self.sot.get(("a",)))
+        self.assertEqual([], os.listdir(os.path.dirname(self.path)))
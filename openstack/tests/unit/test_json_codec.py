@@ -0,0 +1,254 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import collections
+import datetime
+import io
+import json
+
+from keystoneauth1 import exceptions as _exceptions
+import mock
+import requests
+import testtools
+
+from openstack import exceptions
+from openstack import json_codec
+from openstack import session
+
+
+def _response(content, encoding=None, status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.encoding = encoding
+    return response
+
+
+class TestJSONCodec(testtools.TestCase):
+
+    def test_get_codec(self):
+        codec = json_codec.get_codec("json")
+
+        self.assertEqual("json", codec.name)
+        self.assertEqual({"a": [1]}, codec.loads(b'{"a": [1]}'))
+        self.assertEqual({"a": [1]}, json.loads(codec.dumps({"a": [1]})))
+
+    def test_unknown(self):
+        self.assertRaises(exceptions.SDKException, json_codec.get_codec,
+                          "yaml")
+
+    @mock.patch("importlib.import_module", side_effect=ImportError)
+    def test_not_installed(self, mock_import):
+        self.assertRaises(exceptions.SDKException, json_codec.get_codec,
+                          "orjson")
+
+    def test_auto(self):
+        real_import = __import__
+
+        def import_module(name):
+            if name != "simplejson":
+                raise ImportError(name)
+            return real_import("json")
+
+        with mock.patch("importlib.import_module",
+                        side_effect=import_module):
+            codec = json_codec.get_codec()
+
+        self.assertEqual("simplejson", codec.name)
+
+    def test_auto_falls_back(self):
+        real_import = __import__
+
+        def import_module(name):
+            if name != "json":
+                raise ImportError(name)
+            return real_import(name)
+
+        with mock.patch("importlib.import_module",
+                        side_effect=import_module):
+            codec = json_codec.get_codec("auto")
+
+        self.assertEqual("json", codec.name)
+
+    def test_decode(self):
+        loads = mock.Mock(return_value={"ports": []})
+        codec = json_codec.JSONCodec("test", loads, json.dumps)
+
+        result = codec.decode(_response(b'{"ports": []}', encoding="UTF-8"))
+
+        self.assertEqual({"ports": []}, result)
+        loads.assert_called_once_with(b'{"ports": []}')
+
+    def test_decode_other_encoding(self):
+        loads = mock.Mock()
+        codec = json_codec.JSONCodec("test", loads, json.dumps)
+        body = u'{"name": "caf\xe9"}'.encode("utf-16")
+
+        result = codec.decode(_response(body, encoding="utf-16"))
+
+        self.assertEqual({"name": u"caf\xe9"}, result)
+        self.assertFalse(loads.called)
+
+    def test_attach(self):
+        loads = mock.Mock(return_value=[])
+        codec = json_codec.JSONCodec("test", loads, json.dumps)
+
+        response = codec.attach(_response(b"[]"))
+
+        self.assertEqual([], response.json())
+        loads.assert_called_once_with(b"[]")
+
+
+def _chunked(body, size):
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+class TestIterArray(testtools.TestCase):
+
+    def test_array(self):
+        items = [1, -2.5e3, "a,]}\\\"", None, True, False, [], {},
+                 {"x": [{"y": "[{"}]}, [[1], [2, [3]]], u"caf\xe9 \u4e2d"]
+        body = json.dumps(items, ensure_ascii=False).encode("utf-8")
+
+        for size in (1, 3, 64):
+            self.assertEqual(items, list(json_codec.iter_array(
+                _chunked(body, size))))
+
+    def test_key(self):
+        body = json.dumps({"links": [{"rel": "next", "href": "]"}],
+                           "ports": [{"id": "1"}, {"id": "2"}],
+                           "ports_links": []}).encode("utf-8")
+
+        for size in (1, 5, 1024):
+            self.assertEqual([{"id": "1"}, {"id": "2"}], list(
+                json_codec.iter_array(_chunked(body, size), "ports")))
+
+    def test_members(self):
+        body = json.dumps(collections.OrderedDict([
+            ("links", {"next": "]"}), ("ports", [{"id": "1"}]),
+            ("ports_links", [{"rel": "next"}]), ("count", 1)])).encode("utf-8")
+
+        for size in (1, 5, 1024):
+            members = {}
+            self.assertEqual([{"id": "1"}], list(json_codec.iter_array(
+                _chunked(body, size), "ports", members)))
+            self.assertEqual({"links": {"next": "]"},
+                              "ports_links": [{"rel": "next"}],
+                              "count": 1}, members)
+
+    def test_members_empty(self):
+        for body in (b'{"ports": [], "next": "a"}',
+                     b'{"ports": null, "next": "a"}'):
+            members = {}
+            self.assertEqual([], list(json_codec.iter_array(
+                [body], "ports", members)))
+            self.assertEqual({"next": "a"}, members)
+
+    def test_empty(self):
+        self.assertEqual([], list(json_codec.iter_array([b" [ ] "])))
+        self.assertEqual([], list(json_codec.iter_array(
+            [b'{"ports": null}'], "ports")))
+
+    def test_incremental(self):
+        chunks = iter([b'[{"id": 1},', b' {"id": 2}]'])
+
+        items = json_codec.iter_array(chunks)
+
+        self.assertEqual({"id": 1}, next(items))
+        # Only what was needed for the first item was read.
+        self.assertEqual([b' {"id": 2}]'], list(chunks))
+
+    def test_missing_key(self):
+        self.assertRaises(KeyError, list, json_codec.iter_array(
+            [b'{"servers": []}'], "ports"))
+
+    def test_invalid(self):
+        for body in (b'[1 2]', b'[{"id": 1}', b'["a', b'{"ports": 1}'):
+            self.assertRaises(ValueError, list, json_codec.iter_array(
+                [body], "ports" if body.startswith(b"{") else None))
+
+    def test_stream(self):
+        response = requests.Response()
+        response.raw = io.BytesIO(b'{"ports": [{"id": "1"}, {"id": "2"}]}')
+
+        with mock.patch.object(response, "close") as close:
+            items = json_codec.stream(response, "ports", chunk_size=8)
+
+            self.assertEqual([{"id": "1"}, {"id": "2"}], list(items))
+            close.assert_called_once_with()
+
+
+class TestSessionJSONCodec(testtools.TestCase):
+
+    def setUp(self):
+        super(TestSessionJSONCodec, self).setUp()
+        self.codec = json_codec.JSONCodec(
+            "test", mock.Mock(return_value={"decoded": True}),
+            mock.Mock(return_value=b'{"encoded": true}'))
+        self.sot = session.Session(None, json_codec=self.codec)
+        patcher = mock.patch("keystoneauth1.session.Session.request")
+        self.mock_request = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_by_name(self):
+        sot = session.Session(None, json_codec="json")
+
+        self.assertEqual("json", sot.json_codec.name)
+
+    def test_not_used_by_default(self):
+        self.mock_request.return_value = _response(b"{}")
+        sot = session.Session(None)
+
+        response = sot.post("/servers", json={"server": {}})
+
+        self.assertIsNone(sot.json_codec)
+        self.mock_request.assert_called_once_with(
+            "/servers", "POST", json={"server": {}})
+        self.assertEqual({}, response.json())
+
+    def test_encoded(self):
+        self.mock_request.return_value = _response(b"{}")
+
+        self.sot.post("/servers", json={"server": {}},
+                      headers={"X-Test": "1"})
+
+        self.codec.dumps.assert_called_once_with({"server": {}})
+        self.mock_request.assert_called_once_with(
+            "/servers", "POST", data=b'{"encoded": true}',
+            headers={"X-Test": "1", "Content-Type": "application/json"})
+
+    def test_not_encodable(self):
+        self.codec.dumps.side_effect = TypeError
+        self.mock_request.return_value = _response(b"{}")
+        body = {"created": datetime.datetime(2016, 1, 1)}
+
+        self.sot.put("/servers/1", json=body)
+
+        self.mock_request.assert_called_once_with(
+            "/servers/1", "PUT", json=body)
+
+    def test_decoded(self):
+        self.mock_request.return_value = _response(b"{}")
+
+        response = self.sot.get("/servers")
+
+        self.assertEqual({"decoded": True}, response.json())
+        self.codec.loads.assert_called_once_with(b"{}")
+
+    def test_error_decoded(self):
+        error = _response(b"{}", status_code=404)
+        self.mock_request.side_effect = _exceptions.HttpError(
+            http_status=404, response=error)
+
+        self.assertRaises(exceptions.HttpException, self.sot.get,
+                          "/servers/1")
+        self.assertEqual({"decoded": True}, error.json())
@@ -0,0 +1,259 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import datetime
+
+from keystoneauth1 import exceptions as _exceptions
+import mock
+import testtools
+
+from openstack import exceptions
+from openstack import metrics
+from openstack import proxy2
+from openstack import resource2
+from openstack import response_cache
+from openstack import retry
+from openstack import service_filter
+from openstack import session
+
+
+def _response(status_code=200, content=b"{}", elapsed=0.02, body=None):
+    response = mock.Mock(status_code=status_code, headers={},
+                         _content=content,
+                         elapsed=datetime.timedelta(seconds=elapsed))
+    response.request.body = body
+    return response
+
+
+class TestMetrics(testtools.TestCase):
+
+    def setUp(self):
+        super(TestMetrics, self).setUp()
+        self.sot = metrics.Metrics(buckets=(0.1, 1.0))
+
+    def test_record(self):
+        call = self.sot.start("compute", "get")
+        call.add_response(_response(body=b"12345"))
+        call.count("retries")
+        call.finish(200)
+
+        entry, = self.sot.snapshot()
+        self.assertEqual("compute", entry["service_type"])
+        self.assertEqual("GET", entry["method"])
+        self.assertEqual("", entry["resource"])
+        self.assertEqual({"200": 1}, entry["statuses"])
+        self.assertEqual(5, entry["request_bytes"])
+        self.assertEqual(2, entry["response_bytes"])
+        self.assertEqual(1, entry["retries"])
+        self.assertEqual({0.1: 1, 1.0: 1}, entry["ttfb"]["buckets"])
+        self.assertEqual(1, entry["duration"]["count"])
+
+    def test_content_length(self):
+        response = _response(content=None)
+        response.headers = {"Content-Length": "120"}
+
+        call = self.sot.start("compute", "GET")
+        call.add_response(response)
+
+        self.assertEqual(120, call.response_bytes)
+
+    def test_streamed_response(self):
+        call = self.sot.start("object-store", "GET")
+        call.add_response(_response(content=False))
+
+        self.assertEqual(0, call.response_bytes)
+
+    def test_grouped(self):
+        for method, status in (("GET", 200), ("GET", 404), ("PUT", 200)):
+            self.sot.start("compute", method).finish(status)
+
+        get, put = self.sot.snapshot()
+        self.assertEqual({"200": 1, "404": 1}, get["statuses"])
+        self.assertEqual({"200": 1}, put["statuses"])
+
+    def test_reset(self):
+        self.sot.start("compute", "GET").finish(200)
+        self.sot.reset()
+
+        self.assertEqual([], self.sot.snapshot())
+
+    def test_exporter(self):
+        exporter = mock.Mock(side_effect=[ValueError, None])
+        sot = metrics.Metrics(exporter=exporter)
+
+        # A failing exporter doesn't fail the call.
+        sot.start("compute", "GET").finish(200)
+        sot.start("compute", "GET").finish(500)
+
+        record = exporter.call_args[0][0]
+        self.assertEqual("compute", record["service_type"])
+        self.assertEqual("500", record["status"])
+        self.assertEqual(0, record["retries"])
+        self.assertIsNone(record["ttfb"])
+
+    def test_to_prometheus(self):
+        call = self.sot.start("compute", "GET")
+        call.add_response(_response(elapsed=0.5))
+        call.finish(200)
+
+        text = self.sot.to_prometheus()
+
+        labels = ('service_type="compute",method="GET",resource="",'
+                  'operation=""')
+        self.assertIn("# TYPE openstack_sdk_request_duration_seconds "
+                      "histogram", text)
+        self.assertIn('openstack_sdk_time_to_first_byte_seconds_bucket'
+                      '{%s,le="0.1"} 0' % labels, text)
+        self.assertIn('openstack_sdk_time_to_first_byte_seconds_bucket'
+                      '{%s,le="1.0"} 1' % labels, text)
+        self.assertIn('openstack_sdk_responses_total{%s,status="200"} 1'
+                      % labels, text)
+        self.assertIn('openstack_sdk_response_bytes_total{%s} 2' % labels,
+                      text)
+
+
+class TestSessionMetrics(testtools.TestCase):
+
+    def setUp(self):
+        super(TestSessionMetrics, self).setUp()
+        self.metrics = metrics.Metrics()
+        patcher = mock.patch("keystoneauth1.session.Session.request")
+        self.mock_request = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.filter = service_filter.ServiceFilter("compute")
+
+    def test_not_recorded_by_default(self):
+        self.mock_request.return_value = _response()
+        sot = session.Session(None)
+
+        sot.get("/servers", endpoint_filter=self.filter)
+
+        self.assertIsNone(sot.metrics)
+
+    def test_recorded(self):
+        self.mock_request.return_value = _response()
+        sot = session.Session(None, metrics=self.metrics)
+
+        sot.get("/servers", endpoint_filter=self.filter)
+
+        entry, = self.metrics.snapshot()
+        self.assertEqual("compute", entry["service_type"])
+        self.assertEqual({"200": 1}, entry["statuses"])
+
+    def test_error_recorded(self):
+        self.mock_request.side_effect = _exceptions.HttpError(
+            http_status=404, response=_response(status_code=404))
+        sot = session.Session(None, metrics=self.metrics)
+
+        self.assertRaises(exceptions.HttpException, sot.get, "/servers/1",
+                          endpoint_filter=self.filter)
+
+        entry, = self.metrics.snapshot()
+        self.assertEqual({"404": 1}, entry["statuses"])
+        self.assertEqual(2, entry["response_bytes"])
+
+    def test_connection_failure_recorded(self):
+        self.mock_request.side_effect = _exceptions.ConnectFailure()
+        sot = session.Session(None, metrics=self.metrics)
+
+        self.assertRaises(exceptions.SDKException, sot.get, "/servers")
+
+        entry, = self.metrics.snapshot()
+        self.assertEqual({"error": 1}, entry["statuses"])
+
+    @mock.patch("time.sleep")
+    def test_retries_counted(self, mock_sleep):
+        self.mock_request.side_effect = [
+            _exceptions.HttpError(http_status=503,
+                                  response=_response(status_code=503)),
+            _response()]
+        sot = session.Session(None, metrics=self.metrics,
+                              retry_policy=retry.RetryPolicy())
+
+        sot.get("/servers", endpoint_filter=self.filter)
+
+        entry, = self.metrics.snapshot()
+        self.assertEqual(1, entry["retries"])
+        self.assertEqual({"200": 1}, entry["statuses"])
+        self.assertEqual(1, entry["duration"]["count"])
+
+    def test_cache_hits_counted(self):
+        self.mock_request.return_value = _response()
+        sot = session.Session(None, metrics=self.metrics,
+                              response_cache=response_cache.ResponseCache())
+
+        sot.get("/flavors", endpoint_filter=self.filter, cache=True)
+        sot.get("/flavors", endpoint_filter=self.filter, cache=True)
+
+        entry, = self.metrics.snapshot()
+        self.assertEqual(1, entry["cache_hits"])
+        self.assertEqual({"200": 2}, entry["statuses"])
+        self.assertEqual(2, entry["response_bytes"])
+
+
+class Thing(resource2.Resource):
+    base_path = "/things"
+    service = service_filter.ServiceFilter("compute")
+    allow_get = True
+    allow_list = True
+
+
+class ThingProxy(proxy2.BaseProxy):
+
+    def get_thing(self, thing):
+        return self._get(Thing, thing)
+
+    def things(self):
+        return self._list(Thing)
+
+
+class TestProxyOperation(testtools.TestCase):
+
+    def setUp(self):
+        super(TestProxyOperation, self).setUp()
+        self.metrics = metrics.Metrics()
+        patcher = mock.patch("keystoneauth1.session.Session.request")
+        self.mock_request = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.sot = ThingProxy(session.Session(None, metrics=self.metrics))
+
+    def test_labelled(self):
+        response = _response()
+        response.json.return_value = {"id": "1"}
+        self.mock_request.return_value = response
+
+        self.sot.get_thing("1")
+
+        entry, = self.metrics.snapshot()
+        self.assertEqual("Thing", entry["resource"])
+        self.assertEqual("get_thing", entry["operation"])
+
+    def test_generator_labelled(self):
+        response = _response()
+        response.json.return_value = [{"id": "1"}, {"id": "2"}]
+        self.mock_request.return_value = response
+
+        things = self.sot.things()
+        self.assertEqual([], self.metrics.snapshot())
+        self.assertEqual(["1", "2"], [thing.id for thing in things])
+
+        entry, = self.metrics.snapshot()
+        self.assertEqual("Thing", entry["resource"])
+        self.assertEqual("things", entry["operation"])
+
+    def test_not_labelled_without_metrics(self):
+        sot = ThingProxy(session.Session(None))
+        response = _response()
+        response.json.return_value = {"id": "1"}
+        self.mock_request.return_value = response
+
+        self.assertEqual("1", sot.get_thing("1").id)
@@ -0,0 +1,109 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import mock
+import testtools
+
+from openstack import pagination
+
+
+class TestMarker(testtools.TestCase):
+
+    def setUp(self):
+        super(TestMarker, self).setUp()
+        self.sot = pagination.Marker()
+        self.last = mock.Mock(id="last")
+
+    def test_next(self):
+        params = {"name": "x"}
+
+        result = self.sot.next_params(params, {}, 3, self.last)
+
+        self.assertEqual({"name": "x", "limit": 3, "marker": "last"}, result)
+        self.assertEqual({"name": "x"}, params)
+
+    def test_full_page(self):
+        self.assertEqual(
+            {"limit": 3, "marker": "last"},
+            self.sot.next_params({"limit": "3"}, {}, 3, self.last))
+
+    def test_short_page(self):
+        self.assertIsNone(self.sot.next_params({"limit": 3}, {}, 2,
+                                               self.last))
+        self.assertIsNone(self.sot.next_params({"limit": "3"}, {}, 2,
+                                               self.last))
+
+    def test_empty_page(self):
+        self.assertIsNone(self.sot.next_params({}, {}, 0, None))
+
+
+class TestOffset(testtools.TestCase):
+
+    def test_next(self):
+        sot = pagination.Offset()
+
+        self.assertEqual({"limit": 2, "offset": 2},
+                         sot.next_params({}, {}, 2, None))
+        self.assertEqual({"limit": 2, "offset": 6},
+                         sot.next_params({"limit": 2, "offset": "4"}, {}, 2,
+                                         None))
+        self.assertIsNone(sot.next_params({"limit": 2}, {}, 1, None))
+        self.assertIsNone(sot.next_params({}, {}, 0, None))
+
+
+class TestNextLink(testtools.TestCase):
+
+    params = {"name": "x", "limit": 2}
+
+    def test_link(self):
+        sot = pagination.NextLink("next")
+
+        result = sot.next_params(
+            self.params, {"next": "/v2/images?marker=2&tag=a&tag=b"}, 2, None)
+
+        self.assertEqual({"name": "x", "limit": 2, "marker": "2",
+                          "tag": ["a", "b"]}, result)
+
+    def test_links_dict(self):
+        sot = pagination.NextLink("links")
+
+        self.assertEqual(
+            {"name": "x", "limit": "1", "marker": "2"},
+            sot.next_params(self.params, {"links": {
+                "self": "http://a/v3/users",
+                "next": "http://a/v3/users?limit=1&marker=2"}}, 2, None))
+        self.assertIsNone(sot.next_params(
+            self.params, {"links": {"next": None}}, 2, None))
+
+    def test_links_list(self):
+        sot = pagination.NextLink("servers_links")
+        body = {"servers_links": [
+            {"rel": "prev", "href": "http://a/servers?marker=0"},
+            {"rel": "next", "href": "http://a/servers?marker=2"}]}
+
+        self.assertEqual({"name": "x", "limit": 2, "marker": "2"},
+                         sot.next_params(self.params, body, 2, None))
+        self.assertIsNone(sot.next_params(
+            self.params, {"servers_links": body["servers_links"][:1]}, 2,
+            None))
+
+    def test_no_link(self):
+        sot = pagination.NextLink("next")
+
+        # A full page without a link is the last.
+        self.assertIsNone(sot.next_params(self.params, {}, 2, None))
+
+    def test_empty_page(self):
+        sot = pagination.NextLink("next")
+
+        self.assertIsNone(sot.next_params(
+            self.params, {"next": "/v2/images?marker=2"}, 0, None))
@@ -10,6 +10,12 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import importlib
+import threading
+import time
+
+import mock
+
 from openstack import exceptions
 from openstack import profile
 from openstack.tests.unit import base
@@ -97,3 +103,81 @@ class TestProfile(base.TestCase):
             self.assertEqual('fee', prof.get_filter(service).service_name)
             self.assertEqual('fie', prof.get_filter(service).region)
             self.assertEqual('public', prof.get_filter(service).interface)
+
+    def test_services_loaded_on_demand(self):
+        prof = profile.Profile()
+        self.assertIn('compute', prof._unloaded)
+        self.assertNotIn('compute', prof._services)
+
+        self.assertEqual('compute', prof.get_filter('compute').service_type)
+        self.assertNotIn('compute', prof._unloaded)
+        self.assertIn('network', prof._unloaded)
+
+        services = prof.get_services()
+        self.assertEqual(prof.service_keys,
+                         sorted(s.service_type for s in services))
+        self.assertEqual({}, prof._unloaded)
+
+    def test_load_service_already_loaded(self):
+        prof = profile.Profile()
+        compute = prof._load_service('compute')
+
+        # Another thread may have loaded it after the caller checked.
+        self.assertIs(compute, prof._load_service('compute'))
+
+    def test_load_service_concurrently(self):
+        prof = profile.Profile()
+        import_module = importlib.import_module
+
+        def slow_import(name):
+            # Let the other threads catch up before it's loaded.
+            time.sleep(0.05)
+            return import_module(name)
+
+        results = []
+
+        def load():
+            results.append(prof._get_filter('compute'))
+
+        with mock.patch.object(profile.importlib, 'import_module',
+                               side_effect=slow_import) as mock_import:
+            threads = [threading.Thread(target=load) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        mock_import.assert_called_once_with(
+            'openstack.compute.compute_service')
+        self.assertEqual(4, len(results))
+        for result in results:
+            self.assertIs(prof._services['compute'], result)
+
+    def test_set_rate_limit(self):
+        prof = profile.Profile()
+        self.assertIsNone(prof.get_rate_limiter('compute'))
+
+        prof.set_rate_limit('compute', 10, burst=20, max_retries=1)
+
+        limiter = prof.get_rate_limiter('compute')
+        self.assertEqual(10, limiter.rate)
+        self.assertEqual(20, limiter.burst)
+        self.assertEqual(1, limiter.max_retries)
+        self.assertIsNone(prof.get_rate_limiter('network'))
+
+        prof.set_rate_limit('compute', None)
+        self.assertIsNone(prof.get_rate_limiter('compute'))
+
+    def test_set_rate_limit_all(self):
+        prof = profile.Profile()
+        prof.set_rate_limit(prof.ALL, 5)
+
+        limiters = [prof.get_rate_limiter(s) for s in prof.service_keys]
+        self.assertTrue(all(limiter.rate == 5 for limiter in limiters))
+        # Each service is limited separately.
+        self.assertEqual(len(limiters), len(set(map(id, limiters))))
+
+    def test_set_rate_limit_unknown(self):
+        prof = profile.Profile()
+        self.assertRaises(exceptions.SDKException, prof.set_rate_limit,
+                          'fake', 10)
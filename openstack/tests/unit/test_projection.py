@@ -0,0 +1,103 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import testtools
+
+from openstack.network import network_service
+from openstack import projection
+from openstack import service_filter
+
+
+class Port(object):
+    service = network_service.NetworkService()
+
+
+class Server(object):
+    service = service_filter.ServiceFilter("compute")
+
+
+MAPPING = {"id": "id", "name": "name", "project_id": "tenant_id",
+           "binding_host_id": "binding:host_id"}
+
+DATA = {"id": "1", "name": "port", "tenant_id": "p1",
+        "binding:host_id": "host", "status": "ACTIVE"}
+
+
+class TestProjection(testtools.TestCase):
+
+    def test_names(self):
+        sot = projection.Projection(
+            Port, MAPPING, ["project_id", "binding:host_id", "tenant_id"])
+
+        self.assertEqual(["tenant_id", "binding:host_id"], sot.names)
+
+    def test_server_side(self):
+        sot = projection.Projection(Port, MAPPING, ["name"])
+
+        self.assertTrue(sot.server_side)
+        self.assertEqual(["name"], sot.query())
+
+    def test_client_side(self):
+        sot = projection.Projection(Server, MAPPING, ["name"])
+
+        self.assertFalse(sot.server_side)
+        self.assertIsNone(sot.query())
+
+    def test_all_fields_not_server_side(self):
+        sot = projection.Projection(Port, MAPPING, records=True)
+
+        self.assertFalse(sot.server_side)
+        self.assertEqual(sorted(MAPPING), list(sot.record._fields))
+
+    def test_single_field(self):
+        sot = projection.Projection(Port, MAPPING, "name")
+
+        self.assertEqual(["name"], sot.names)
+
+    def test_paginated_keeps_id(self):
+        sot = projection.Projection(Port, MAPPING, ["name"], paginated=True)
+
+        self.assertEqual(["name", "id"], sot.names)
+
+    def test_select(self):
+        sot = projection.Projection(Server, MAPPING, ["name", "project_id",
+                                                      "missing"])
+
+        self.assertEqual({"name": "port", "tenant_id": "p1"},
+                         sot.select(DATA))
+
+    def test_record(self):
+        sot = projection.Projection(Port, MAPPING,
+                                    ["id", "tenant_id", "binding_host_id",
+                                     "missing"], records=True)
+
+        record = sot.make_record(DATA)
+
+        self.assertEqual(("1", "p1", "host", None), record)
+        self.assertEqual("p1", record.project_id)
+        self.assertEqual("host", record.binding_host_id)
+        self.assertIsNone(record.missing)
+        self.assertEqual("PortRecord", type(record).__name__)
+        self.assertRaises(AttributeError, setattr, record, "id", "2")
+
+    def test_record_invalid_names(self):
+        sot = projection.Projection(Port, {}, ["binding:host_id", "class"],
+                                    records=True)
+
+        self.assertEqual(("host", None), sot.make_record(DATA))
+        self.assertEqual(("_0", "_1"), sot.record._fields)
+
+    def test_record_type_cached(self):
+        first = projection.record_type("Record", ("a", "b"))
+
+        self.assertIs(first, projection.record_type("Record", ("a", "b")))
+        self.assertIsNot(first, projection.record_type("Record", ("a",)))
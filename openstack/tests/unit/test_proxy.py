@@ -16,6 +16,7 @@ import testtools
 from openstack import exceptions
 from openstack import proxy
 from openstack import resource
+from openstack import utils
 
 
 class DeleteableResource(resource.Resource):
@@ -141,6 +142,49 @@ class TestProxyDelete(testtools.TestCase):
                           DeleteableResource, self.res, ignore_missing=False)
 
 
+class TestProxyDeleteMany(testtools.TestCase):
+
+    def setUp(self):
+        super(TestProxyDeleteMany, self).setUp()
+
+        self.session = mock.Mock()
+        self.sot = proxy.BaseProxy(self.session)
+
+        self.resources = []
+        for id in range(2):
+            res = mock.Mock(spec=DeleteableResource)
+            res.id = id
+            res.delete = mock.Mock()
+            self.resources.append(res)
+
+    def test_delete_many(self):
+        error = exceptions.HttpException(message="test", http_status=500)
+        self.resources[0].delete.side_effect = error
+        DeleteableResource.existing = mock.Mock(side_effect=self.resources)
+
+        result = self.sot._delete_many(DeleteableResource, [0, 1],
+                                       path_args={"parent": "p"})
+
+        self.assertEqual([utils.DeleteResult(0, None, error),
+                          utils.DeleteResult(1, self.resources[1], None)],
+                         result)
+        for res in self.resources:
+            res.update_attrs.assert_called_once_with(ignore_none=True,
+                                                     parent="p")
+            res.delete.assert_called_once_with(self.session)
+
+    @mock.patch("openstack.resource.wait_for_delete")
+    def test_delete_many_wait_for_delete(self, mock_wait):
+        result = self.sot._delete_many(DeleteableResource, self.resources,
+                                       wait_for_delete=True)
+
+        self.assertEqual([None, None], [item.exception for item in result])
+        mock_wait.assert_has_calls(
+            [mock.call(self.session, self.resources[0], 2, 120),
+             mock.call(self.session, self.resources[1], 2, 120)],
+            any_order=True)
+
+
 class TestProxyUpdate(testtools.TestCase):
 
     def setUp(self):
@@ -198,6 +242,16 @@ class TestProxyCreate(testtools.TestCase):
         CreateableResource.new.assert_called_once_with(**attrs)
         self.res.create.assert_called_once_with(self.session)
 
+    def test_bulk_create(self):
+        CreateableResource.bulk_create = mock.Mock(return_value=[self.res])
+
+        data = [{"x": 1}]
+        rv = self.sot._bulk_create(CreateableResource, data, batch_size=10)
+
+        self.assertEqual([self.res], rv)
+        CreateableResource.bulk_create.assert_called_once_with(
+            self.session, data, path_args=None, batch_size=10, concurrency=4)
+
 
 class TestProxyGet(testtools.TestCase):
 
@@ -279,6 +333,20 @@ class TestProxyList(testtools.TestCase):
     def test_list_non_paginated(self):
         self._test_list(self.fake_path_args, False, **self.fake_query)
 
+    def test_list_stream(self):
+        self.sot._list(ListableResource, stream=True)
+
+        ListableResource.list.assert_called_once_with(
+            self.session, path_args=None, paginated=False, params={},
+            stream=True)
+
+    def test_list_fields(self):
+        self.sot._list(ListableResource, fields=["a"], records=True)
+
+        ListableResource.list.assert_called_once_with(
+            self.session, path_args=None, paginated=False, params={},
+            fields=["a"], records=True)
+
 
 class TestProxyHead(testtools.TestCase):
 
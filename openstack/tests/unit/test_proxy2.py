@@ -16,6 +16,7 @@ import testtools
 from openstack import exceptions
 from openstack import proxy2
 from openstack import resource2
+from openstack import utils
 
 
 class DeleteableResource(resource2.Resource):
@@ -213,6 +214,88 @@ class TestProxyDelete(testtools.TestCase):
                           DeleteableResource, self.res, ignore_missing=False)
 
 
+class TestProxyDeleteMany(testtools.TestCase):
+
+    def setUp(self):
+        super(TestProxyDeleteMany, self).setUp()
+
+        self.session = mock.Mock()
+        self.sot = proxy2.BaseProxy(self.session)
+
+        self.resources = []
+        for id in range(3):
+            res = mock.Mock(spec=DeleteableResource)
+            res.id = id
+            res.delete = mock.Mock()
+            self.resources.append(res)
+
+    def test_delete_many(self):
+        error = exceptions.HttpException(message="test", http_status=500)
+        self.resources[1].delete.side_effect = error
+
+        result = self.sot._delete_many(DeleteableResource, self.resources,
+                                       concurrency=2)
+
+        self.assertEqual(
+            [utils.DeleteResult(res, res, None)
+             for res in self.resources[::2]],
+            result[::2])
+        self.assertEqual(
+            utils.DeleteResult(self.resources[1], None, error), result[1])
+        for res in self.resources:
+            res.delete.assert_called_once_with(self.session)
+
+    def test_delete_many_ids(self):
+        DeleteableResource.new = mock.Mock(side_effect=self.resources)
+
+        result = self.sot._delete_many(DeleteableResource, [0, 1, 2],
+                                       concurrency=1)
+
+        self.assertEqual([0, 1, 2], [item.value for item in result])
+        self.assertEqual([mock.call(id=0), mock.call(id=1), mock.call(id=2)],
+                         DeleteableResource.new.call_args_list)
+
+    def test_delete_many_not_found(self):
+        self.resources[0].delete.side_effect = (
+            exceptions.NotFoundException(message="test", http_status=404))
+
+        result = self.sot._delete_many(DeleteableResource, self.resources,
+                                       ignore_missing=False)
+
+        self.assertIsInstance(result[0].exception,
+                              exceptions.ResourceNotFound)
+        self.assertEqual([None, None],
+                         [item.exception for item in result[1:]])
+
+    def test_delete_many_empty(self):
+        self.assertEqual([], self.sot._delete_many(DeleteableResource, []))
+
+    @mock.patch("openstack.resource2.wait_for_delete")
+    def test_delete_many_wait_for_delete(self, mock_wait):
+        error = exceptions.HttpException(message="test", http_status=500)
+        timeout = exceptions.ResourceTimeout("timeout")
+        self.resources[0].delete.side_effect = error
+
+        def wait_for_delete(session, res, interval, wait):
+            if res is self.resources[2]:
+                raise timeout
+            return res
+
+        mock_wait.side_effect = wait_for_delete
+
+        result = self.sot._delete_many(DeleteableResource, self.resources,
+                                       wait_for_delete=True, interval=1,
+                                       wait=5)
+
+        self.assertEqual([error, None, timeout],
+                         [item.exception for item in result])
+        self.assertEqual(2, mock_wait.call_count)
+        mock_wait.assert_has_calls(
+            [mock.call(self.session, self.resources[1], 1, 5),
+             mock.call(self.session, self.resources[2], 1, 5)],
+            any_order=True)
+
+
 class TestProxyUpdate(testtools.TestCase):
 
     def setUp(self):
@@ -269,6 +352,16 @@ class TestProxyCreate(testtools.TestCase):
         CreateableResource.new.assert_called_once_with(**attrs)
         self.res.create.assert_called_once_with(self.session)
 
+    def test_bulk_create(self):
+        CreateableResource.bulk_create = mock.Mock(return_value=[self.res])
+
+        data = [{"x": 1}]
+        rv = self.sot._bulk_create(CreateableResource, data, batch_size=10)
+
+        self.assertEqual([self.res], rv)
+        CreateableResource.bulk_create.assert_called_once_with(
+            self.session, data, batch_size=10, concurrency=4)
+
 
 class TestProxyGet(testtools.TestCase):
 
@@ -346,6 +439,64 @@ class TestProxyList(testtools.TestCase):
         self._test_list(False)
 
 
+class TestProxyParallelList(testtools.TestCase):
+
+    def setUp(self):
+        super(TestProxyParallelList, self).setUp()
+
+        self.sot = proxy2.BaseProxy(mock.Mock())
+        self.data = {"a": [1, 2, 3], "b": [4, 5], "c": []}
+
+    def list_method(self, shard, **query):
+        if shard == "bad":
+            raise exceptions.HttpException("oops")
+        for item in self.data[shard]:
+            yield (item, query)
+
+    def test_parallel_list(self):
+        shards = [{"shard": "a"}, {"shard": "b"}, {"shard": "c"}]
+
+        results = list(self.sot.parallel_list(self.list_method, shards,
+                                              concurrency=2, x=1))
+
+        self.assertEqual([1, 2, 3, 4, 5],
+                         sorted(item for item, query in results))
+        for item, query in results:
+            self.assertEqual({"x": 1}, query)
+
+    def test_parallel_list_no_shards(self):
+        self.assertEqual([], list(self.sot.parallel_list(self.list_method,
+                                                         [])))
+
+    def test_parallel_list_failure(self):
+        shards = [{"shard": "a"}, {"shard": "bad"}, {"shard": "b"}]
+
+        results = self.sot.parallel_list(self.list_method, shards)
+
+        received = []
+        try:
+            for item, query in results:
+                received.append(item)
+        except exceptions.ParallelListFailure as e:
+            self.assertEqual([{"shard": "bad"}],
+                             [shard for shard, exc in e.failures])
+            self.assertIsInstance(e.failures[0][1],
+                                  exceptions.HttpException)
+        else:
+            self.fail("ParallelListFailure was not raised")
+
+        # The other parts are listed completely.
+        self.assertEqual([1, 2, 3, 4, 5], sorted(received))
+
+    def test_parallel_list_ignore_errors(self):
+        shards = [{"shard": "a"}, {"shard": "bad"}]
+
+        results = list(self.sot.parallel_list(self.list_method, shards,
+                                              ignore_errors=True))
+
+        self.assertEqual([1, 2, 3], sorted(item for item, query in results))
+
+
 class TestProxyHead(testtools.TestCase):
 
     def setUp(self):
@@ -416,3 +567,16 @@ class TestProxyWaits(testtools.TestCase):
         self.sot.wait_for_delete(mock_resource, 1, 2)
         mock_wait.assert_called_once_with(
             self.session, mock_resource, 1, 2)
+
+    @mock.patch("openstack.resource2.wait_for_statuses")
+    def test_wait_for_statuses(self, mock_wait):
+        mock_resources = [mock.Mock(), mock.Mock()]
+        mock_wait.return_value = "generator"
+
+        result = self.sot.wait_for_statuses(mock_resources, "ACTIVE",
+                                            ["ERROR"], 1, 2, name="test")
+
+        self.assertEqual("generator", result)
+        mock_wait.assert_called_once_with(
+            self.session, mock_resources, "ACTIVE", ["ERROR"], 1, 2,
+            list_type=None, name="test")
@@ -0,0 +1,134 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import threading
+
+import mock
+
+from openstack import rate_limit
+from openstack.tests.unit import base
+
+
+class TestParseRetryAfter(base.TestCase):
+
+    def test_seconds(self):
+        self.assertEqual(5.0, rate_limit.parse_retry_after("5"))
+        self.assertEqual(0.0, rate_limit.parse_retry_after("-1"))
+
+    def test_missing(self):
+        self.assertIsNone(rate_limit.parse_retry_after(None))
+        self.assertIsNone(rate_limit.parse_retry_after(""))
+        self.assertIsNone(rate_limit.parse_retry_after("soon"))
+
+    @mock.patch("time.time", return_value=1000000000)
+    def test_date(self, mock_time):
+        # 1000000000 is 2001-09-09 01:46:40 UTC.
+        self.assertEqual(
+            20.0,
+            rate_limit.parse_retry_after("Sun, 09 Sep 2001 01:47:00 GMT"))
+
+
+class TestRateLimiter(base.TestCase):
+
+    def setUp(self):
+        super(TestRateLimiter, self).setUp()
+        self.now = 100.0
+        for target, side_effect in (("openstack.rate_limit._now",
+                                     lambda: self.now),
+                                    ("time.sleep", self._sleep)):
+            patcher = mock.patch(target, side_effect=side_effect)
+            self.addCleanup(patcher.stop)
+            if target == "time.sleep":
+                self.sleep = patcher.start()
+            else:
+                patcher.start()
+        self.sot = rate_limit.RateLimiter(10, burst=2)
+
+    def _sleep(self, seconds):
+        self.now += seconds
+
+    def test_defaults(self):
+        sot = rate_limit.RateLimiter(0.5)
+        self.assertEqual(1, sot.burst)
+        self.assertEqual(0.005, sot.min_rate)
+        self.assertEqual(0.005, sot.increase)
+        self.assertEqual(3, sot.max_retries)
+
+    def test_burst(self):
+        self.assertEqual(0, self.sot.acquire())
+        self.assertEqual(0, self.sot.acquire())
+        self.assertFalse(self.sleep.called)
+
+        self.assertAlmostEqual(0.1, self.sot.acquire())
+        self.assertAlmostEqual(0.1, self.sot.acquire())
+
+        stats = self.sot.get_stats()
+        self.assertEqual(4, stats["requests"])
+        self.assertAlmostEqual(0.2, stats["waited"])
+
+    def test_refilled(self):
+        self.sot.acquire()
+        self.sot.acquire()
+        self.now += 1
+
+        self.assertEqual(0, self.sot.acquire())
+        self.assertEqual(0, self.sot.acquire())
+
+    def test_throttled(self):
+        self.sot.throttled(retry_after=3)
+
+        self.assertEqual(5, self.sot.rate)
+        self.assertAlmostEqual(3.2, self.sot.acquire())
+        self.assertEqual(1, self.sot.get_stats()["throttled"])
+
+    def test_throttled_once_a_second(self):
+        self.sot.throttled()
+        self.sot.throttled()
+        self.assertEqual(5, self.sot.rate)
+
+        self.now += 1
+        self.sot.throttled()
+        self.assertEqual(2.5, self.sot.rate)
+        self.assertEqual(3, self.sot.get_stats()["throttled"])
+
+    def test_min_rate(self):
+        sot = rate_limit.RateLimiter(10, min_rate=4)
+        sot.throttled()
+        self.now += 1
+        sot.throttled()
+        self.assertEqual(4, sot.rate)
+
+    def test_succeeded(self):
+        self.sot.throttled()
+        for _ in range(3):
+            self.sot.succeeded()
+        self.assertAlmostEqual(5.3, self.sot.rate)
+
+        for _ in range(100):
+            self.sot.succeeded()
+        self.assertEqual(10, self.sot.rate)
+
+
+class TestRateLimiterThreads(base.TestCase):
+
+    def test_shared(self):
+        sot = rate_limit.RateLimiter(1000, burst=10)
+        threads = [threading.Thread(target=sot.acquire) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        stats = sot.get_stats()
+        self.assertEqual(20, stats["requests"])
+        # The ten beyond the burst waited about a millisecond each.
+        self.assertGreater(stats["waited"], 0)
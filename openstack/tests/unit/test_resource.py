@@ -21,6 +21,8 @@ from testtools import matchers
 
 from openstack import exceptions
 from openstack import format
+from openstack.network import network_service
+from openstack import pagination
 from openstack import resource
 from openstack.tests.unit import base
 from openstack import utils
@@ -61,6 +63,7 @@ class FakeResource(resource.Resource):
 
     allow_create = allow_retrieve = allow_update = True
     allow_delete = allow_list = allow_head = True
+    allow_bulk_create = True
 
     enabled = resource.prop('enabled', type=format.BoolStr)
     name = resource.prop('name')
@@ -594,6 +597,90 @@ class ResourceTests(base.TestCase):
             endpoint_filter=FakeResource2.service,
             headers=headers)
 
+    def test_bulk_create(self):
+        resp = mock.Mock()
+        resp.json = mock.Mock(return_value={
+            fake_resources: [dict(fake_data, id=1), dict(fake_data, id=2)]})
+        self.session.post = mock.Mock(return_value=resp)
+
+        result = FakeResource.bulk_create(
+            self.session, [{'name': 'a'}, {'name': 'b'}],
+            path_args={'parent_name': fake_parent})
+
+        self.assertEqual([1, 2], [obj.id for obj in result])
+        for obj in result:
+            self.assertFalse(obj.is_dirty)
+        self.assertCalledURL(self.session.post,
+                             '/fakes/%s/data' % fake_parent)
+        last_req = self.session.post.call_args[1]["json"][fake_resources]
+        self.assertEqual(['a', 'b'], [req['name'] for req in last_req])
+
+    def test_bulk_create_body(self):
+        class Rule(FakeResource):
+            @classmethod
+            def _get_create_body(cls, attrs):
+                attrs.pop('parent_name', None)
+                return {cls.resource_key: attrs}
+
+        resp = mock.Mock()
+        resp.json = mock.Mock(return_value={
+            fake_resources: [dict(fake_data, id=1)]})
+        self.session.post = mock.Mock(return_value=resp)
+
+        Rule.bulk_create(self.session, [{'name': 'a'}],
+                         path_args={'parent_name': fake_parent})
+
+        self.assertEqual([{'name': 'a'}],
+                         self.session.post.call_args[1]["json"][
+                             fake_resources])
+
+    def test_bulk_create_rejected(self):
+        def post(url, endpoint_filter, json, **kwargs):
+            if fake_resources in json:
+                raise exceptions.HttpException('Method not allowed',
+                                               http_status=405)
+            resp = mock.Mock()
+            resp.headers = {}
+            resp.json = mock.Mock(return_value={
+                fake_resource: dict(fake_data, id=json[fake_resource]['name'])
+            })
+            return resp
+
+        self.session.post = mock.Mock(side_effect=post)
+
+        result = FakeResource.bulk_create(
+            self.session, [{'name': 'a'}, {'name': 'b'}],
+            path_args={'parent_name': fake_parent})
+
+        self.assertEqual(['a', 'b'], [obj.id for obj in result])
+        self.assertEqual(3, self.session.post.call_count)
+
+    def test_bulk_create_error(self):
+        self.session.post = mock.Mock(side_effect=exceptions.HttpException(
+            'Bulk operation not supported', http_status=400))
+
+        self.assertRaises(exceptions.HttpException, FakeResource.bulk_create,
+                          self.session, [{'name': 'a'}, {'name': 'b'}],
+                          path_args={'parent_name': fake_parent})
+        self.assertEqual(1, self.session.post.call_count)
+
+    def test_bulk_create_not_declared(self):
+        class Single(FakeResource):
+            allow_bulk_create = False
+
+        resp = mock.Mock()
+        resp.headers = {}
+        resp.json = mock.Mock(return_value={fake_resource: fake_data})
+        self.session.post = mock.Mock(return_value=resp)
+
+        result = Single.bulk_create(self.session, [{'name': 'a'}],
+                                    path_args={'parent_name': fake_parent})
+
+        self.assertEqual([fake_id], [obj.id for obj in result])
+        self.assertEqual(1, self.session.post.call_count)
+        self.assertNotIn(fake_resources,
+                         self.session.post.call_args[1]['json'])
+
     def test_create(self):
         resp = mock.Mock()
         resp.json = mock.Mock(return_value=fake_body)
@@ -979,6 +1066,160 @@ class ResourceTests(base.TestCase):
         self.assertEqual(session.get.call_count, len(pages))
         self.assertEqual(len(page), len(results))
 
+    def test_cache_responses(self):
+        class CachedResource(FakeResource):
+            cache_responses = True
+
+        session = mock.Mock()
+        session.get.return_value = mock.Mock(json=mock.Mock(
+            return_value={FakeResource.resources_key: [fake_data.copy()]}))
+
+        list(CachedResource.list(session, path_args=fake_arguments))
+
+        url = fake_base_path % fake_arguments
+        session.get.assert_called_once_with(
+            url, endpoint_filter=FakeResource.service,
+            headers={'Accept': 'application/json'}, params={}, cache=True)
+
+        session.get.return_value = mock.Mock(
+            json=mock.Mock(return_value=fake_body))
+        session.get.reset_mock()
+
+        CachedResource.get_by_id(session, fake_id, path_args=fake_arguments)
+
+        session.get.assert_called_once_with(
+            os.path.join(url, str(fake_id))[1:],
+            endpoint_filter=FakeResource.service, cache=True)
+
+    def test_list_fields_server_side(self):
+        class NetworkResource(FakeResource):
+            service = network_service.NetworkService()
+
+        session = mock.Mock()
+        session.get.return_value.json.return_value = {
+            fake_resources: [{'id': fake_id, 'attr1': fake_attr1}]}
+
+        obj, = NetworkResource.list(session, path_args=fake_arguments,
+                                    fields=['first'])
+
+        self.assertEqual({'fields': ['attr1']},
+                         session.get.call_args[1]['params'])
+        self.assertEqual(fake_attr1, obj.first)
+        self.assertIsNone(obj.name)
+
+    def test_list_fields_client_side(self):
+        session = mock.Mock()
+        session.get.return_value.json.return_value = {
+            fake_resources: [fake_data.copy()]}
+
+        obj, = FakeResource.list(session, path_args=fake_arguments,
+                                 fields=['id', 'name'])
+
+        self.assertEqual({}, session.get.call_args[1]['params'])
+        self.assertEqual({'id': fake_id, 'name': fake_name}, dict(obj))
+
+    def test_list_records(self):
+        full_response = mock.Mock()
+        full_response.json.return_value = {
+            fake_resources: self._get_expected_results()}
+        last_response = mock.Mock()
+        last_response.json.return_value = {fake_resources: []}
+        session = mock.Mock()
+        session.get.side_effect = [full_response, last_response]
+
+        objs = list(FakeResource.list(session, path_args=fake_arguments,
+                                      paginated=True, fields=['first'],
+                                      records=True))
+
+        self.assertEqual([(fake_attr1, fake_id + i) for i in range(3)],
+                         objs)
+        self.assertEqual(fake_attr1, objs[0].first)
+        self.assertEqual({'limit': 3, 'marker': fake_id + 2},
+                         session.get.call_args[1]['params'])
+
+    def test_list_next_link(self):
+        class Paginated(FakeResource):
+            pagination = pagination.NextLink(fake_resources + '_links')
+
+        results = self._get_expected_results()
+        first_response = mock.Mock()
+        first_response.json.return_value = {
+            fake_resources: results[:2],
+            fake_resources + '_links': [
+                {'rel': 'next', 'href': 'http://x/?limit=2&marker=m'}]}
+        last_response = mock.Mock()
+        last_response.json.return_value = {fake_resources: results[2:]}
+        session = mock.Mock()
+        session.get.side_effect = [first_response, last_response]
+
+        objs = list(Paginated.list(session, path_args=fake_arguments,
+                                   paginated=True))
+
+        self.assertEqual(3, len(objs))
+        self.assertEqual(2, session.get.call_count)
+        self.assertEqual({'limit': '2', 'marker': 'm'},
+                         session.get.call_args[1]['params'])
+
+    def test_list_prefetch(self):
+        full_response = mock.Mock()
+        full_response.json.return_value = {
+            fake_resources: self._get_expected_results()}
+        last_response = mock.Mock()
+        last_response.json.return_value = {fake_resources: []}
+        session = mock.Mock()
+        session.get.side_effect = [full_response, last_response]
+
+        objs = list(FakeResource.list(session, path_args=fake_arguments,
+                                      paginated=True, prefetch=1))
+
+        self.assertEqual([fake_id, fake_id + 1, fake_id + 2],
+                         [obj.id for obj in objs])
+        self.assertEqual(2, session.get.call_count)
+        self.assertEqual({'limit': 3, 'marker': fake_id + 2},
+                         session.get.call_args[1]['params'])
+
+    def test_list_prefetch_error(self):
+        full_response = mock.Mock()
+        full_response.json.return_value = {
+            fake_resources: self._get_expected_results()}
+        session = mock.Mock()
+        session.get.side_effect = [full_response,
+                                   exceptions.HttpException("boom")]
+
+        objs = FakeResource.list(session, path_args=fake_arguments,
+                                 paginated=True, prefetch=2)
+
+        self.assertEqual(fake_id, next(objs).id)
+        self.assertEqual(fake_id + 1, next(objs).id)
+        self.assertEqual(fake_id + 2, next(objs).id)
+        self.assertRaises(exceptions.HttpException, next, objs)
+
+    def test_list_stream(self):
+        body = json.dumps(
+            {fake_resources: self._get_expected_results()}).encode("utf-8")
+        full_response = mock.Mock()
+        full_response.iter_content.return_value = [
+            body[i:i + 10] for i in range(0, len(body), 10)]
+        last_response = mock.Mock()
+        last_response.iter_content.return_value = [
+            ('{"%s": []}' % fake_resources).encode("utf-8")]
+        session = mock.Mock(json_codec=None)
+        session.get.side_effect = [full_response, last_response]
+
+        objs = list(FakeResource.list(session, path_args=fake_arguments,
+                                      paginated=True, stream=True))
+
+        self.assertEqual([fake_id, fake_id + 1, fake_id + 2],
+                         [obj.id for obj in objs])
+        self.assertEqual(fake_name, objs[0].name)
+        self.assertEqual(2, session.get.call_count)
+        url = fake_base_path % fake_arguments
+        session.get.assert_called_with(
+            url, endpoint_filter=FakeResource.service,
+            headers={'Accept': 'application/json'},
+            params={'limit': 3, 'marker': fake_id + 2}, stream=True)
+        full_response.close.assert_called_once_with()
+
     def test_attrs_name(self):
         obj = FakeResource()
 
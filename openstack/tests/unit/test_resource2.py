@@ -14,9 +14,12 @@ import itertools
 
 import mock
 import six
+import testtools
 
 from openstack import exceptions
 from openstack import format
+from openstack.network import network_service
+from openstack import pagination
 from openstack import resource2
 from openstack import session
 from openstack.tests.unit import base
@@ -255,6 +258,27 @@ class TestComponentManager(base.TestCase):
         self.assertEqual(attrs, sot.attributes)
         self.assertEqual(set(), sot._dirty)
 
+    def test_create_synced_dirty_lazy(self):
+        attrs = {"hey": 1}
+
+        sot = resource2._ComponentManager(attributes=attrs, synchronized=True)
+        self.assertIs(resource2._CLEAN, sot._dirty)
+
+        sot["hey"] = 2
+        self.assertEqual({"hey": 2}, sot.dirty)
+        # The original attributes were copied so they aren't modified.
+        self.assertEqual({"hey": 1}, attrs)
+
+        sot.clean()
+        self.assertIs(resource2._CLEAN, sot._dirty)
+
+    def test_create_no_copy(self):
+        attrs = {"hey": 1}
+
+        sot = resource2._ComponentManager(attributes=attrs, synchronized=True,
+                                          copy=False)
+        self.assertIs(attrs, sot.attributes)
+
     def test_getitem(self):
         key = "key"
         value = "value"
@@ -415,6 +439,16 @@ class TestResource(base.TestCase):
         self.assertFalse(sot.patch_update)
         self.assertFalse(sot.put_create)
 
+    def test_initialize_no_dict(self):
+        class Test(resource2.Resource):
+            attr = resource2.Body("attr")
+
+        sot = Test.existing(id="id", attr="value")
+
+        self.assertNotIn("__dict__", dir(resource2.Resource))
+        self.assertEqual({}, sot.__dict__)
+        self.assertEqual("value", sot.attr)
+
     def test_repr(self):
         a = {"a": 1}
         b = {"b": 2}
@@ -463,15 +497,18 @@ class TestResource(base.TestCase):
         header = "header"
         uri = "uri"
 
-        sot._collect_attrs = mock.Mock(return_value=(body, header, uri))
-        sot._body.update = mock.Mock()
-        sot._header.update = mock.Mock()
-        sot._uri.update = mock.Mock()
+        # Resource and _ComponentManager use __slots__, so methods can't
+        # be replaced on their instances.
+        sot._body = mock.Mock()
+        sot._header = mock.Mock()
+        sot._uri = mock.Mock()
 
         args = {"arg": 1}
-        sot._update(**args)
+        with mock.patch.object(resource2.Resource, "_collect_attrs",
+                               return_value=(body, header, uri)) as collect:
+            sot._update(**args)
 
-        sot._collect_attrs.assert_called_once_with(args)
+        collect.assert_called_once_with(args)
         sot._body.update.assert_called_once_with(body)
         sot._header.update.assert_called_once_with(header)
         sot._uri.update.assert_called_once_with(uri)
@@ -481,11 +518,10 @@ class TestResource(base.TestCase):
 
         expected_attrs = ["body", "header", "uri"]
 
-        sot._consume_attrs = mock.Mock()
-        sot._consume_attrs.side_effect = expected_attrs
-
         # It'll get passed an empty dict at the least.
-        actual_attrs = sot._collect_attrs(dict())
+        with mock.patch.object(resource2.Resource, "_consume_attrs",
+                               side_effect=expected_attrs):
+            actual_attrs = sot._collect_attrs(dict())
 
         self.assertItemsEqual(expected_attrs, actual_attrs)
 
@@ -519,6 +555,20 @@ class TestResource(base.TestCase):
         self.assertDictEqual({serverside_key1: value1,
                               serverside_key2: value2}, result)
 
+    def test__consume_attrs_server_names(self):
+        mapping = {"client_key": "serverKey"}
+        attrs = {"serverKey": 1, "otherKey": 2}
+
+        sot = resource2.Resource()
+
+        # Only the given set of server-side names is consulted.
+        result = sot._consume_attrs(mapping, dict(attrs), frozenset())
+        self.assertDictEqual({}, result)
+
+        result = sot._consume_attrs(mapping, attrs, frozenset(["serverKey"]))
+        self.assertDictEqual({"serverKey": 1}, result)
+        self.assertDictEqual({"otherKey": 2}, attrs)
+
     def test__mapping_defaults(self):
         # Check that even on an empty class, we get the expected
         # built-in attributes.
@@ -572,6 +622,38 @@ class TestResource(base.TestCase):
         self.assertIn("y", Test._uri_mapping())
         self.assertIn("z", Test._uri_mapping())
 
+    def test__mapping_precomputed(self):
+        class Test(resource2.Resource):
+            x = resource2.Body("the_x")
+
+        # The same mapping is handed back on every call rather than
+        # being rebuilt from the MRO each time.
+        self.assertIs(Test._body_mapping(), Test._body_mapping())
+        self.assertEqual("the_x", Test._body_mapping()["x"])
+        self.assertNotIn("x", resource2.Resource._body_mapping())
+
+    @testtools.skipIf(six.PY2, "Mappings are plain dicts on Python 2")
+    def test__mapping_read_only(self):
+        mapping = resource2.Resource._body_mapping()
+
+        def assign():
+            mapping["x"] = "x"
+
+        self.assertRaises(TypeError, assign)
+
+    def test__get_server_names(self):
+        class Test(resource2.Resource):
+            x = resource2.Body("the_x")
+            y = resource2.Header("the_y")
+            z = resource2.URI("the_z")
+
+        self.assertEqual(frozenset(["the_x", "id", "name"]),
+                         Test._get_server_names(resource2.Body))
+        self.assertEqual(frozenset(["the_y", "Location"]),
+                         Test._get_server_names(resource2.Header))
+        self.assertEqual(frozenset(["the_z"]),
+                         Test._get_server_names(resource2.URI))
+
     def test__getattribute__id_in_body(self):
         id = "lol"
         sot = resource2.Resource(id=id)
@@ -597,6 +679,20 @@ class TestResource(base.TestCase):
         sot = Test()
         self.assertIsNone(sot.id)
 
+    def test__getattribute__id_overridden(self):
+        # Keypair uses its name as its id. The id lookup has to keep
+        # looking at the "id" key and the alternate id.
+        class Test(resource2.Resource):
+            id = resource2.Body("name")
+            name = resource2.Body("name", alternate_id=True)
+
+        self.assertIsInstance(Test.__dict__["id"], resource2._Id)
+        self.assertEqual("name", Test._body_mapping()["id"])
+
+        sot = Test(id="lol")
+        self.assertEqual("lol", sot.id)
+        self.assertEqual("lol", sot.name)
+
     def test__alternate_id_None(self):
         self.assertEqual("", resource2.Resource._alternate_id())
 
@@ -836,6 +932,16 @@ class TestResource(base.TestCase):
         # The something:else mapping should not make it into here.
         self.assertEqual({server_name: value}, result)
 
+    def test__filter_component_server_names(self):
+        mapping = {"client_name": "serverName"}
+        component = {"serverName": "value", "something": "else"}
+
+        sot = resource2.Resource()
+        result = sot._filter_component(component, mapping,
+                                       frozenset(["something"]))
+
+        self.assertEqual({"something": "else"}, result)
+
     def test__translate_response_no_body(self):
         class Test(resource2.Resource):
             attr = resource2.Header("attr")
@@ -1012,6 +1118,14 @@ class TestResourceActions(base.TestCase):
         self.sot._translate_response.assert_called_once_with(self.response)
         self.assertEqual(result, self.sot)
 
+    def test_get_cache_responses(self):
+        self.test_class.cache_responses = True
+
+        self.sot.get(self.session)
+
+        self.session.get.assert_called_once_with(
+            self.request.uri, endpoint_filter=self.service_name, cache=True)
+
     def test_get_not_requires_id(self):
         result = self.sot.get(self.session, False)
 
@@ -1110,6 +1224,19 @@ class TestResourceActions(base.TestCase):
 
         self.assertEqual([], result)
 
+    def test_list_cache_responses(self):
+        self.session.get.return_value = mock.Mock(
+            json=mock.Mock(return_value=[]))
+        self.test_class.cache_responses = True
+
+        list(self.sot.list(self.session))
+
+        self.session.get.assert_called_once_with(
+            self.base_path,
+            endpoint_filter=self.service_name,
+            headers={"Accept": "application/json"},
+            params={}, cache=True)
+
     def test_list_one_page_response_paginated(self):
         id_value = 1
         mock_response = mock.Mock()
@@ -1303,6 +1430,326 @@ class TestResourceActions(base.TestCase):
         # Ensure we only made two calls to get this done
         self.assertEqual(2, len(self.session.get.call_args_list))
 
+    def test_list_prefetch(self):
+        ids = [1, 2, 3]
+        resp1 = mock.Mock()
+        resp1.json.return_value = [{"id": ids[0]}, {"id": ids[1]}]
+        resp2 = mock.Mock()
+        resp2.json.return_value = [{"id": ids[2]}]
+
+        self.session.get.side_effect = [resp1, resp2]
+
+        results = list(self.sot.list(self.session, paginated=True,
+                                     prefetch=1))
+
+        self.assertEqual(ids, [result.id for result in results])
+        self.assertEqual(2, len(self.session.get.call_args_list))
+        self.assertEqual({"limit": 2, "marker": 2},
+                         self.session.get.call_args_list[1][1]["params"])
+
+    def test_list_prefetch_error(self):
+        resp1 = mock.Mock()
+        resp1.json.return_value = [{"id": 1}]
+
+        self.session.get.side_effect = [resp1,
+                                        exceptions.HttpException("oops")]
+
+        results = self.sot.list(self.session, paginated=True, prefetch=2)
+
+        # Items received before the error are still yielded.
+        self.assertEqual(1, next(results).id)
+        self.assertRaises(exceptions.HttpException, next, results)
+
+    def _streamed(self, body, chunk_size=4):
+        response = mock.Mock()
+        response.iter_content.return_value = [
+            body[i:i + chunk_size] for i in range(0, len(body), chunk_size)]
+        return response
+
+    def test_list_stream(self):
+        self.test_class.resources_key = "things"
+        response = self._streamed(
+            b'{"links": [], "things": [{"id": 1, "self": "x"}, {"id": 2}]}')
+        self.session.get.return_value = response
+
+        results = self.sot.list(self.session, stream=True)
+
+        self.assertEqual(1, next(results).id)
+        self.assertFalse(response.close.called)
+        self.assertEqual(2, next(results).id)
+        self.assertRaises(StopIteration, next, results)
+        response.close.assert_called_once_with()
+        self.session.get.assert_called_once_with(
+            self.base_path,
+            endpoint_filter=self.service_name,
+            headers={"Accept": "application/json"},
+            params={}, stream=True)
+
+    def test_list_stream_paginated(self):
+        self.session.get.side_effect = [
+            self._streamed(b'[{"id": 1}, {"id": 2}]'),
+            self._streamed(b'[{"id": 3}]')]
+
+        results = list(self.sot.list(self.session, paginated=True,
+                                     stream=True))
+
+        self.assertEqual([1, 2, 3], [result.id for result in results])
+        self.assertEqual(2, len(self.session.get.call_args_list))
+        self.assertEqual({"limit": 2, "marker": 2},
+                         self.session.get.call_args_list[1][1]["params"])
+
+    def test_list_stream_empty(self):
+        self.session.get.return_value = self._streamed(b"[]")
+
+        results = list(self.sot.list(self.session, paginated=True,
+                                     stream=True))
+
+        self.assertEqual([], results)
+        self.assertEqual(1, len(self.session.get.call_args_list))
+
+    def test_list_fields_server_side(self):
+        class Port(self.test_class):
+            service = network_service.NetworkService()
+            name = resource2.Body("name")
+            project_id = resource2.Body("tenant_id")
+
+        self.response.json.return_value = [{"id": 1, "name": "a",
+                                            "tenant_id": "p"}]
+
+        results = list(Port.list(self.session,
+                                 fields=["name", "project_id"]))
+
+        self.assertEqual({"fields": ["name", "tenant_id"]},
+                         self.session.get.call_args[1]["params"])
+        self.assertEqual("a", results[0].name)
+        self.assertEqual("p", results[0].project_id)
+        self.assertIsNone(results[0].id)
+
+    def test_list_fields_client_side(self):
+        class Test(self.test_class):
+            name = resource2.Body("name")
+            status = resource2.Body("status")
+
+        self.response.json.return_value = [
+            {"id": 1, "name": "a", "status": "ACTIVE"}]
+
+        result, = Test.list(self.session, fields=["id", "name"])
+
+        self.assertEqual({}, self.session.get.call_args[1]["params"])
+        self.assertEqual(1, result.id)
+        self.assertEqual("a", result.name)
+        self.assertIsNone(result.status)
+
+    def test_list_records(self):
+        class Test(self.test_class):
+            name = resource2.Body("name")
+
+        resp1 = mock.Mock()
+        resp1.json.return_value = [{"id": 1, "name": "a"},
+                                   {"id": 2, "name": "b"}]
+        resp2 = mock.Mock()
+        resp2.json.return_value = [{"id": 3, "name": "c"}]
+        self.session.get.side_effect = [resp1, resp2]
+
+        results = list(Test.list(self.session, paginated=True,
+                                 fields=["name"], records=True))
+
+        self.assertEqual(["a", "b", "c"], [result.name for result in results])
+        self.assertEqual(("c", 3), results[2])
+        self.assertEqual({"limit": 2, "marker": 2},
+                         self.session.get.call_args_list[1][1]["params"])
+
+    def test_list_records_stream(self):
+        self.session.get.return_value = self._streamed(
+            b'[{"id": 1, "name": "x", "other": "y"}]')
+
+        result, = self.sot.list(self.session, records=True, stream=True)
+
+        # Without fields, records have every attribute of the resource.
+        self.assertEqual((1, "x"), result)
+        self.assertEqual("x", result.name)
+
+    def test_list_stream_closed_early(self):
+        response = self._streamed(b'[{"id": 1}, {"id": 2}]')
+        self.session.get.return_value = response
+
+        results = self.sot.list(self.session, stream=True)
+        next(results)
+        results.close()
+
+        response.close.assert_called_once_with()
+
+    def test_list_next_link(self):
+        class Test(self.test_class):
+            resources_key = "things"
+            pagination = pagination.NextLink("things_links")
+
+        resp1 = mock.Mock()
+        resp1.json.return_value = {
+            "things": [{"id": 1}, {"id": 2}],
+            "things_links": [{"rel": "next",
+                              "href": "http://other/things?marker=2&limit=2"}]}
+        resp2 = mock.Mock()
+        resp2.json.return_value = {"things": [{"id": 3}, {"id": 4}]}
+        self.session.get.side_effect = [resp1, resp2]
+
+        results = list(Test.list(self.session, paginated=True, limit=5))
+
+        self.assertEqual([1, 2, 3, 4], [result.id for result in results])
+        # The service capped the limit and had no next page after the
+        # second, so no more were requested.
+        self.assertEqual(2, len(self.session.get.call_args_list))
+        self.assertEqual(Test.base_path,
+                         self.session.get.call_args_list[1][0][0])
+        self.assertEqual({"limit": "2", "marker": "2"},
+                         self.session.get.call_args_list[1][1]["params"])
+
+    def test_list_next_link_stream(self):
+        class Test(self.test_class):
+            resources_key = "things"
+            pagination = pagination.NextLink("next")
+
+        self.session.get.side_effect = [
+            self._streamed(b'{"things": [{"id": 1}], "next": "/t?marker=1"}'),
+            self._streamed(b'{"things": [{"id": 2}]}')]
+
+        results = list(Test.list(self.session, paginated=True, stream=True))
+
+        self.assertEqual([1, 2], [result.id for result in results])
+        self.assertEqual({"marker": "1"},
+                         self.session.get.call_args_list[1][1]["params"])
+        self.assertEqual(2, len(self.session.get.call_args_list))
+
+    def test_list_offset(self):
+        class Test(self.test_class):
+            pagination = pagination.Offset()
+
+        resp1 = mock.Mock()
+        resp1.json.return_value = [{"id": 1}, {"id": 2}]
+        resp2 = mock.Mock()
+        resp2.json.return_value = [{"id": 3}]
+        self.session.get.side_effect = [resp1, resp2]
+
+        results = list(Test.list(self.session, paginated=True))
+
+        self.assertEqual([1, 2, 3], [result.id for result in results])
+        self.assertEqual({"limit": 2, "offset": 2},
+                         self.session.get.call_args_list[1][1]["params"])
+
+
+class TestResourceBulkCreate(base.TestCase):
+
+    def setUp(self):
+        super(TestResourceBulkCreate, self).setUp()
+
+        class Test(resource2.Resource):
+            resource_key = "thing"
+            resources_key = "things"
+            service = "service"
+            base_path = "/things"
+            allow_create = True
+            allow_bulk_create = True
+            attr = resource2.Body("attr")
+
+        self.test_class = Test
+        self.session = mock.Mock(spec=session.Session)
+
+    def _response(self, *ids):
+        response = mock.Mock()
+        response.headers = {}
+        response.json.return_value = {"things": [{"id": id, "attr": id}
+                                                 for id in ids]}
+        return response
+
+    def test_bulk_create(self):
+        self.session.post.side_effect = [self._response(1, 2),
+                                         self._response(3)]
+
+        result = self.test_class.bulk_create(
+            self.session, [{"attr": 1}, {"attr": 2}, {"attr": 3}],
+            batch_size=2)
+
+        self.assertEqual([1, 2, 3], [res.id for res in result])
+        for res in result:
+            self.assertEqual({}, res._body.dirty)
+        self.assertEqual(
+            [mock.call("/things", endpoint_filter="service",
+                       json={"things": [{"attr": 1}, {"attr": 2}]},
+                       headers={}),
+             mock.call("/things", endpoint_filter="service",
+                       json={"things": [{"attr": 3}]},
+                       headers={})],
+            self.session.post.call_args_list)
+
+    def test_bulk_create_not_allowed(self):
+        class Test(resource2.Resource):
+            allow_create = False
+
+        self.assertRaises(exceptions.MethodNotSupported,
+                          Test.bulk_create, self.session, [{}])
+
+    def test_bulk_create_rejected(self):
+        rejected = exceptions.HttpException("Not implemented",
+                                            http_status=501)
+
+        def single(uri, endpoint_filter, json, headers):
+            attr = json["thing"]["attr"]
+            response = mock.Mock()
+            response.headers = {}
+            response.json.return_value = {"thing": {"id": attr,
+                                                    "attr": attr}}
+            return response
+
+        calls = []
+
+        def post(uri, endpoint_filter, json, headers):
+            calls.append(json)
+            if "things" in json:
+                raise rejected
+            return single(uri, endpoint_filter, json, headers)
+
+        self.session.post.side_effect = post
+
+        result = self.test_class.bulk_create(
+            self.session, [{"attr": 1}, {"attr": 2}, {"attr": 3}])
+
+        self.assertEqual([1, 2, 3], [res.id for res in result])
+        self.assertEqual(4, len(calls))
+
+    def test_bulk_create_error(self):
+        # Even when it mentions bulk, a 400 may be any invalid input.
+        error = exceptions.HttpException("Bulk operation not supported",
+                                         http_status=400)
+        self.session.post.side_effect = error
+
+        self.assertRaises(exceptions.HttpException,
+                          self.test_class.bulk_create,
+                          self.session, [{"attr": 1}])
+        self.assertEqual(1, self.session.post.call_count)
+
+    def test_bulk_create_not_declared(self):
+        class Test(self.test_class):
+            allow_bulk_create = False
+
+        response = mock.Mock()
+        response.headers = {}
+        response.json.return_value = {"thing": {"id": 1, "attr": 1}}
+        self.session.post.return_value = response
+
+        result = Test.bulk_create(self.session, [{"attr": 1}])
+
+        self.assertEqual([1], [res.id for res in result])
+        self.session.post.assert_called_once_with(
+            "/things", endpoint_filter="service",
+            json={"thing": {"attr": 1}}, headers={})
+
+    def test_bulk_create_invalid_response(self):
+        self.session.post.return_value = self._response(1)
+
+        self.assertRaises(exceptions.InvalidResponse,
+                          self.test_class.bulk_create,
+                          self.session, [{"attr": 1}, {"attr": 2}])
+
 
 class TestResourceFind(base.TestCase):
 
@@ -1486,6 +1933,160 @@ class TestWaitForStatus(base.TestCase):
                           "session", resource, "status", None, 0, -1)
 
 
+class TestWaitForStatuses(base.TestCase):
+
+    def setUp(self):
+        super(TestWaitForStatuses, self).setUp()
+
+        class Test(resource2.Resource):
+            allow_list = True
+            status = resource2.Body("status")
+
+        self.test_class = Test
+        self.resources = [Test.existing(id=id, status="building")
+                          for id in range(3)]
+
+    def _listing(self, *statuses):
+        return [self.test_class.existing(id=id, status=status)
+                for id, status in enumerate(statuses)]
+
+    @mock.patch("time.sleep", return_value=None)
+    def test_statuses(self, mock_sleep):
+        listings = [self._listing("building", "active", "building"),
+                    self._listing("building", "active", "active"),
+                    self._listing("active", "active", "active")]
+
+        with mock.patch.object(self.test_class, "list",
+                               side_effect=listings) as mock_list:
+            result = list(resource2.wait_for_statuses(
+                "session", self.resources, "active", None, 1, 5,
+                name="test"))
+
+        self.assertEqual([(self.resources[1], None),
+                          (self.resources[2], None),
+                          (self.resources[0], None)], result)
+        self.assertEqual(3, mock_list.call_count)
+        mock_list.assert_called_with("session", paginated=True, name="test")
+        self.assertEqual(2, mock_sleep.call_count)
+        for res in self.resources:
+            self.assertEqual("active", res.status)
+            self.assertEqual({}, res._body.dirty)
+
+    def test_immediate_statuses(self):
+        self.resources[0]._update(status="active")
+        self.resources[0]._body.clean()
+
+        with mock.patch.object(self.test_class, "list",
+                               return_value=self._listing(
+                                   "active", "active", "active")):
+            result = resource2.wait_for_statuses(
+                "session", self.resources, "active", None, 1, 5)
+            # The resource which already has the status is resolved
+            # before anything is listed.
+            self.assertEqual((self.resources[0], None), next(result))
+            self.assertFalse(self.test_class.list.called)
+            self.assertEqual(2, len(list(result)))
+
+    @mock.patch("time.sleep", return_value=None)
+    def test_failure_and_timeouts(self, mock_sleep):
+        listing = self._listing("error", "building", "building")
+
+        with mock.patch.object(self.test_class, "list",
+                               return_value=listing) as mock_list:
+            result = list(resource2.wait_for_statuses(
+                "session", self.resources, "active", ["error"], 1,
+                {0: 5, 1: 2, 2: 3}))
+
+        self.assertEqual([0, 1, 2], [res.id for res, exc in result])
+        self.assertIsInstance(result[0][1], exceptions.ResourceFailure)
+        self.assertIsInstance(result[1][1], exceptions.ResourceTimeout)
+        self.assertIsInstance(result[2][1], exceptions.ResourceTimeout)
+        self.assertEqual(3, mock_list.call_count)
+        self.assertEqual(3, mock_sleep.call_count)
+
+    @mock.patch("time.sleep", return_value=None)
+    def test_unlisted(self, mock_sleep):
+        listing = self._listing("active")
+        gone = exceptions.NotFoundException("gone")
+
+        with mock.patch.object(self.test_class, "list",
+                               return_value=listing):
+            with mock.patch.object(self.test_class, "get",
+                                   side_effect=[None, gone]) as mock_get:
+                result = list(resource2.wait_for_statuses(
+                    "session", self.resources[:2], "active", None, 1, 5))
+
+        self.assertEqual((self.resources[0], None), result[0])
+        self.assertEqual((self.resources[1], gone), result[1])
+        self.assertEqual(2, mock_get.call_count)
+
+    @mock.patch("time.sleep", return_value=None)
+    def test_wait_default(self, mock_sleep):
+        listing = self._listing("building", "building", "building")
+
+        with mock.patch.object(self.test_class, "list",
+                               return_value=listing):
+            result = list(resource2.wait_for_statuses(
+                "session", self.resources, "active", None, 1, {0: 3},
+                default_wait=2))
+
+        self.assertEqual([1, 2, 0], [res.id for res, exc in result])
+        for res, exc in result:
+            self.assertIsInstance(exc, exceptions.ResourceTimeout)
+        self.assertEqual(3, mock_sleep.call_count)
+
+    @mock.patch("time.sleep", return_value=None)
+    def test_unlisted_error(self, mock_sleep):
+        listings = [self._listing("building"), self._listing("active")]
+        error = exceptions.HttpException("boom", http_status=500)
+
+        with mock.patch.object(self.test_class, "list",
+                               side_effect=listings):
+            with mock.patch.object(self.test_class, "get",
+                                   side_effect=error):
+                result = list(resource2.wait_for_statuses(
+                    "session", self.resources[:2], "active", None, 1, 5))
+
+        self.assertEqual([(self.resources[1], error),
+                          (self.resources[0], None)], result)
+
+    def test_stops_listing(self):
+        listing = iter(self._listing("active", "active", "active"))
+
+        with mock.patch.object(self.test_class, "list",
+                               return_value=listing):
+            result = list(resource2.wait_for_statuses(
+                "session", self.resources[:2], "active", None, 1, 5))
+
+        self.assertEqual(2, len(result))
+        # The third resource was never needed, so it's left unconsumed.
+        self.assertEqual(2, next(listing).id)
+
+    def test_pages_until_seen(self):
+        responses = []
+        for page in ([0, 1], [2, 3], [4]):
+            response = mock.Mock()
+            response.json.return_value = [{"id": id, "status": "active"}
+                                          for id in page]
+            responses.append(response)
+        session = mock.Mock()
+        session.get.side_effect = responses
+
+        with mock.patch.object(self.test_class, "get") as mock_get:
+            result = list(resource2.wait_for_statuses(
+                session, self.resources, "active", None, 1, 5))
+
+        self.assertEqual(3, len(result))
+        # The resource on the second page was found by listing it rather
+        # than by getting it, and the third page wasn't needed.
+        self.assertFalse(mock_get.called)
+        self.assertEqual(2, session.get.call_count)
+
+    def test_no_resources(self):
+        self.assertEqual([], list(resource2.wait_for_statuses(
+            "session", [], "active", None, 1, 5)))
+
+
 class TestWaitForDelete(base.TestCase):
 
     @mock.patch("time.sleep", return_value=None)
@@ -0,0 +1,112 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import mock
+
+from openstack import response_cache
+from openstack import service_filter
+from openstack.tests.unit import base
+
+
+class TestResponseCache(base.TestCase):
+
+    def setUp(self):
+        super(TestResponseCache, self).setUp()
+        self.sot = response_cache.ResponseCache(ttl=60, maxsize=2)
+
+    def test_get_missing(self):
+        self.assertIsNone(self.sot.get(("/flavors",)))
+        self.assertEqual({"hits": 0, "misses": 1, "revalidated": 0},
+                         self.sot.get_stats())
+
+    def test_set_get(self):
+        response = mock.Mock()
+        self.sot.set(("/flavors",), response)
+
+        entry = self.sot.get(("/flavors",))
+
+        self.assertIs(response, entry.response)
+        self.assertTrue(entry.fresh)
+        self.assertEqual({"hits": 1, "misses": 0, "revalidated": 0},
+                         self.sot.get_stats())
+
+    @mock.patch("time.time")
+    def test_expired(self, mock_time):
+        mock_time.return_value = 1000
+        self.sot.set(("/flavors",), mock.Mock())
+
+        mock_time.return_value = 1061
+        entry = self.sot.get(("/flavors",))
+
+        self.assertFalse(entry.fresh)
+        self.assertEqual({"hits": 0, "misses": 1, "revalidated": 0},
+                         self.sot.get_stats())
+
+        self.sot.revalidated(("/flavors",))
+
+        self.assertTrue(entry.fresh)
+        self.assertEqual(1, self.sot.get_stats()["revalidated"])
+
+    def test_least_recently_used_evicted(self):
+        self.sot.set(("/a",), mock.Mock())
+        self.sot.set(("/b",), mock.Mock())
+        # Using /a makes /b the least recently used.
+        self.sot.get(("/a",))
+        self.sot.set(("/c",), mock.Mock())
+
+        self.assertIsNotNone(self.sot.get(("/a",)))
+        self.assertIsNone(self.sot.get(("/b",)))
+        self.assertIsNotNone(self.sot.get(("/c",)))
+
+    def test_invalidate(self):
+        self.sot.maxsize = 10
+        for url in ("/flavors", "/flavors/detail", "flavors?limit=1",
+                    "/flavors_extra", "/servers"):
+            self.sot.set((url, ()), mock.Mock())
+
+        self.sot.invalidate("flavors/")
+
+        self.assertIsNone(self.sot.get(("/flavors", ())))
+        self.assertIsNone(self.sot.get(("/flavors/detail", ())))
+        self.assertIsNone(self.sot.get(("flavors?limit=1", ())))
+        self.assertIsNotNone(self.sot.get(("/flavors_extra", ())))
+        self.assertIsNotNone(self.sot.get(("/servers", ())))
+
+        self.sot.invalidate()
+
+        self.assertIsNone(self.sot.get(("/servers", ())))
+
+    def test_normalize_url(self):
+        self.assertEqual("flavors", response_cache.normalize_url("/flavors/"))
+        self.assertEqual("flavors/abc",
+                         response_cache.normalize_url("flavors/abc"))
+        self.assertEqual("flavors?a=1&b=2",
+                         response_cache.normalize_url("/flavors?b=2&a=1"))
+
+    def test_entry_validators(self):
+        entry = response_cache.CachedResponse(
+            mock.Mock(headers={"ETag": "abc",
+                               "Last-Modified": "yesterday"}), 0)
+
+        self.assertEqual("abc", entry.etag)
+        self.assertEqual("yesterday", entry.last_modified)
+
+    def test_caches(self):
+        sot = response_cache.ResponseCache(service_types=["compute"])
+
+        self.assertTrue(sot.caches(
+            service_filter.ServiceFilter("compute")))
+        self.assertFalse(sot.caches(
+            service_filter.ServiceFilter("network")))
+        self.assertFalse(sot.caches(None))
+        self.assertFalse(self.sot.caches(
+            service_filter.ServiceFilter("compute")))
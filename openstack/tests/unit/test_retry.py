@@ -0,0 +1,223 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import threading
+
+import fixtures
+import mock
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
+
+from openstack import exceptions
+from openstack import retry
+from openstack import session
+from openstack.tests.unit import base
+
+
+class TestRetryPolicy(base.TestCase):
+
+    def test_methods(self):
+        sot = retry.RetryPolicy()
+        for method in ("GET", "head", "PUT", "DELETE"):
+            self.assertTrue(sot.retries_method(method))
+        for method in ("POST", "PATCH"):
+            self.assertFalse(sot.retries_method(method))
+
+        sot = retry.RetryPolicy(retry_post=True)
+        self.assertTrue(sot.retries_method("POST"))
+        self.assertTrue(sot.retries_method("PATCH"))
+
+    @mock.patch("random.uniform", side_effect=lambda low, high: high)
+    def test_delay(self, mock_uniform):
+        sot = retry.RetryPolicy(backoff=0.5, max_backoff=3)
+
+        self.assertEqual([0.5, 1, 2, 3, 3],
+                         [sot.get_delay(n) for n in range(1, 6)])
+        mock_uniform.assert_called_with(0, 3)
+
+    @mock.patch("time.sleep")
+    def test_attempts_exhausted(self, mock_sleep):
+        sot = retry.RetryPolicy(max_attempts=3)
+        attempts = sot.start()
+
+        results = []
+        for _ in range(3):
+            attempts.next()
+            results.append(attempts.retry())
+
+        self.assertEqual([True, True, False], results)
+        self.assertEqual(2, mock_sleep.call_count)
+        self.assertEqual({"calls": 1, "retries": 2, "exhausted": 1,
+                          "deadline_exceeded": 0}, sot.get_stats())
+
+    @mock.patch("time.sleep")
+    @mock.patch("random.uniform", return_value=2)
+    @mock.patch("openstack.retry._now")
+    def test_deadline(self, mock_now, mock_uniform, mock_sleep):
+        mock_now.return_value = 100
+        sot = retry.RetryPolicy(deadline=5)
+        attempts = sot.start()
+
+        mock_now.return_value = 102
+        attempts.next()
+        self.assertEqual(3, attempts.remaining())
+        self.assertTrue(attempts.retry())
+
+        mock_now.return_value = 104
+        attempts.next()
+        self.assertFalse(attempts.retry())
+        self.assertEqual(1, sot.get_stats()["deadline_exceeded"])
+
+    def test_no_deadline(self):
+        self.assertIsNone(retry.RetryPolicy().start().remaining())
+
+
+class _FaultyHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """Fail requests as scripted by the server's faults"""
+
+    def _respond(self):
+        self.server.requests.append((self.command, self.path))
+        fault = self.server.faults.pop(0) if self.server.faults else 200
+        if fault == "reset":
+            # Drop the connection without responding.
+            self.close_connection = True
+            return
+        self.send_response(fault)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    do_GET = do_PUT = do_POST = do_DELETE = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+class _FaultyServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        BaseHTTPServer.HTTPServer.__init__(self, ("127.0.0.1", 0),
+                                           _FaultyHandler)
+        self.faults = []
+        self.requests = []
+
+
+class TestSessionRetries(base.TestCase):
+
+    def setUp(self):
+        super(TestSessionRetries, self).setUp()
+        self.server = _FaultyServer()
+        thread = threading.Thread(target=self.server.serve_forever,
+                                  kwargs={"poll_interval": 0.01})
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = "http://127.0.0.1:%d/servers" % self.server.server_port
+
+        # Retry immediately.
+        self.useFixture(fixtures.MockPatch("time.sleep"))
+        self.policy = retry.RetryPolicy(max_attempts=4)
+        self.sot = session.Session(None, retry_policy=self.policy)
+
+    def test_transient_statuses_retried(self):
+        self.server.faults = [502, 503, 504]
+
+        response = self.sot.get(self.url)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(4, len(self.server.requests))
+        self.assertEqual({"calls": 1, "retries": 3, "exhausted": 0,
+                          "deadline_exceeded": 0}, self.policy.get_stats())
+
+    def test_connection_reset_retried(self):
+        self.server.faults = ["reset", "reset"]
+
+        response = self.sot.delete(self.url)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual([("DELETE", "/servers")] * 3, self.server.requests)
+
+    def test_exhausted(self):
+        self.server.faults = [503] * 5
+
+        error = self.assertRaises(exceptions.HttpException, self.sot.put,
+                                  self.url, json={})
+
+        self.assertEqual(503, error.http_status)
+        self.assertEqual(4, len(self.server.requests))
+        self.assertEqual(1, self.policy.get_stats()["exhausted"])
+
+    def test_exhausted_not_raised(self):
+        self.server.faults = [503] * 5
+
+        response = self.sot.get(self.url, raise_exc=False)
+
+        self.assertEqual(503, response.status_code)
+        self.assertEqual(4, len(self.server.requests))
+
+    def test_other_errors_not_retried(self):
+        self.server.faults = [500]
+
+        self.assertRaises(exceptions.HttpException, self.sot.get, self.url)
+        self.assertEqual(1, len(self.server.requests))
+
+    def test_post_not_retried(self):
+        self.server.faults = [503]
+
+        self.assertRaises(exceptions.HttpException, self.sot.post,
+                          self.url, json={})
+        self.assertEqual(1, len(self.server.requests))
+
+    def test_per_call_policy(self):
+        self.server.faults = [503]
+        policy = retry.RetryPolicy(retry_post=True)
+
+        with self.sot.retries(policy):
+            response = self.sot.post(self.url, json={})
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(2, len(self.server.requests))
+        self.assertEqual(1, policy.get_stats()["retries"])
+        self.assertEqual(0, self.policy.get_stats()["calls"])
+
+        # The session's policy applies again after the block.
+        self.server.faults = [503]
+        self.assertRaises(exceptions.HttpException, self.sot.post,
+                          self.url, json={})
+
+    def test_per_call_no_retries(self):
+        self.server.faults = [503]
+
+        with self.sot.retries(None):
+            self.assertRaises(exceptions.HttpException, self.sot.get,
+                              self.url)
+        self.assertEqual(1, len(self.server.requests))
+
+    def test_no_policy(self):
+        self.server.faults = [503]
+        sot = session.Session(None)
+
+        self.assertRaises(exceptions.HttpException, sot.get, self.url)
+        self.assertEqual(1, len(self.server.requests))
+
+    def test_deadline_limits_timeout(self):
+        sot = session.Session(None, timeout=30,
+                              retry_policy=retry.RetryPolicy(deadline=5))
+
+        with mock.patch.object(sot, "_send_limited") as send:
+            sot.get(self.url)
+
+        timeout = send.call_args[0][2]["timeout"]
+        self.assertTrue(0 < timeout <= 5)
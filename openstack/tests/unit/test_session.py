@@ -10,13 +10,20 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import datetime
+import threading
+import time
+
 import mock
 import testtools
 
 from keystoneauth1 import exceptions as _exceptions
 
+from openstack.compute.v2 import flavor
 from openstack import exceptions
 from openstack import profile
+from openstack import response_cache
+from openstack import service_filter
 from openstack import session
 from openstack import utils
 
@@ -305,3 +312,586 @@ class TestSession(testtools.TestCase):
         sot.endpoint_cache[(service_type, interface)] = endpoint
         rv = sot.get_endpoint(service_type=service_type, interface=interface)
         self.assertEqual(rv, endpoint)
+
+    def _discovery_session(self, cached=None):
+        cache = mock.Mock()
+        cache.get.return_value = cached
+        sot = session.Session(profile.Profile(), discovery_cache=cache,
+                              auth=mock.Mock(auth_url="http://auth"))
+        return sot, cache
+
+    @mock.patch("keystoneauth1.session.Session.get_endpoint")
+    def test_get_endpoint_discovery_cache_hit(self, mock_get_endpoint):
+        mock_get_endpoint.return_value = "http://compute/v2.1/project"
+        sot, cache = self._discovery_session("http://compute/v2.1/project")
+
+        with mock.patch.object(sot, "_get_endpoint_versions") as versions:
+            rv = sot.get_endpoint(service_type="compute",
+                                  interface="public")
+
+        self.assertEqual("http://compute/v2.1/project", rv)
+        self.assertFalse(versions.called)
+        cache.get.assert_called_once_with(
+            ("endpoint", "http://auth", None, "public", "compute", "v2",
+             "http://compute/v2.1/project"))
+        self.assertEqual({("compute", "public"): rv}, sot.endpoint_cache)
+
+    @mock.patch("keystoneauth1.session.Session.get_endpoint")
+    def test_get_endpoint_discovery_cache_miss(self, mock_get_endpoint):
+        mock_get_endpoint.return_value = "http://compute/v2.1"
+        sot, cache = self._discovery_session()
+        versions = [{"id": "v2.1", "links": [
+            {"rel": "self", "href": "http://compute/v2.1"}]}]
+        endpoint = session.Session._Endpoint("http://compute", versions)
+
+        with mock.patch.object(sot, "_get_endpoint_versions",
+                               return_value=endpoint):
+            rv = sot.get_endpoint(service_type="compute",
+                                  interface="public")
+
+        self.assertEqual("http://compute/v2.1", rv)
+        cache.set.assert_has_calls([
+            mock.call(("versions", "http://compute/v2.1"),
+                      {"uri": "http://compute", "versions": versions,
+                       "needs_project_id": False, "project_id": None}),
+            mock.call(("endpoint", "http://auth", None, "public", "compute",
+                       "v2", "http://compute/v2.1"),
+                      "http://compute/v2.1")])
+
+    def test__get_cached_endpoint_versions_hit(self):
+        sot, cache = self._discovery_session(
+            {"uri": "http://compute", "versions": [],
+             "needs_project_id": True, "project_id": "p"})
+
+        with mock.patch.object(sot, "_get_endpoint_versions") as versions:
+            rv = sot._get_cached_endpoint_versions("compute",
+                                                   "http://compute/p")
+
+        self.assertFalse(versions.called)
+        self.assertEqual(session.Session._Endpoint("http://compute", [],
+                                                   True, "p"), rv)
+
+
+class TestCreateHTTPSession(testtools.TestCase):
+
+    def test_defaults(self):
+        sot = session.create_http_session()
+
+        for prefix in ("http://", "https://"):
+            adapter = sot.get_adapter(prefix + "cloud")
+            self.assertIsInstance(adapter, session._KeepAliveAdapter)
+            self.assertEqual(10, adapter._pool_maxsize)
+            self.assertFalse(adapter._pool_block)
+            self.assertEqual(
+                session._KEEPALIVE_SOCKET_OPTIONS,
+                adapter.poolmanager.connection_pool_kw["socket_options"])
+
+    def test_pool(self):
+        sot = session.create_http_session(pool_maxsize=32, pool_block=True,
+                                          max_retries=3, keepalive=False)
+
+        adapter = sot.get_adapter("https://cloud")
+        self.assertNotIsInstance(adapter, session._KeepAliveAdapter)
+        self.assertEqual(32, adapter._pool_maxsize)
+        self.assertTrue(adapter._pool_block)
+        self.assertEqual(3, adapter.max_retries.total)
+
+
+class _PlusTwo(datetime.tzinfo):
+
+    def utcoffset(self, dt):
+        return datetime.timedelta(hours=2)
+
+    def dst(self, dt):
+        return datetime.timedelta(0)
+
+
+class TestTokenRefresher(testtools.TestCase):
+
+    def setUp(self):
+        super(TestTokenRefresher, self).setUp()
+        self.session = mock.Mock()
+        self.on_refresh = mock.Mock()
+        self.on_failure = mock.Mock()
+        self.sot = session._TokenRefresher(
+            self.session, 300, on_refresh=self.on_refresh,
+            on_failure=self.on_failure, retry_interval=30)
+
+    def _expires_in(self, seconds):
+        auth_ref = mock.Mock()
+        auth_ref.expires = (datetime.datetime.utcnow() +
+                            datetime.timedelta(seconds=seconds))
+        return auth_ref
+
+    def test_next_refresh(self):
+        self.session.auth.auth_ref = self._expires_in(3600)
+        self.assertAlmostEqual(3300, self.sot._next_refresh(), delta=5)
+
+    def test_next_refresh_timezone(self):
+        auth_ref = self._expires_in(3600)
+        auth_ref.expires = (auth_ref.expires +
+                            datetime.timedelta(hours=2)).replace(
+                                tzinfo=_PlusTwo())
+        self.session.auth.auth_ref = auth_ref
+        self.assertAlmostEqual(3300, self.sot._next_refresh(), delta=5)
+
+    def test_next_refresh_soon(self):
+        self.session.auth.auth_ref = self._expires_in(60)
+        self.assertEqual(30, self.sot._next_refresh())
+
+    def test_next_refresh_unauthenticated(self):
+        self.session.auth.auth_ref = None
+        self.assertEqual(0, self.sot._next_refresh())
+
+    def test_next_refresh_no_expiry(self):
+        self.session.auth.auth_ref.expires = None
+        self.assertIsNone(self.sot._next_refresh())
+
+    def test_refresh(self):
+        new_ref = mock.Mock()
+        self.session.auth.get_auth_ref.return_value = new_ref
+
+        self.sot._refresh()
+
+        self.session.auth.get_auth_ref.assert_called_once_with(self.session)
+        self.assertIs(new_ref, self.session.auth.auth_ref)
+        self.assertEqual(1, self.on_refresh.call_count)
+        self.assertGreaterEqual(self.on_refresh.call_args[0][0], 0)
+        self.assertFalse(self.on_failure.called)
+
+    @mock.patch("threading.Event.wait")
+    def test_refresh_failure(self, mock_wait):
+        old_ref = self.session.auth.auth_ref
+        error = _exceptions.ConnectFailure("down")
+        self.session.auth.get_auth_ref.side_effect = error
+
+        self.sot._refresh()
+
+        self.assertIs(old_ref, self.session.auth.auth_ref)
+        self.on_failure.assert_called_once_with(error)
+        self.assertFalse(self.on_refresh.called)
+        mock_wait.assert_called_once_with(30)
+
+    def test_hook_failure(self):
+        self.on_refresh.side_effect = ValueError("bad hook")
+        self.sot._refresh()
+        self.assertEqual(1, self.on_refresh.call_count)
+
+    def test_start_stop(self):
+        refreshed = threading.Event()
+        sot = session.Session(None, auth=mock.Mock(auth_ref=None))
+        sot.auth.get_auth_ref.return_value = self._expires_in(3600)
+
+        sot.start_token_refresh(on_refresh=lambda latency: refreshed.set())
+        refresher = sot._token_refresher
+        self.assertTrue(refresher.daemon)
+        self.assertTrue(refreshed.wait(5))
+
+        sot.stop_token_refresh()
+        refresher.join(5)
+        self.assertFalse(refresher.is_alive())
+        self.assertIsNone(sot._token_refresher)
+
+
+class TestCoalesceGets(testtools.TestCase):
+
+    def setUp(self):
+        super(TestCoalesceGets, self).setUp()
+        self.sot = session.Session(None, coalesce_gets=True)
+        patcher = mock.patch("keystoneauth1.session.Session.request")
+        self.mock_request = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _request_concurrently(self, *requests):
+        """Make requests on threads while the first one is in flight"""
+        started = threading.Event()
+        release = threading.Event()
+        response = mock.Mock()
+
+        def slow_request(*args, **kwargs):
+            started.set()
+            release.wait(5)
+            return response
+
+        self.mock_request.side_effect = slow_request
+        results = [None] * len(requests)
+
+        def make(i, kwargs):
+            try:
+                results[i] = self.sot.get("http://cloud/servers", **kwargs)
+            except Exception as e:
+                results[i] = e
+
+        threads = [threading.Thread(target=make, args=(i, kwargs))
+                   for i, kwargs in enumerate(requests)]
+        threads[0].start()
+        self.assertTrue(started.wait(5))
+        for thread in threads[1:]:
+            thread.start()
+        # Give the followers time to start waiting on the leader.
+        for _ in range(100):
+            if (self.sot.get_coalesce_stats()["requests"] ==
+                    len(requests)):
+                break
+            time.sleep(0.01)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        return response, results
+
+    def test_identical_requests_coalesced(self):
+        kwargs = {"params": {"name": "a"}, "headers": {"Accept": "json"}}
+        response, results = self._request_concurrently(kwargs, kwargs, kwargs)
+
+        self.assertEqual([response] * 3, results)
+        self.assertEqual(1, self.mock_request.call_count)
+        self.assertEqual({"requests": 3, "coalesced": 2},
+                         self.sot.get_coalesce_stats())
+
+    def test_different_requests_not_coalesced(self):
+        response, results = self._request_concurrently(
+            {"params": {"name": "a"}}, {"params": {"name": "b"}})
+
+        self.assertEqual([response] * 2, results)
+        self.assertEqual(2, self.mock_request.call_count)
+        self.assertEqual({"requests": 2, "coalesced": 0},
+                         self.sot.get_coalesce_stats())
+
+    def test_error_shared(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def failing_request(*args, **kwargs):
+            started.set()
+            release.wait(5)
+            raise _exceptions.HttpError(message="gone", http_status=404)
+
+        self.mock_request.side_effect = failing_request
+        errors = []
+
+        def make():
+            try:
+                self.sot.get("http://cloud/servers")
+            except Exception as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=make)
+        leader.start()
+        self.assertTrue(started.wait(5))
+        follower = threading.Thread(target=make)
+        follower.start()
+        while self.sot.get_coalesce_stats()["coalesced"] < 1:
+            time.sleep(0.01)
+        release.set()
+        leader.join(5)
+        follower.join(5)
+
+        self.assertEqual(2, len(errors))
+        for error in errors:
+            self.assertIsInstance(error, exceptions.NotFoundException)
+        self.assertEqual(1, self.mock_request.call_count)
+
+    def test_sequential_requests_not_coalesced(self):
+        self.sot.get("http://cloud/servers")
+        self.sot.get("http://cloud/servers")
+
+        self.assertEqual(2, self.mock_request.call_count)
+        self.assertEqual({"requests": 2, "coalesced": 0},
+                         self.sot.get_coalesce_stats())
+
+    def test_request_key(self):
+        key = self.sot._request_key
+        self.assertEqual(key("/a", "GET", {"params": {"x": 1, "y": 2}}),
+                         key("/a", "get", {"params": {"y": 2, "x": 1}}))
+        self.assertNotEqual(key("/a", "GET", {"headers": {"A": "1"}}),
+                            key("/a", "GET", {"headers": {"A": "2"}}))
+        self.assertIsNone(key("/a", "POST", {}))
+        self.assertIsNone(key("/a", "GET", {"json": {"a": 1}}))
+        self.assertIsNone(key("/a", "GET", {"stream": True}))
+        self.assertIsNone(key("/a", "GET", {"params": {"x": set()}}))
+
+    def test_other_methods_not_coalesced(self):
+        self.sot.post("http://cloud/servers", json={})
+
+        self.assertEqual({"requests": 0, "coalesced": 0},
+                         self.sot.get_coalesce_stats())
+        self.mock_request.assert_called_once_with(
+            "http://cloud/servers", "POST", json={})
+
+    def test_disabled(self):
+        sot = session.Session(None)
+        self.assertIsNone(sot.get_coalesce_stats())
+        sot.get("http://cloud/servers")
+        self.mock_request.assert_called_once_with("http://cloud/servers",
+                                                  "GET")
+
+
+class TestResponseCache(testtools.TestCase):
+
+    def setUp(self):
+        super(TestResponseCache, self).setUp()
+        self.cache = response_cache.ResponseCache(ttl=60)
+        self.sot = session.Session(None, response_cache=self.cache)
+        patcher = mock.patch("keystoneauth1.session.Session.request")
+        self.mock_request = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.filter = service_filter.ServiceFilter("compute")
+
+    def _response(self, status_code=200, headers=None):
+        return mock.Mock(status_code=status_code, headers=headers or {})
+
+    def test_cached(self):
+        response = self._response()
+        self.mock_request.return_value = response
+
+        first = self.sot.get("/flavors", endpoint_filter=self.filter,
+                             cache=True)
+        second = self.sot.get("/flavors", endpoint_filter=self.filter,
+                              cache=True)
+
+        self.assertIs(response, first)
+        self.assertIs(response, second)
+        self.mock_request.assert_called_once_with(
+            "/flavors", "GET", endpoint_filter=self.filter)
+
+    def test_not_cached_by_default(self):
+        self.mock_request.return_value = self._response()
+
+        self.sot.get("/flavors", endpoint_filter=self.filter)
+        self.sot.get("/flavors", endpoint_filter=self.filter)
+
+        self.assertEqual(2, self.mock_request.call_count)
+
+    def test_cached_service_types(self):
+        self.cache.service_types = frozenset(["compute"])
+        self.mock_request.return_value = self._response()
+
+        self.sot.get("/flavors", endpoint_filter=self.filter)
+        self.sot.get("/flavors", endpoint_filter=self.filter)
+
+        self.assertEqual(1, self.mock_request.call_count)
+
+    def test_different_params(self):
+        self.mock_request.return_value = self._response()
+
+        self.sot.get("/flavors", params={"limit": 1}, cache=True)
+        self.sot.get("/flavors", params={"limit": 2}, cache=True)
+
+        self.assertEqual(2, self.mock_request.call_count)
+
+    def test_errors_not_cached(self):
+        self.mock_request.return_value = self._response(status_code=203)
+
+        self.sot.get("/flavors", cache=True)
+        self.sot.get("/flavors", cache=True)
+
+        self.assertEqual(2, self.mock_request.call_count)
+
+    @mock.patch("time.time")
+    def test_revalidated(self, mock_time):
+        mock_time.return_value = 1000
+        response = self._response(headers={"ETag": "abc",
+                                           "Last-Modified": "yesterday"})
+        self.mock_request.return_value = response
+        self.sot.get("/flavors", headers={"Accept": "json"}, cache=True)
+
+        mock_time.return_value = 1100
+        self.mock_request.return_value = self._response(status_code=304)
+        result = self.sot.get("/flavors", headers={"Accept": "json"},
+                              cache=True)
+
+        self.assertIs(response, result)
+        self.mock_request.assert_called_with(
+            "/flavors", "GET", headers={"Accept": "json",
+                                        "If-None-Match": "abc",
+                                        "If-Modified-Since": "yesterday"})
+        self.assertEqual(1, self.cache.get_stats()["revalidated"])
+
+        # Revalidating keeps it for another ttl.
+        self.sot.get("/flavors", headers={"Accept": "json"}, cache=True)
+        self.assertEqual(2, self.mock_request.call_count)
+
+    @mock.patch("time.time")
+    def test_expired_changed(self, mock_time):
+        mock_time.return_value = 1000
+        self.mock_request.return_value = self._response(
+            headers={"ETag": "abc"})
+        self.sot.get("/flavors", cache=True)
+
+        mock_time.return_value = 1100
+        changed = self._response(headers={"ETag": "def"})
+        self.mock_request.return_value = changed
+
+        self.assertIs(changed, self.sot.get("/flavors", cache=True))
+        self.assertIs(changed, self.sot.get("/flavors", cache=True))
+        self.assertEqual(2, self.mock_request.call_count)
+
+    def test_write_invalidates(self):
+        listed = mock.Mock(status_code=200, headers={})
+        listed.json.return_value = {"flavors": [{"id": "abc"}]}
+        deleted = mock.Mock(status_code=204, headers={})
+        self.mock_request.side_effect = [listed, deleted, listed]
+
+        self.assertEqual(1, len(list(flavor.Flavor.list(self.sot))))
+        flavor.Flavor(id="abc").delete(self.sot)
+        self.assertEqual(1, len(list(flavor.Flavor.list(self.sot))))
+
+        # The collection is requested as "/flavors" and its members as
+        # "flavors/abc", so the delete must drop the cached listing.
+        self.assertEqual(["/flavors", "flavors/abc", "/flavors"],
+                         [c[0][0] for c in self.mock_request.call_args_list])
+
+    def test_write_failure_invalidates(self):
+        self.mock_request.return_value = self._response()
+        self.sot.get("/flavors", cache=True)
+
+        self.mock_request.side_effect = _exceptions.ConnectFailure("down")
+        self.assertRaises(exceptions.SDKException, self.sot.post, "/flavors",
+                          json={})
+
+        self.assertIsNone(self.cache.get(
+            self.sot._request_key("/flavors", "GET", {})))
+
+    def test_invalidated_url(self):
+        self.assertEqual("flavors",
+                         session._invalidated_url("/flavors", "POST"))
+        self.assertEqual("flavors",
+                         session._invalidated_url("/flavors/1/", "PUT"))
+        self.assertEqual("flavors",
+                         session._invalidated_url("flavors/1?x=1",
+                                                  "DELETE"))
+
+    def test_key_normalized(self):
+        self.assertEqual(
+            self.sot._request_key("/flavors/?b=2&a=1", "GET", {}),
+            self.sot._request_key("flavors?a=1&b=2", "GET", {}))
+
+    def test_cache_argument_without_cache(self):
+        sot = session.Session(None)
+        self.mock_request.return_value = self._response()
+
+        sot.get("/flavors", cache=True)
+
+        self.mock_request.assert_called_once_with("/flavors", "GET")
+
+
+class TestRateLimit(testtools.TestCase):
+
+    def setUp(self):
+        super(TestRateLimit, self).setUp()
+        prof = profile.Profile()
+        prof.set_rate_limit("compute", 100, max_retries=2)
+        self.limiter = prof.get_rate_limiter("compute")
+        self.limiter.acquire = mock.Mock(return_value=0)
+        self.sot = session.Session(prof)
+        patcher = mock.patch("keystoneauth1.session.Session.request")
+        self.mock_request = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.filter = service_filter.ServiceFilter("compute")
+
+    def _error(self, status, retry_after=None):
+        headers = {"Retry-After": retry_after} if retry_after else {}
+        return _exceptions.HttpError(
+            http_status=status, response=mock.Mock(headers=headers))
+
+    def test_limited(self):
+        response = mock.Mock(status_code=200, headers={})
+        self.mock_request.return_value = response
+
+        self.assertIs(response, self.sot.get("/servers",
+                                             endpoint_filter=self.filter))
+        self.limiter.acquire.assert_called_once_with()
+
+    def test_other_services_not_limited(self):
+        self.mock_request.return_value = mock.Mock(status_code=200)
+
+        self.sot.get("/networks",
+                     endpoint_filter=service_filter.ServiceFilter("network"))
+        self.sot.get("http://cloud/")
+
+        self.assertFalse(self.limiter.acquire.called)
+
+    def test_too_many_requests_retried(self):
+        response = mock.Mock(status_code=200, headers={})
+        self.mock_request.side_effect = [self._error(429, "2"), response]
+
+        with mock.patch.object(self.limiter, "throttled") as throttled:
+            result = self.sot.post("/servers", endpoint_filter=self.filter,
+                                   json={})
+
+        self.assertIs(response, result)
+        throttled.assert_called_once_with(2.0)
+        self.assertEqual(2, self.mock_request.call_count)
+        self.assertEqual(2, self.limiter.acquire.call_count)
+
+    def test_too_many_requests_retries_exhausted(self):
+        self.mock_request.side_effect = self._error(429)
+
+        error = self.assertRaises(exceptions.HttpException, self.sot.get,
+                                  "/servers", endpoint_filter=self.filter)
+
+        self.assertEqual(429, error.http_status)
+        self.assertEqual(3, self.mock_request.call_count)
+        self.assertEqual(3, self.limiter.get_stats()["throttled"])
+        self.assertEqual(50, self.limiter.rate)
+
+    def test_unavailable_not_retried(self):
+        self.mock_request.side_effect = self._error(503, "1")
+
+        self.assertRaises(exceptions.HttpException, self.sot.get,
+                          "/servers", endpoint_filter=self.filter)
+
+        self.assertEqual(1, self.mock_request.call_count)
+        self.assertEqual(50, self.limiter.rate)
+
+    def test_over_limit(self):
+        self.mock_request.side_effect = self._error(413)
+
+        self.assertRaises(exceptions.HttpException, self.sot.put,
+                          "/servers/1", endpoint_filter=self.filter, json={})
+
+        self.assertEqual(0, self.limiter.get_stats()["throttled"])
+
+        self.mock_request.reset_mock()
+        self.mock_request.side_effect = [
+            self._error(413, "1"), mock.Mock(status_code=200, headers={})]
+
+        self.sot.put("/servers/1", endpoint_filter=self.filter, json={})
+
+        self.assertEqual(2, self.mock_request.call_count)
+        self.assertEqual(1, self.limiter.get_stats()["throttled"])
+
+    def test_other_errors_raised(self):
+        self.mock_request.side_effect = self._error(404)
+
+        self.assertRaises(exceptions.NotFoundException, self.sot.get,
+                          "/servers/1", endpoint_filter=self.filter)
+        self.assertEqual(1, self.mock_request.call_count)
+        self.assertEqual(0, self.limiter.get_stats()["throttled"])
+
+    def test_streamed_body_not_retried(self):
+        self.mock_request.side_effect = self._error(429)
+
+        self.assertRaises(exceptions.HttpException, self.sot.put,
+                          "/servers/1", endpoint_filter=self.filter,
+                          data=mock.Mock(spec=["read"]))
+        self.assertEqual(1, self.mock_request.call_count)
+
+    def test_not_raised(self):
+        self.mock_request.return_value = mock.Mock(
+            status_code=429, headers={"Retry-After": "1"})
+
+        response = self.sot.get("/servers", endpoint_filter=self.filter,
+                                raise_exc=False)
+
+        self.assertEqual(429, response.status_code)
+        self.assertEqual(1, self.limiter.get_stats()["throttled"])
+
+    def test_success_raises_rate(self):
+        self.limiter.rate = 10
+        self.mock_request.return_value = mock.Mock(status_code=200,
+                                                   headers={})
+
+        self.sot.get("/servers", endpoint_filter=self.filter)
+
+        self.assertEqual(11, self.limiter.rate)
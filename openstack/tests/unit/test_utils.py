@@ -13,6 +13,7 @@
 import mock
 import sys
 import testtools
+import threading
 
 from openstack import utils
 
@@ -88,3 +89,62 @@ class Test_urljoin(testtools.TestCase):
 
         result = utils.urljoin(root, *leaves)
         self.assertEqual(result, "http://www.example.com/foo/")
+
+
+class TestPrefetch(testtools.TestCase):
+
+    def test_items(self):
+        results = utils.prefetch(iter(range(10)), 2)
+
+        self.assertEqual(list(range(10)), list(results))
+
+    def test_bounded_and_stops(self):
+        produced = []
+        finished = threading.Event()
+
+        def source():
+            try:
+                for i in range(100):
+                    produced.append(i)
+                    yield i
+            finally:
+                finished.set()
+
+        results = utils.prefetch(source(), 2)
+        self.assertEqual(0, next(results))
+        results.close()
+
+        self.assertTrue(finished.wait(5))
+        # One item consumed, at most two buffered, one waiting to be put.
+        self.assertLessEqual(len(produced), 4)
+
+
+class TestDeleteConcurrently(testtools.TestCase):
+
+    def test_results(self):
+        error = ValueError("boom")
+
+        def delete(value):
+            if value == 1:
+                raise error
+            return "res%d" % value
+
+        result = utils.delete_concurrently(delete, iter([0, 1, 2]), 2)
+
+        self.assertEqual([utils.DeleteResult(0, "res0", None),
+                          utils.DeleteResult(1, None, error),
+                          utils.DeleteResult(2, "res2", None)], result)
+
+    def test_wait_for_delete(self):
+        error = ValueError("still there")
+        wait = mock.Mock(side_effect=[None, error])
+
+        result = utils.delete_concurrently(lambda value: value, ["a", "b"],
+                                           1, wait_for_delete=wait)
+
+        self.assertEqual([utils.DeleteResult("a", "a", None),
+                          utils.DeleteResult("b", "b", error)], result)
+        wait.assert_has_calls([mock.call("a"), mock.call("b")])
+
+    def test_empty(self):
+        self.assertEqual([], utils.delete_concurrently(mock.Mock(), [], 4))
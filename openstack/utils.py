@@ -10,7 +10,21 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import collections
+from concurrent import futures
 import logging
+import sys
+import threading
+
+import six
+from six.moves import queue
+
+
+# The outcome of deleting one of the values passed to delete_concurrently.
+# ``resource`` is the resource the delete was made for and ``exception``
+# is what went wrong, if anything.
+DeleteResult = collections.namedtuple("DeleteResult",
+                                      ["value", "resource", "exception"])
 
 
 def enable_logging(debug=False, path=None, stream=None):
@@ -68,3 +82,111 @@ def urljoin(*args):
     link. We generally won't care about that in client.
     """
     return '/'.join(str(a or '').strip('/') for a in args)
+
+
+def prefetch(iterable, size):
+    """A generator which consumes `iterable` in a background thread
+
+    Up to `size` items are buffered ahead of the caller. An exception
+    raised by `iterable` is re-raised to the caller once the items before
+    it have been yielded. The background thread stops when the caller
+    stops iterating.
+    """
+    buffer = queue.Queue(maxsize=size)
+    stopped = threading.Event()
+    end = object()
+
+    def put(item, exc_info=None):
+        while not stopped.is_set():
+            try:
+                buffer.put((item, exc_info), timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put(item):
+                    break
+            else:
+                put(end)
+        except Exception:
+            put(end, sys.exc_info())
+        finally:
+            # Let a generator clean up if the caller stopped early.
+            close = getattr(iterable, "close", None)
+            if close is not None:
+                close()
+
+    thread = threading.Thread(target=produce)
+    thread.daemon = True
+    thread.start()
+
+    try:
+        while True:
+            item, exc_info = buffer.get()
+            if item is end:
+                if exc_info is not None:
+                    six.reraise(*exc_info)
+                return
+            yield item
+    finally:
+        stopped.set()
+
+
+def map_concurrently(func, items, concurrency):
+    """Call func with each of the items on a pool of threads
+
+    :returns: A list of ``(result, exception)`` pairs in the same order
+              as ``items``, where ``exception`` is whatever the call for
+              that item raised, or ``None``.
+    """
+    def call(item):
+        try:
+            return func(item), None
+        except Exception as e:
+            return None, e
+
+    if not items:
+        return []
+
+    executor = futures.ThreadPoolExecutor(
+        max_workers=max(1, min(concurrency, len(items))))
+    try:
+        return list(executor.map(call, items))
+    finally:
+        executor.shutdown(wait=True)
+
+
+def delete_concurrently(delete, values, concurrency, wait_for_delete=None):
+    """Delete each of the values on a pool of threads
+
+    A failure to delete one value doesn't stop the others from being
+    deleted.
+
+    :param delete: Called with each of ``values`` to delete it, returning
+                   the resource that was deleted.
+    :param values: The values to delete.
+    :param int concurrency: The maximum number of calls in flight.
+    :param wait_for_delete: If given, it's called with each of the deleted
+                            resources, once all of the deletes have been
+                            made, to wait for it to be gone.
+
+    :returns: A list of :class:`DeleteResult`, one for each of ``values``
+              in the same order, holding the resource and the exception
+              that prevented it from being deleted, or ``None``.
+    """
+    values = list(values)
+    results = map_concurrently(delete, values, concurrency)
+
+    if wait_for_delete is not None:
+        deleted = [i for i, (res, exc) in enumerate(results) if exc is None]
+        waits = map_concurrently(lambda i: wait_for_delete(results[i][0]),
+                                 deleted, concurrency)
+        for i, (res, exc) in zip(deleted, waits):
+            results[i] = (results[i][0], exc)
+
+    return [DeleteResult(value, res, exc)
+            for value, (res, exc) in zip(values, results)]